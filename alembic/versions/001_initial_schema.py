@@ -5,7 +5,7 @@ Revises:
 Create Date: 2025-02-11 00:00:00.000000
 
 """
-from alembic import op
+from alembic import context, op
 
 # revision identifiers, used by Alembic.
 revision = '001'
@@ -13,38 +13,56 @@ down_revision = None
 branch_labels = None
 depends_on = None
 
-def upgrade() -> None:
-    # Build schema from SQLAlchemy metadata for initial revision.
-    from app.database import models
+_BASE = None
+
+def _base():
+    # Import the models lazily so commands that only load revision files
+    # (history, heads, current) don't pay for it, then keep the reference.
+    global _BASE
+    if _BASE is None:
+        from app.database.models import Base
+        _BASE = Base
+    return _BASE
 
+def upgrade() -> None:
+    # Build schema from SQLAlchemy metadata for initial revision. Shares the
+    # cached Base with downgrade() so a round-trip imports models once.
     bind = op.get_bind()
-    models.Base.metadata.create_all(bind=bind)
+    _base().metadata.create_all(bind=bind, checkfirst=True)
 
 def downgrade() -> None:
-    # Drop all tables in reverse order
-    op.drop_constraint('uq_field_season', 'field_seasons', type_='unique')
-    op.drop_constraint('uq_prediction_field_model', 'model_predictions', type_='unique')
-    op.drop_constraint('uq_variety_crop', 'varieties', type_='unique')
-    
-    op.drop_index('idx_model_predictions_field_season', table_name='model_predictions')
-    op.drop_index('idx_model_predictions_model', table_name='model_predictions')
-    op.drop_index('idx_management_events_field_season', table_name='management_events')
-    op.drop_index('idx_management_events_type', table_name='management_events')
-    op.drop_index('idx_fields_geo', table_name='fields')
-    op.drop_index('idx_fields_state_county', table_name='fields')
-    op.drop_index('idx_field_seasons_yield', table_name='field_seasons')
-    op.drop_index('idx_field_seasons_crop', table_name='field_seasons')
-    op.drop_index('idx_field_seasons_season', table_name='field_seasons')
-    op.drop_index('idx_field_seasons_field', table_name='field_seasons')
-    
-    op.drop_table('model_predictions')
-    op.drop_table('model_versions')
-    op.drop_table('training_runs')
-    op.drop_table('export_logs')
-    op.drop_table('data_ingestion_log')
-    op.drop_table('management_events')
-    op.drop_table('field_seasons')
-    op.drop_table('seasons')
-    op.drop_table('varieties')
-    op.drop_table('crops')
-    op.drop_table('fields')
+    # Disposable dev/test databases can opt into dropping the whole schema in
+    # one statement: `alembic -x fast_reset=1 downgrade base`.
+    if context.get_x_argument(as_dictionary=True).get('fast_reset') == '1':
+        op.execute("DROP SCHEMA IF EXISTS public CASCADE")
+        op.execute("CREATE SCHEMA public")
+        op.execute("GRANT ALL ON SCHEMA public TO public")
+        # The version table went with the schema, but Alembic still deletes
+        # this revision's row from it once we return; put both back.
+        migration_context = op.get_context()
+        if migration_context.version_table_schema in (None, 'public'):
+            version_table = migration_context.version_table
+            op.execute(
+                f"CREATE TABLE {version_table} (version_num VARCHAR(32) NOT NULL, "
+                f"CONSTRAINT {version_table}_pkc PRIMARY KEY (version_num))"
+            )
+            op.execute(f"INSERT INTO {version_table} (version_num) VALUES ('{revision}')")
+        return
+
+    # Drop everything the metadata knows about, children before parents.
+    # The table list comes from the metadata, so new models are covered
+    # without keeping a hand-written list in sync.
+    bind = op.get_bind()
+    metadata = _base().metadata
+    if bind.dialect.name == 'postgresql':
+        # One multi-target DROP takes each table lock and updates the catalog
+        # in a single statement; the tables' indexes and constraints go with
+        # them, so nothing needs dropping individually.
+        tables = ', '.join(
+            bind.dialect.identifier_preparer.format_table(table)
+            for table in reversed(metadata.sorted_tables)
+        )
+        op.execute(f"DROP TABLE IF EXISTS {tables} CASCADE")
+        return
+
+    metadata.drop_all(bind=bind, checkfirst=True)
@@ -0,0 +1,48 @@
+"""Covering indexes for backfill and export queries
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+# Databases created from 001 after these indexes joined the models already
+# have them, hence IF [NOT] EXISTS.
+_INDEXES = (
+    (
+        'idx_field_seasons_season_crop',
+        'field_seasons (season_id, crop_id, field_season_id)',
+    ),
+    (
+        'idx_model_predictions_model_field',
+        'model_predictions (model_version_id, field_season_id)',
+    ),
+    (
+        'idx_model_predictions_field_created',
+        'model_predictions (field_season_id, created_at)'
+        ' INCLUDE (predicted_yield, confidence_lower, confidence_upper, regional_avg_yield)',
+    ),
+)
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # CONCURRENTLY keeps the tables writable while the indexes build; it
+    # cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for name, target in _INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {target}")
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,39 @@
+"""Composite indexes for the field-season list filters
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+_INDEXES = (
+    (
+        'idx_field_seasons_season_crop_variety',
+        'field_seasons (season_id, crop_id, variety_id)',
+    ),
+    (
+        'idx_fields_state_county_acres',
+        'fields (state, county, acres)',
+    ),
+)
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        for name, target in _INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {target}")
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,66 @@
+"""Materialized view behind the overview endpoint
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+# One row; the constant id carries the unique index REFRESH ... CONCURRENTLY needs.
+_VIEW = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_overview_stats AS
+SELECT
+    1 AS id,
+    (SELECT count(*) FROM fields) AS total_fields,
+    (SELECT count(*) FROM field_seasons) AS total_field_seasons,
+    (SELECT coalesce(sum(acres), 0) FROM fields) AS total_acres,
+    (
+        SELECT coalesce(array_agg(season_year ORDER BY season_year DESC), '{}')
+        FROM (
+            SELECT DISTINCT s.season_year
+            FROM seasons s JOIN field_seasons fs ON fs.season_id = s.season_id
+        ) years
+    ) AS seasons_available,
+    (
+        SELECT coalesce(json_agg(json_build_object('crop_name', crop_name, 'count', n) ORDER BY n DESC), '[]')
+        FROM (
+            SELECT c.crop_name_en AS crop_name, count(fs.field_season_id) AS n
+            FROM crops c JOIN field_seasons fs ON fs.crop_id = c.crop_id
+            GROUP BY c.crop_name_en
+        ) crops
+    ) AS crops_available,
+    (
+        SELECT coalesce(array_agg(state ORDER BY state), '{}')
+        FROM (
+            SELECT DISTINCT f.state
+            FROM fields f JOIN field_seasons fs ON fs.field_id = f.field_id
+            WHERE f.state IS NOT NULL AND f.state <> ''
+        ) states
+    ) AS states_available,
+    y.yield_min,
+    y.yield_max,
+    y.yield_avg
+FROM (
+    SELECT min(yield_bu_ac) AS yield_min, max(yield_bu_ac) AS yield_max, avg(yield_bu_ac) AS yield_avg
+    FROM field_seasons
+    WHERE yield_bu_ac IS NOT NULL
+) y
+"""
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(_VIEW)
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_overview_stats_id ON mv_overview_stats (id)")
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_overview_stats")
@@ -0,0 +1,35 @@
+"""Prediction log table
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    # 001 builds the schema from the current models, so a fresh database
+    # already has the table by now.
+    if sa.inspect(op.get_bind()).has_table('prediction_logs'):
+        return
+    op.create_table(
+        'prediction_logs',
+        sa.Column('log_id', sa.BigInteger(), primary_key=True),
+        sa.Column('model_version_tag', sa.String(100), nullable=False),
+        sa.Column('crop', sa.String(120)),
+        sa.Column('variety', sa.String(200)),
+        sa.Column('season', sa.Integer()),
+        sa.Column('predicted_yield', sa.DECIMAL(8, 3)),
+        sa.Column('request_payload', sa.JSON()),
+        sa.Column('logged_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+def downgrade() -> None:
+    op.drop_table('prediction_logs')
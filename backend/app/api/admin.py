@@ -3,28 +3,38 @@ Admin panel router and control APIs.
 """
 from __future__ import annotations
 
+import asyncio
+import gzip
+import hashlib
+import hmac
+import time
 from datetime import datetime, timezone
-from threading import Lock
-from typing import Any, Dict, Optional
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, Literal, Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, status
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
+import orjson
+import pandas as pd
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import func, text
-from sqlalchemy.exc import IntegrityError
+import redis
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.config import settings
+from app.core.cache import MODELS_PREFIX, delete_pattern, delete_pattern_sync
 from app.database import crud, models
-from app.database.session import SessionLocal, get_db
-from app.ml.predictor import PredictionService
+from app.database.session import AdminJobSessionLocal, SessionLocal, get_db
+from app.ml.predictor import PredictionService, clear_production_model_cache
 from app.ml.trainer import ModelTrainer
 from app.services.ui_config import (
     add_dropdown_option,
     delete_custom_field,
     get_form_config,
-    load_ui_config,
+    get_ui_config,
     remove_dropdown_option,
     upsert_custom_field,
 )
@@ -33,11 +43,13 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 
 
 class AdminSchema(BaseModel):
-    model_config = ConfigDict(protected_namespaces=())
+    # Lax mode and ignored extras keep admin payloads on pydantic-core's
+    # fast path: no strict-type fallbacks and no extra-field bookkeeping.
+    model_config = ConfigDict(protected_namespaces=(), extra="ignore", strict=False)
 
 
 class TrainJobRequest(AdminSchema):
-    model_type: str = Field(default="lightgbm", pattern="^(lightgbm|xgboost|random_forest)$")
+    model_type: Literal["lightgbm", "xgboost", "random_forest"] = "lightgbm"
     start_season: int = Field(default=2018, ge=1900, le=2100)
     end_season: int = Field(default=2024, ge=1900, le=2100)
     test_size: float = Field(default=0.2, ge=0.1, le=0.5)
@@ -54,16 +66,16 @@ class BackfillJobRequest(AdminSchema):
 
 
 class UiDropdownOptionRequest(AdminSchema):
-    form_key: str = Field(pattern="^(manual_entry|prediction)$")
+    form_key: Literal["manual_entry", "prediction"]
     field_key: str = Field(min_length=1)
     option: str = Field(min_length=1)
 
 
 class UiCustomFieldRequest(AdminSchema):
-    form_key: str = Field(pattern="^(manual_entry|prediction)$")
+    form_key: Literal["manual_entry", "prediction"]
     field_key: str = Field(min_length=1)
     label: str = Field(min_length=1)
-    type: str = Field(default="text", pattern="^(text|number|select|boolean)$")
+    type: Literal["text", "number", "select", "boolean"] = "text"
     required: bool = False
     payload_key: Optional[str] = None
     help_text: Optional[str] = None
@@ -72,12 +84,46 @@ class UiCustomFieldRequest(AdminSchema):
 
 
 class UiCustomFieldDeleteRequest(AdminSchema):
-    form_key: str = Field(pattern="^(manual_entry|prediction)$")
+    form_key: Literal["manual_entry", "prediction"]
     field_key: str = Field(min_length=1)
 
 
-_JOBS: Dict[str, Dict[str, Any]] = {}
-_JOBS_LOCK = Lock()
+# With the redis store (implied by the celery backend), job state lives in
+# Redis, one hash per job plus a created_at index, so every API worker and
+# celery worker sees the same jobs.
+_JOB_KEY_PREFIX = "admin:job:"
+_JOB_INDEX_KEY = "admin:jobs"
+_JOB_TTL_SECONDS = 7 * 24 * 60 * 60
+_JOB_LIST_LIMIT = 200
+_JOB_REDIS = (
+    redis.Redis.from_url(settings.redis_url)
+    if settings.admin_job_store == "redis" or settings.admin_job_backend == "celery"
+    else None
+)
+# Partial job update that only touches a job hash that still exists, so a
+# late write for an expired or unknown job can't leave a TTL-less orphan.
+# KEYS[1] = job hash, ARGV[1] = TTL seconds, ARGV[2:] = field/value pairs.
+_JOB_UPDATE_SCRIPT = (
+    _JOB_REDIS.register_script(
+        """
+        if redis.call('EXISTS', KEYS[1]) == 0 then
+            return 0
+        end
+        redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+        redis.call('EXPIRE', KEYS[1], ARGV[1])
+        return 1
+        """
+    )
+    if _JOB_REDIS is not None
+    else None
+)
+
+# Admin jobs live in lock-striped shards so progress writes from background
+# jobs and polling reads only contend when they hit the same shard.
+_JOB_SHARD_COUNT = 16
+_JOB_SHARDS: list[tuple[Lock, Dict[str, Dict[str, Any]]]] = [
+    (Lock(), {}) for _ in range(_JOB_SHARD_COUNT)
+]
 
 
 ADMIN_HTML = """
@@ -473,6 +519,8 @@ ADMIN_HTML = """
     const state = {
       adminKey: localStorage.getItem("traitharvest_admin_key") || localStorage.getItem("nutrition_admin_key") || "",
       polling: null,
+      events: null,
+      refreshTimer: null,
     };
 
     const $ = (id) => document.getElementById(id);
@@ -503,17 +551,15 @@ ADMIN_HTML = """
       return `<span class=\"status ${status}\">${status}</span>`;
     }
 
-    async function loadSystem() {
-      const data = await fetchJSON("/admin/api/system-status");
+    function renderSystem(data) {
       $("kpiFieldSeasons").textContent = (data.overview.total_field_seasons || 0).toLocaleString();
       $("kpiPredictions").textContent = (data.overview.prediction_stats.total_predictions || 0).toLocaleString();
       $("kpiModels").textContent = (data.model_count || 0).toLocaleString();
       $("kpiProduction").textContent = data.production_model || "none";
     }
 
-    async function loadModels() {
-      const data = await fetchJSON("/admin/api/models");
-      const rows = data.models.map((m) => {
+    function renderModels(models) {
+      const rows = models.map((m) => {
         const metrics = m.performance_metrics || {};
         const valR2 = metrics.val_r2 ?? metrics.r2 ?? "-";
         const valRmse = metrics.val_rmse ?? metrics.rmse ?? "-";
@@ -534,9 +580,8 @@ ADMIN_HTML = """
       $("modelsBody").innerHTML = rows || '<tr><td colspan=\"7\" class=\"muted\">No models yet</td></tr>';
     }
 
-    async function loadJobs() {
-      const data = await fetchJSON("/admin/api/jobs");
-      const rows = data.jobs.map((j) => {
+    function renderJobs(jobs) {
+      const rows = jobs.map((j) => {
         const progress = j.total > 0 ? `${j.processed}/${j.total}` : (j.message || "-");
         return `<tr>
           <td><code>${j.job_id}</code></td>
@@ -550,9 +595,8 @@ ADMIN_HTML = """
       $("jobsBody").innerHTML = rows || '<tr><td colspan=\"6\" class=\"muted\">No admin jobs yet</td></tr>';
     }
 
-    async function loadIngestionLogs() {
-      const data = await fetchJSON("/admin/api/ingestion-logs?limit=25");
-      const rows = data.logs.map((l) => `
+    function renderIngestionLogs(logs) {
+      const rows = logs.map((l) => `
         <tr>
           <td>${l.ingestion_id}</td>
           <td>${l.source_filename}</td>
@@ -566,14 +610,18 @@ ADMIN_HTML = """
       $("ingestionBody").innerHTML = rows || '<tr><td colspan=\"7\" class=\"muted\">No ingestion records</td></tr>';
     }
 
-    async function loadUiConfig() {
-      const data = await fetchJSON("/admin/api/ui-config");
-      $("uiConfigView").textContent = JSON.stringify(data.config, null, 2);
+    function renderUiConfig(config) {
+      $("uiConfigView").textContent = JSON.stringify(config, null, 2);
     }
 
     async function refreshAll() {
       try {
-        await Promise.all([loadSystem(), loadModels(), loadJobs(), loadIngestionLogs(), loadUiConfig()]);
+        const data = await fetchJSON("/admin/api/dashboard?logs_limit=25");
+        renderSystem(data.system);
+        renderModels(data.models);
+        renderJobs(data.jobs);
+        renderIngestionLogs(data.logs);
+        renderUiConfig(data.config);
         log("Dashboard refreshed");
       } catch (e) {
         log(`Refresh failed: ${e.message}`);
@@ -712,6 +760,7 @@ ADMIN_HTML = """
       state.adminKey = $("adminKey").value.trim();
       localStorage.setItem("traitharvest_admin_key", state.adminKey);
       log("Admin key saved in browser localStorage");
+      subscribeEvents();
     }
 
     function setup() {
@@ -730,7 +779,44 @@ ADMIN_HTML = """
         : "Admin key optional (not configured server-side)";
 
       refreshAll();
-      state.polling = setInterval(refreshAll, 12000);
+      subscribeEvents();
+      // Slow safety net for changes made outside the admin API (CSV uploads,
+      // other workers); job and config changes arrive over the event stream.
+      state.polling = setInterval(refreshAll, 60000);
+    }
+
+    function scheduleRefresh() {
+      // Progress events can arrive in bursts; coalesce them into one refresh.
+      if (state.refreshTimer) return;
+      state.refreshTimer = setTimeout(() => {
+        state.refreshTimer = null;
+        refreshAll();
+      }, 1000);
+    }
+
+    async function subscribeEvents() {
+      if (state.events) state.events.close();
+      state.events = null;
+      // EventSource can't send X-Admin-Key, so trade it for a short-lived
+      // stream token instead of putting the key itself in the URL.
+      let token;
+      try {
+        ({ token } = await fetchJSON("/admin/api/events/token", { method: "POST" }));
+      } catch (err) {
+        log(`Live updates unavailable: ${err.message}`);
+        setTimeout(subscribeEvents, 30000);
+        return;
+      }
+      const events = new EventSource(`/admin/api/events?token=${encodeURIComponent(token)}`);
+      events.onmessage = () => scheduleRefresh();
+      events.onerror = () => {
+        // Reconnects reuse the URL, whose token may have expired; once the
+        // browser gives up, start over with a fresh token.
+        if (events.readyState === EventSource.CLOSED && state.events === events) {
+          setTimeout(subscribeEvents, 5000);
+        }
+      };
+      state.events = events;
     }
 
     window.setProduction = setProduction;
@@ -741,17 +827,235 @@ ADMIN_HTML = """
 """
 
 
-def _require_admin_key(x_admin_key: Optional[str] = Header(default=None, alias="X-Admin-Key")) -> None:
-    expected = settings.admin_api_key
+# The admin page only varies with whether a key is configured, which is fixed
+# for the life of the process, so render, compress and fingerprint it once.
+_ADMIN_HTML_BYTES = ADMIN_HTML.replace(
+    "__ADMIN_KEY_REQUIRED__", "true" if bool(settings.admin_api_key) else "false"
+).encode("utf-8")
+_ADMIN_HTML_GZ = gzip.compress(_ADMIN_HTML_BYTES, 9)
+_ADMIN_HTML_ETAG = f'"{hashlib.blake2b(_ADMIN_HTML_BYTES, digest_size=8).hexdigest()}"'
+
+
+_ADMIN_KEY_BYTES = settings.admin_api_key.encode("utf-8") if settings.admin_api_key else None
+
+
+def _check_admin_key(provided: Optional[str]) -> None:
+    expected = _ADMIN_KEY_BYTES
     if not expected:
         return
-    if x_admin_key != expected:
+    if not hmac.compare_digest((provided or "").encode("utf-8"), expected):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or missing X-Admin-Key",
         )
 
 
+def _require_admin_key(x_admin_key: Optional[str] = Header(default=None, alias="X-Admin-Key")) -> None:
+    _check_admin_key(x_admin_key)
+
+
+# /api/events tokens: "<expires_at>.<nonce>.<hmac>", signed with the admin
+# key so any API worker can check them without shared state. They only open
+# the event stream, and only briefly, so they are safe in a URL.
+_EVENT_TOKEN_TTL_SECONDS = 60
+
+
+def _event_token_signature(expires_at: str, nonce: str) -> str:
+    message = f"admin-events:{expires_at}:{nonce}".encode("utf-8")
+    return hmac.new(_ADMIN_KEY_BYTES or b"", message, hashlib.sha256).hexdigest()
+
+
+def _issue_event_token() -> str:
+    expires_at = str(int(time.time()) + _EVENT_TOKEN_TTL_SECONDS)
+    nonce = uuid4().hex
+    return f"{expires_at}.{nonce}.{_event_token_signature(expires_at, nonce)}"
+
+
+def _check_event_token(token: Optional[str]) -> None:
+    if not _ADMIN_KEY_BYTES:
+        return
+    parts = (token or "").split(".")
+    valid = (
+        len(parts) == 3
+        and parts[0].isdigit()
+        and int(parts[0]) >= time.time()
+        and hmac.compare_digest(parts[2].encode("utf-8"), _event_token_signature(parts[0], parts[1]).encode("utf-8"))
+    )
+    if not valid:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired event stream token",
+        )
+
+
+# Connected /api/events streams. Publishers run on background-job threads as
+# well as the event loop, so each subscriber is fed via its own loop.
+_EVENT_SUBSCRIBERS: set[tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = set()
+_EVENT_LOCK = Lock()
+# With Redis configured, events go through this channel so that job updates
+# made in a celery worker (or another API worker) reach every process's
+# streams; each API process relays it from one listener thread.
+_EVENT_CHANNEL = "admin:events"
+_EVENT_LISTENER: Optional[Thread] = None
+
+
+def _offer_event(queue: asyncio.Queue, payload: str) -> None:
+    try:
+        queue.put_nowait(payload)
+    except asyncio.QueueFull:
+        # A slow client only needs to know *something* changed.
+        pass
+
+
+def _publish_event(kind: str) -> None:
+    _READ_FLIGHTS.clear()
+    payload = orjson.dumps({"type": kind}).decode("utf-8")
+    if _JOB_REDIS is not None:
+        try:
+            _JOB_REDIS.publish(_EVENT_CHANNEL, payload)
+            return
+        except redis.RedisError:
+            # Best effort: at least this process's streams hear about it.
+            pass
+    _fan_out_event(payload)
+
+
+def _fan_out_event(payload: str) -> None:
+    with _EVENT_LOCK:
+        subscribers = list(_EVENT_SUBSCRIBERS)
+    for loop, queue in subscribers:
+        try:
+            loop.call_soon_threadsafe(_offer_event, queue, payload)
+        except RuntimeError:
+            # Loop already closed; the stream's cleanup will drop it.
+            pass
+
+
+def _relay_redis_events() -> None:
+    while True:
+        try:
+            pubsub = _JOB_REDIS.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(_EVENT_CHANNEL)
+            for message in pubsub.listen():
+                # Published from another process, which only cleared its own flights.
+                _READ_FLIGHTS.clear()
+                _fan_out_event(message["data"].decode("utf-8"))
+        except redis.RedisError:
+            time.sleep(1.0)
+
+
+def _ensure_event_listener() -> None:
+    """Start the Redis relay the first time this process serves a stream."""
+    global _EVENT_LISTENER
+    if _JOB_REDIS is None:
+        return
+    with _EVENT_LOCK:
+        if _EVENT_LISTENER is None:
+            _EVENT_LISTENER = Thread(target=_relay_redis_events, name="admin-events", daemon=True)
+            _EVENT_LISTENER.start()
+
+
+class _SingleFlight:
+    """Share one threadpool computation per key between concurrent callers.
+
+    A finished result keeps being handed out for ``ttl`` seconds, so admin
+    tabs polling in lockstep cost one set of queries per burst. Entries are
+    only touched from the event loop, with no await between lookup and
+    insert, so no lock is needed.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._flights: Dict[tuple, tuple[float, asyncio.Future]] = {}
+
+    async def do(self, key: tuple, fn: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        entry = self._flights.get(key)
+        if entry is not None:
+            started_at, future = entry
+            stale = future.done() and (future.exception() is not None or now - started_at >= self._ttl)
+            if not stale:
+                return await asyncio.shield(future)
+        future = asyncio.ensure_future(run_in_threadpool(fn))
+        self._flights[key] = (now, future)
+        return await asyncio.shield(future)
+
+    def clear(self) -> None:
+        # Called from job threads too; dict.clear() is atomic under the GIL.
+        self._flights.clear()
+
+
+# Admin read endpoints coalesce through here; any published event drops the
+# shared results so the refetch it triggers sees fresh data.
+_READ_FLIGHTS = _SingleFlight(ttl=2.0)
+# Limits are clamped before they become part of a flight key, so the set of
+# keys (and of distinct queries) stays small.
+_READ_LIMIT_MAX = 200
+
+
+def _read_limit(limit: int) -> int:
+    return min(max(limit, 1), _READ_LIMIT_MAX)
+
+
+def _in_own_session(fn: Callable[[Session], Any]) -> Callable[[], Any]:
+    """Flight body with its own session: the request that starts a flight
+    may finish (and close its session) while followers still wait on it."""
+
+    def run() -> Any:
+        with SessionLocal() as db:
+            return fn(db)
+
+    return run
+
+
+# Serialized admin UI config. The service hands out a new config object
+# whenever the file changes, so the bytes are re-encoded only then.
+_UI_CFG_CACHE: Dict[str, Any] = {"source": None, "bytes": None}
+_UI_CFG_LOCK = Lock()
+
+
+def _ui_cfg_changed() -> None:
+    _publish_event("ui_config")
+
+
+def _ui_config_bytes() -> bytes:
+    config = get_ui_config()
+    with _UI_CFG_LOCK:
+        if _UI_CFG_CACHE["source"] is not config:
+            _UI_CFG_CACHE["source"] = config
+            _UI_CFG_CACHE["bytes"] = orjson.dumps(config)
+        return _UI_CFG_CACHE["bytes"]
+
+
+# The overview aggregates scan the fact tables, which is far too heavy to
+# repeat on every dashboard poll. Serve them from a short TTL cache that
+# the training/backfill jobs also clear when they finish.
+_OVERVIEW_TTL_SECONDS = 60.0
+_OVERVIEW_CACHE: Dict[str, Any] = {"expires_at": 0.0, "value": None}
+_OVERVIEW_LOCK = Lock()
+
+
+def _cached_overview_counts(db: Session) -> tuple[Dict[str, Any], int]:
+    with _OVERVIEW_LOCK:
+        if _OVERVIEW_CACHE["value"] is not None and _OVERVIEW_CACHE["expires_at"] > time.monotonic():
+            return _OVERVIEW_CACHE["value"]
+
+    overview = crud.get_overview_stats(db)
+    model_count = db.query(func.count(models.ModelVersion.model_version_id)).scalar() or 0
+    with _OVERVIEW_LOCK:
+        _OVERVIEW_CACHE["value"] = (overview, model_count)
+        _OVERVIEW_CACHE["expires_at"] = time.monotonic() + _OVERVIEW_TTL_SECONDS
+    return overview, model_count
+
+
+def _invalidate_overview_counts() -> None:
+    with _OVERVIEW_LOCK:
+        _OVERVIEW_CACHE["expires_at"] = 0.0
+    # The public /fields/overview and /models responses are cached too.
+    delete_pattern_sync()
+    delete_pattern_sync(MODELS_PREFIX + ":*")
+
+
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -781,17 +1085,107 @@ def _create_job(job_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         "completed_at": None,
         "created_at": _utc_now(),
     }
-    with _JOBS_LOCK:
-        _JOBS[job_id] = job
+    if _JOB_REDIS is not None:
+        pipe = _JOB_REDIS.pipeline()
+        pipe.hset(_JOB_KEY_PREFIX + job_id, mapping=_encode_job_fields(job))
+        pipe.expire(_JOB_KEY_PREFIX + job_id, _JOB_TTL_SECONDS)
+        pipe.zadd(_JOB_INDEX_KEY, {job_id: job["created_at"].timestamp()})
+        pipe.execute()
+        _publish_event("jobs")
+        return job
+
+    # Jobs are read on every dashboard poll but written only on progress and
+    # state changes, so keep the serialized form up to date on write.
+    job["_serialized"] = _serialize_job(job)
+    lock, jobs = _job_shard(job_id)
+    with lock:
+        jobs[job_id] = job
+    _publish_event("jobs")
     return job
 
 
+def _job_json_default(value: Any) -> Any:
+    # Trainer results and metrics can carry numpy/pandas scalars that
+    # OPT_SERIALIZE_NUMPY doesn't cover.
+    if hasattr(value, "item"):
+        return value.item()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _encode_job_fields(fields: Dict[str, Any]) -> Dict[str, bytes]:
+    return {
+        key: orjson.dumps(value, default=_job_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+        for key, value in fields.items()
+    }
+
+
+def _decode_job(raw: Dict[bytes, bytes]) -> Optional[Dict[str, Any]]:
+    if not raw:
+        return None
+    job = {key.decode("utf-8"): orjson.loads(value) for key, value in raw.items()}
+    job["_serialized"] = _serialize_job(job)
+    return job
+
+
+def _dispatch_job(background_tasks: BackgroundTasks, job_type: str, job_id: str, payload: Dict[str, Any]) -> None:
+    if settings.admin_job_backend == "celery":
+        from app.worker import celery_app
+
+        celery_app.send_task(f"admin.{job_type}", args=[job_id, payload])
+        return
+    runner = _run_training_job if job_type == "train_model" else _run_backfill_job
+    background_tasks.add_task(runner, job_id, payload)
+
+
+def _job_shard(job_id: str) -> tuple[Lock, Dict[str, Dict[str, Any]]]:
+    return _JOB_SHARDS[hash(job_id) % _JOB_SHARD_COUNT]
+
+
+def _get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    if _JOB_REDIS is not None:
+        return _decode_job(_JOB_REDIS.hgetall(_JOB_KEY_PREFIX + job_id))
+    lock, jobs = _job_shard(job_id)
+    with lock:
+        return jobs.get(job_id)
+
+
+def _snapshot_jobs() -> list[Dict[str, Any]]:
+    if _JOB_REDIS is not None:
+        job_ids = _JOB_REDIS.zrevrange(_JOB_INDEX_KEY, 0, _JOB_LIST_LIMIT - 1)
+        pipe = _JOB_REDIS.pipeline()
+        for job_id in job_ids:
+            pipe.hgetall(_JOB_KEY_PREFIX + job_id.decode("utf-8"))
+        decoded = (_decode_job(raw) for raw in pipe.execute())
+        return [job for job in decoded if job is not None]
+
+    snapshot: list[Dict[str, Any]] = []
+    for lock, jobs in _JOB_SHARDS:
+        with lock:
+            snapshot.extend(jobs.values())
+    return snapshot
+
+
 def _update_job(job_id: str, **updates: Any) -> None:
-    with _JOBS_LOCK:
-        job = _JOBS.get(job_id)
+    if _JOB_REDIS is not None:
+        # Only the job's own runner writes to it, so a partial HSET is safe.
+        # Refresh the expiry in the same round trip so long jobs don't lapse.
+        args: list[Any] = [_JOB_TTL_SECONDS]
+        for key, value in _encode_job_fields(updates).items():
+            args.extend((key, value))
+        if _JOB_UPDATE_SCRIPT(keys=[_JOB_KEY_PREFIX + job_id], args=args):
+            _publish_event("jobs")
+        return
+
+    lock, jobs = _job_shard(job_id)
+    with lock:
+        job = jobs.get(job_id)
         if not job:
             return
         job.update(updates)
+        job["_serialized"] = _serialize_job(job)
+    _publish_event("jobs")
 
 
 def _serialize_job(job: Dict[str, Any]) -> Dict[str, Any]:
@@ -804,213 +1198,280 @@ def _serialize_job(job: Dict[str, Any]) -> Dict[str, Any]:
         "total": job.get("total", 0),
         "result": job.get("result"),
         "error": job.get("error"),
-        "created_at": _as_iso(job.get("created_at")),
-        "started_at": _as_iso(job.get("started_at")),
-        "completed_at": _as_iso(job.get("completed_at")),
+        "created_at": job.get("created_at"),
+        "started_at": job.get("started_at"),
+        "completed_at": job.get("completed_at"),
     }
 
 
-def _run_training_job(job_id: str, payload: Dict[str, Any]) -> None:
-    db: Session = SessionLocal()
-    try:
-        _update_job(job_id, status="running", started_at=_utc_now(), message="preparing data")
-        trainer = ModelTrainer(db)
-        result = trainer.train(
-            model_type=payload["model_type"],
-            start_season=payload["start_season"],
-            end_season=payload["end_season"],
-            test_size=payload["test_size"],
-            random_state=payload["random_seed"],
-        )
-
-        set_production = payload.get("set_production", True)
-        production_switched = False
-        if set_production:
-            mv = (
-                db.query(models.ModelVersion)
-                .filter(models.ModelVersion.version_tag == result["version_tag"])
-                .first()
-            )
-            if mv:
-                crud.set_production_model(db, mv.model_version_id)
-                production_switched = True
-
-        _update_job(
-            job_id,
-            status="completed",
-            completed_at=_utc_now(),
-            message="completed",
-            result={
-                **result,
-                "set_production": production_switched,
-            },
+_BACKFILL_COLUMNS = [
+    "field_season_id",
+    "acres",
+    "lat",
+    "long",
+    "county",
+    "state",
+    "crop",
+    "variety",
+    "season",
+    "totalN_per_ac",
+    "totalP_per_ac",
+    "totalK_per_ac",
+]
+_BACKFILL_NUMERIC_COLUMNS = ["acres", "lat", "long", "totalN_per_ac", "totalP_per_ac", "totalK_per_ac"]
+
+
+def _backfill_inputs(rows: list) -> pd.DataFrame:
+    """Build predictor inputs for a batch of backfill rows in one frame."""
+    # Rows are handed over as-is; from_records reads them column-wise.
+    # Numerics stay float64 to match the dtypes the models were trained on.
+    df = pd.DataFrame.from_records(rows, columns=_BACKFILL_COLUMNS)
+    df[_BACKFILL_NUMERIC_COLUMNS] = df[_BACKFILL_NUMERIC_COLUMNS].astype("float64").fillna(0.0)
+    return df.drop(columns=["field_season_id"])
+
+
+def _hydrate_backfill_rows(db: Session, field_season_ids: list[int]) -> list:
+    """Fetch the predictor columns for a batch of field seasons, in ID order."""
+    return (
+        db.query(
+            models.FieldSeason.field_season_id,
+            models.Field.acres,
+            models.Field.lat,
+            models.Field.long,
+            models.Field.county,
+            models.Field.state,
+            models.Crop.crop_name_en,
+            models.Variety.variety_name_en,
+            models.Season.season_year,
+            models.FieldSeason.totalN_per_ac,
+            models.FieldSeason.totalP_per_ac,
+            models.FieldSeason.totalK_per_ac,
         )
-    except Exception as exc:
-        db.rollback()
-        _update_job(
-            job_id,
-            status="failed",
-            completed_at=_utc_now(),
-            message="failed",
-            error=str(exc),
-        )
-    finally:
-        db.close()
+        .join(models.Field, models.FieldSeason.field_id == models.Field.field_id)
+        .join(models.Crop, models.FieldSeason.crop_id == models.Crop.crop_id)
+        .outerjoin(models.Variety, models.FieldSeason.variety_id == models.Variety.variety_id)
+        .join(models.Season, models.FieldSeason.season_id == models.Season.season_id)
+        .filter(models.FieldSeason.field_season_id.in_(field_season_ids))
+        .order_by(models.FieldSeason.field_season_id.asc())
+        .all()
+    )
 
 
-def _run_backfill_job(job_id: str, payload: Dict[str, Any]) -> None:
-    db: Session = SessionLocal()
-    try:
-        _update_job(job_id, status="running", started_at=_utc_now(), message="resolving production model")
-        predictor = PredictionService(db)
-        model_version = predictor.get_production_model()
-        if not model_version:
-            raise ValueError("No production model available. Train and deploy a model first.")
-
-        subq = (
-            db.query(models.ModelPrediction.field_season_id)
-            .filter(models.ModelPrediction.model_version_id == model_version.model_version_id)
-            .subquery()
-        )
-
-        query = (
-            db.query(
-                models.FieldSeason.field_season_id,
-                models.Field.acres,
-                models.Field.lat,
-                models.Field.long,
-                models.Field.county,
-                models.Field.state,
-                models.Crop.crop_name_en,
-                models.Variety.variety_name_en,
-                models.Season.season_year,
-                models.FieldSeason.totalN_per_ac,
-                models.FieldSeason.totalP_per_ac,
-                models.FieldSeason.totalK_per_ac,
+def _run_training_job(job_id: str, payload: Dict[str, Any]) -> None:
+    with AdminJobSessionLocal() as db:
+        try:
+            # trusted: round-tripped from our own _create_job, already validated
+            request = TrainJobRequest.model_construct(**payload)
+            _update_job(job_id, status="running", started_at=_utc_now(), message="preparing data")
+            trainer = ModelTrainer(db)
+            result = trainer.train(
+                model_type=request.model_type,
+                start_season=request.start_season,
+                end_season=request.end_season,
+                test_size=request.test_size,
+                random_state=request.random_seed,
             )
-            .join(models.Field, models.FieldSeason.field_id == models.Field.field_id)
-            .join(models.Crop, models.FieldSeason.crop_id == models.Crop.crop_id)
-            .outerjoin(models.Variety, models.FieldSeason.variety_id == models.Variety.variety_id)
-            .join(models.Season, models.FieldSeason.season_id == models.Season.season_id)
-            .outerjoin(subq, models.FieldSeason.field_season_id == subq.c.field_season_id)
-            .filter(subq.c.field_season_id.is_(None))
-        )
-
-        total = query.count()
-        _update_job(job_id, total=total, message=f"found {total} records")
 
-        if total == 0:
+            set_production = request.set_production
+            production_switched = False
+            if set_production:
+                mv = (
+                    db.query(models.ModelVersion)
+                    .filter(models.ModelVersion.version_tag == result["version_tag"])
+                    .first()
+                )
+                if mv:
+                    crud.set_production_model(db, mv.model_version_id)
+                    clear_production_model_cache()
+                    production_switched = True
+
+            _invalidate_overview_counts()
             _update_job(
                 job_id,
                 status="completed",
                 completed_at=_utc_now(),
-                message="no records need backfill",
-                result={"processed": 0, "failed": 0, "model_version": model_version.version_tag},
+                message="completed",
+                result={
+                    **result,
+                    "set_production": production_switched,
+                },
             )
-            return
-
-        batch_size = payload["batch_size"]
-        processed = 0
-        failed = 0
-        last_field_season_id = -1
-
-        while True:
-            rows = (
-                query
-                .filter(models.FieldSeason.field_season_id > last_field_season_id)
-                .order_by(models.FieldSeason.field_season_id.asc())
-                .limit(batch_size)
-                .all()
+        except Exception as exc:
+            db.rollback()
+            _update_job(
+                job_id,
+                status="failed",
+                completed_at=_utc_now(),
+                message="failed",
+                error=str(exc),
             )
-            if not rows:
-                break
 
-            for row in rows:
+
+_PROGRESS_INTERVAL_SECONDS = 0.5
+
+
+def _run_backfill_job(job_id: str, payload: Dict[str, Any]) -> None:
+    with AdminJobSessionLocal() as db:
+        try:
+            _update_job(job_id, status="running", started_at=_utc_now(), message="resolving production model")
+            predictor = PredictionService(db)
+            model_version = predictor.get_production_model()
+            if not model_version:
+                raise ValueError("No production model available. Train and deploy a model first.")
+
+            # trusted: round-tripped from our own _create_job, already validated
+            batch_size = BackfillJobRequest.model_construct(**payload).batch_size
+
+            _update_job(job_id, message="finding records")
+
+            total = 0
+            processed = 0
+            failed = 0
+            last_progress_at = 0.0
+
+            def flush_batch(batch_ids: list[int]) -> None:
+                nonlocal processed, failed, last_progress_at
+                batch_rows = _hydrate_backfill_rows(db, batch_ids)
+                inputs = _backfill_inputs(batch_rows)
                 try:
-                    input_data = {
-                        "acres": float(row.acres) if row.acres is not None else 0.0,
-                        "lat": float(row.lat) if row.lat is not None else 0.0,
-                        "long": float(row.long) if row.long is not None else 0.0,
-                        "county": row.county,
-                        "state": row.state,
-                        "crop": row.crop_name_en,
-                        "variety": row.variety_name_en,
-                        "season": row.season_year,
-                        "totalN_per_ac": float(row.totalN_per_ac) if row.totalN_per_ac is not None else 0.0,
-                        "totalP_per_ac": float(row.totalP_per_ac) if row.totalP_per_ac is not None else 0.0,
-                        "totalK_per_ac": float(row.totalK_per_ac) if row.totalK_per_ac is not None else 0.0,
-                    }
-                    prediction = predictor.predict(input_data, model_version=model_version)
-
-                    with db.begin_nested():
-                        db.add(
-                            models.ModelPrediction(
-                                field_season_id=row.field_season_id,
-                                model_version_id=model_version.model_version_id,
-                                predicted_yield=prediction["predicted_yield"],
-                                confidence_lower=prediction["confidence_lower"],
-                                confidence_upper=prediction["confidence_upper"],
-                            )
-                        )
-                        db.flush()
-                    processed += 1
-                except IntegrityError:
-                    failed += 1
+                    preds = predictor.predict_batch(inputs, model_version=model_version)
+                    outputs = zip(
+                        preds["predicted_yield"],
+                        preds["confidence_lower"],
+                        preds["confidence_upper"],
+                    )
                 except Exception:
-                    failed += 1
-
-            db.commit()
-            last_field_season_id = rows[-1].field_season_id
+                    # Fall back to one call per row so a single bad record only
+                    # fails itself rather than the whole batch.
+                    outputs = []
+                    for record in inputs.to_dict(orient="records"):
+                        try:
+                            prediction = predictor.predict(record, model_version=model_version)
+                            outputs.append((
+                                prediction["predicted_yield"],
+                                prediction["confidence_lower"],
+                                prediction["confidence_upper"],
+                            ))
+                        except Exception:
+                            outputs.append(None)
+
+                values = [
+                    {
+                        "field_season_id": row[0],
+                        "model_version_id": model_version.model_version_id,
+                        "predicted_yield": float(output[0]),
+                        "confidence_lower": float(output[1]),
+                        "confidence_upper": float(output[2]),
+                    }
+                    for row, output in zip(batch_rows, outputs)
+                    if output is not None
+                ]
+                failed += len(batch_ids) - len(values)
+                if values:
+                    # One multi-row INSERT per batch; rows that already have a
+                    # prediction for this model are skipped and counted as failed.
+                    result = db.execute(
+                        pg_insert(models.ModelPrediction)
+                        .values(values)
+                        .on_conflict_do_nothing(index_elements=["field_season_id", "model_version_id"])
+                    )
+                    processed += result.rowcount
+                    failed += len(values) - result.rowcount
+
+                db.commit()
+                # Small batches can finish many times a second; each update is
+                # a Redis write and an SSE push, so cap the progress rate.
+                now = time.monotonic()
+                if now - last_progress_at >= _PROGRESS_INTERVAL_SECONDS:
+                    last_progress_at = now
+                    _update_job(
+                        job_id,
+                        processed=processed + failed,
+                        message=f"processed {processed + failed}/{total}",
+                    )
+
+            # Only IDs are paged through the anti-join; the wide feature columns
+            # are fetched per batch for the IDs that actually need them. Failed
+            # rows stay unpredicted, so paging is keyed on the last ID seen.
+            after_id: Optional[int] = None
+            while True:
+                page = crud.get_backfill_candidates(
+                    db,
+                    model_version.model_version_id,
+                    after_id=after_id,
+                    limit=batch_size,
+                    with_total=after_id is None,
+                )
+                if not page:
+                    break
+                if after_id is None:
+                    # The first page carries the remaining-row count, so the
+                    # progress total costs no separate COUNT query.
+                    total = page[0].remaining
+                    _update_job(job_id, total=total, message=f"found {total} records")
+                batch_ids = [row.field_season_id for row in page]
+                after_id = batch_ids[-1]
+                flush_batch(batch_ids)
+
+            if processed + failed == 0:
+                _update_job(
+                    job_id,
+                    status="completed",
+                    completed_at=_utc_now(),
+                    message="no records need backfill",
+                    result={"processed": 0, "failed": 0, "model_version": model_version.version_tag},
+                )
+                return
+
+            _invalidate_overview_counts()
             _update_job(
                 job_id,
+                status="completed",
+                completed_at=_utc_now(),
+                message="completed",
                 processed=processed + failed,
-                message=f"processed {processed + failed} / {total}",
+                total=processed + failed,
+                result={
+                    "processed": processed,
+                    "failed": failed,
+                    "total": processed + failed,
+                    "model_version": model_version.version_tag,
+                },
+            )
+        except Exception as exc:
+            db.rollback()
+            _update_job(
+                job_id,
+                status="failed",
+                completed_at=_utc_now(),
+                message="failed",
+                error=str(exc),
             )
-
-        _update_job(
-            job_id,
-            status="completed",
-            completed_at=_utc_now(),
-            message="completed",
-            result={
-                "processed": processed,
-                "failed": failed,
-                "total": total,
-                "model_version": model_version.version_tag,
-            },
-        )
-    except Exception as exc:
-        db.rollback()
-        _update_job(
-            job_id,
-            status="failed",
-            completed_at=_utc_now(),
-            message="failed",
-            error=str(exc),
-        )
-    finally:
-        db.close()
 
 
 @router.get("", response_class=HTMLResponse)
-async def admin_panel() -> HTMLResponse:
-    html = ADMIN_HTML.replace("__ADMIN_KEY_REQUIRED__", "true" if bool(settings.admin_api_key) else "false")
-    return HTMLResponse(content=html)
+async def admin_panel(request: Request) -> Response:
+    headers = {
+        "ETag": _ADMIN_HTML_ETAG,
+        "Cache-Control": "private, max-age=60",
+        "Vary": "Accept-Encoding",
+    }
+    if request.headers.get("if-none-match") == _ADMIN_HTML_ETAG:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=_ADMIN_HTML_GZ, media_type="text/html", headers=headers)
+    return Response(content=_ADMIN_HTML_BYTES, media_type="text/html", headers=headers)
 
 
-@router.get("/api/system-status")
-async def admin_system_status(
-    db: Session = Depends(get_db),
-    _: None = Depends(_require_admin_key),
-) -> Dict[str, Any]:
+def _system_status_payload(db: Session) -> Dict[str, Any]:
     try:
         db.execute(text("SELECT 1"))
         db_status = "healthy"
     except Exception as exc:
         db_status = f"unhealthy: {exc}"
 
-    overview = crud.get_overview_stats(db)
-    model_count = db.query(func.count(models.ModelVersion.model_version_id)).scalar() or 0
+    overview, model_count = _cached_overview_counts(db)
     production = crud.get_production_model_version(db)
 
     return {
@@ -1024,27 +1485,104 @@ async def admin_system_status(
     }
 
 
+def _models_payload(db: Session, limit: int) -> list[Dict[str, Any]]:
+    # Plain column rows: the payload never touches relationships, so there is
+    # no point hydrating ModelVersion objects just to copy seven fields.
+    rows = db.execute(
+        select(
+            models.ModelVersion.model_version_id,
+            models.ModelVersion.version_tag,
+            models.ModelVersion.model_type,
+            models.ModelVersion.is_production,
+            models.ModelVersion.training_date,
+            models.ModelVersion.performance_metrics,
+            models.ModelVersion.training_data_range,
+        )
+        .order_by(models.ModelVersion.training_date.desc())
+        .limit(limit)
+    ).mappings()
+    return [
+        {
+            **row,
+            "is_production": bool(row["is_production"]),
+            "training_date": _as_iso(row["training_date"]),
+        }
+        for row in rows
+    ]
+
+
+def _ingestion_logs_payload(db: Session, limit: int) -> list[Dict[str, Any]]:
+    rows = db.execute(
+        select(
+            models.DataIngestionLog.ingestion_id,
+            models.DataIngestionLog.source_filename,
+            models.DataIngestionLog.status,
+            models.DataIngestionLog.records_parsed,
+            models.DataIngestionLog.records_inserted,
+            models.DataIngestionLog.records_updated,
+            models.DataIngestionLog.records_skipped,
+            models.DataIngestionLog.ingestion_started_at,
+            models.DataIngestionLog.ingestion_completed_at,
+        )
+        .order_by(models.DataIngestionLog.ingestion_started_at.desc())
+        .limit(limit)
+    ).mappings()
+    return [
+        {
+            **row,
+            "ingestion_started_at": _as_iso(row["ingestion_started_at"]),
+            "ingestion_completed_at": _as_iso(row["ingestion_completed_at"]),
+        }
+        for row in rows
+    ]
+
+
+def _jobs_payload() -> list[Dict[str, Any]]:
+    jobs = sorted(_snapshot_jobs(), key=lambda j: j["created_at"], reverse=True)
+    return [job["_serialized"] for job in jobs]
+
+
+@router.get("/api/dashboard")
+async def admin_dashboard(
+    models_limit: int = 50,
+    logs_limit: int = 25,
+    _: None = Depends(_require_admin_key),
+) -> Response:
+    """Everything the admin dashboard polls for, in one request and one session."""
+    models_limit = _read_limit(models_limit)
+    logs_limit = _read_limit(logs_limit)
+
+    def build(db: Session) -> bytes:
+        return orjson.dumps({
+            "system": _system_status_payload(db),
+            "models": _models_payload(db, models_limit),
+            "jobs": _jobs_payload(),
+            "logs": _ingestion_logs_payload(db, logs_limit),
+            # Already-serialized cached bytes are embedded without re-encoding.
+            "config": orjson.Fragment(_ui_config_bytes()),
+        })
+
+    body = await _READ_FLIGHTS.do(("dashboard", models_limit, logs_limit), _in_own_session(build))
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/api/system-status")
+async def admin_system_status(
+    _: None = Depends(_require_admin_key),
+) -> Dict[str, Any]:
+    return await _READ_FLIGHTS.do(("system-status",), _in_own_session(_system_status_payload))
+
+
 @router.get("/api/models")
 async def admin_models(
     limit: int = 50,
-    db: Session = Depends(get_db),
     _: None = Depends(_require_admin_key),
 ) -> Dict[str, Any]:
-    models_list = crud.get_model_versions(db, limit=limit)
-    return {
-        "models": [
-            {
-                "model_version_id": m.model_version_id,
-                "version_tag": m.version_tag,
-                "model_type": m.model_type,
-                "is_production": bool(m.is_production),
-                "training_date": _as_iso(m.training_date),
-                "performance_metrics": m.performance_metrics,
-                "training_data_range": m.training_data_range,
-            }
-            for m in models_list
-        ]
-    }
+    limit = _read_limit(limit)
+    models_list = await _READ_FLIGHTS.do(
+        ("models", limit), _in_own_session(lambda db: _models_payload(db, limit))
+    )
+    return {"models": models_list}
 
 
 @router.post("/api/models/train")
@@ -1056,8 +1594,9 @@ async def admin_train_model(
     if request.end_season < request.start_season:
         raise HTTPException(status_code=400, detail="end_season must be >= start_season")
 
-    job = _create_job("train_model", request.model_dump())
-    background_tasks.add_task(_run_training_job, job["job_id"], request.model_dump())
+    payload = request.model_dump()
+    job = _create_job("train_model", payload)
+    _dispatch_job(background_tasks, "train_model", job["job_id"], payload)
     return {"status": "queued", "job_id": job["job_id"]}
 
 
@@ -1070,6 +1609,10 @@ async def admin_set_production(
     mv = crud.set_production_model(db, request.version_id)
     if not mv:
         raise HTTPException(status_code=404, detail=f"Model version {request.version_id} not found")
+    clear_production_model_cache()
+    await delete_pattern()
+    await delete_pattern(MODELS_PREFIX + ":*")
+    _publish_event("models")
     return {
         "status": "success",
         "model_version_id": mv.model_version_id,
@@ -1083,56 +1626,38 @@ async def admin_backfill_predictions(
     background_tasks: BackgroundTasks,
     _: None = Depends(_require_admin_key),
 ) -> Dict[str, Any]:
-    job = _create_job("backfill_predictions", request.model_dump())
-    background_tasks.add_task(_run_backfill_job, job["job_id"], request.model_dump())
+    payload = request.model_dump()
+    job = _create_job("backfill_predictions", payload)
+    _dispatch_job(background_tasks, "backfill_predictions", job["job_id"], payload)
     return {"status": "queued", "job_id": job["job_id"]}
 
 
 @router.get("/api/ingestion-logs")
 async def admin_ingestion_logs(
     limit: int = 20,
-    db: Session = Depends(get_db),
     _: None = Depends(_require_admin_key),
 ) -> Dict[str, Any]:
-    logs = (
-        db.query(models.DataIngestionLog)
-        .order_by(models.DataIngestionLog.ingestion_started_at.desc())
-        .limit(limit)
-        .all()
+    limit = _read_limit(limit)
+    logs = await _READ_FLIGHTS.do(
+        ("ingestion-logs", limit), _in_own_session(lambda db: _ingestion_logs_payload(db, limit))
     )
-    return {
-        "logs": [
-            {
-                "ingestion_id": log.ingestion_id,
-                "source_filename": log.source_filename,
-                "status": log.status,
-                "records_parsed": log.records_parsed,
-                "records_inserted": log.records_inserted,
-                "records_updated": log.records_updated,
-                "records_skipped": log.records_skipped,
-                "ingestion_started_at": _as_iso(log.ingestion_started_at),
-                "ingestion_completed_at": _as_iso(log.ingestion_completed_at),
-            }
-            for log in logs
-        ]
-    }
+    return {"logs": logs}
 
 
 @router.get("/api/ui-config")
 async def admin_ui_config(
     _: None = Depends(_require_admin_key),
-) -> Dict[str, Any]:
-    return {"config": load_ui_config()}
+) -> ORJSONResponse:
+    return ORJSONResponse({"config": orjson.Fragment(_ui_config_bytes())})
 
 
 @router.get("/api/ui-config/public")
 async def admin_ui_config_public(
     form_key: Optional[str] = None,
 ) -> Dict[str, Any]:
-    config = load_ui_config()
     if form_key:
         return {"form_key": form_key, "config": get_form_config(form_key)}
-    return {"config": config}
+    return {"config": get_ui_config()}
 
 
 @router.post("/api/ui-config/dropdown-option/add")
@@ -1141,6 +1666,7 @@ async def admin_add_dropdown_option(
     _: None = Depends(_require_admin_key),
 ) -> Dict[str, Any]:
     config = add_dropdown_option(request.form_key, request.field_key, request.option)
+    _ui_cfg_changed()
     return {"status": "success", "config": config}
 
 
@@ -1150,6 +1676,7 @@ async def admin_remove_dropdown_option(
     _: None = Depends(_require_admin_key),
 ) -> Dict[str, Any]:
     config = remove_dropdown_option(request.form_key, request.field_key, request.option)
+    _ui_cfg_changed()
     return {"status": "success", "config": config}
 
 
@@ -1159,6 +1686,7 @@ async def admin_upsert_custom_field(
     _: None = Depends(_require_admin_key),
 ) -> Dict[str, Any]:
     config = upsert_custom_field(request.form_key, request.model_dump())
+    _ui_cfg_changed()
     return {"status": "success", "config": config}
 
 
@@ -1168,16 +1696,65 @@ async def admin_delete_custom_field(
     _: None = Depends(_require_admin_key),
 ) -> Dict[str, Any]:
     config = delete_custom_field(request.form_key, request.field_key)
+    _ui_cfg_changed()
     return {"status": "success", "config": config}
 
 
+@router.post("/api/events/token")
+async def admin_events_token(
+    _: None = Depends(_require_admin_key),
+) -> Dict[str, Any]:
+    return {"token": _issue_event_token(), "expires_in": _EVENT_TOKEN_TTL_SECONDS}
+
+
+@router.get("/api/events")
+async def admin_events(
+    request: Request,
+    token: Optional[str] = Query(default=None),
+    x_admin_key: Optional[str] = Header(default=None, alias="X-Admin-Key"),
+) -> StreamingResponse:
+    # EventSource can't set headers, so browsers send a token from
+    # /api/events/token; other clients may use X-Admin-Key directly.
+    if x_admin_key is not None:
+        _check_admin_key(x_admin_key)
+    else:
+        _check_event_token(token)
+    _ensure_event_listener()
+
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=100)
+    subscriber = (loop, queue)
+
+    async def stream():
+        with _EVENT_LOCK:
+            _EVENT_SUBSCRIBERS.add(subscriber)
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"data: {payload}\n\n"
+        finally:
+            with _EVENT_LOCK:
+                _EVENT_SUBSCRIBERS.discard(subscriber)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        # identity keeps GZipMiddleware away: it buffers streamed bodies in
+        # its GzipFile without flushing, so frames would never reach the browser.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "Content-Encoding": "identity"},
+    )
+
+
 @router.get("/api/jobs")
 async def admin_jobs(
     _: None = Depends(_require_admin_key),
 ) -> Dict[str, Any]:
-    with _JOBS_LOCK:
-        jobs = sorted(_JOBS.values(), key=lambda j: j["created_at"], reverse=True)
-    return {"jobs": [_serialize_job(job) for job in jobs]}
+    return {"jobs": _jobs_payload()}
 
 
 @router.get("/api/jobs/{job_id}")
@@ -1185,8 +1762,7 @@ async def admin_job_detail(
     job_id: str,
     _: None = Depends(_require_admin_key),
 ) -> Dict[str, Any]:
-    with _JOBS_LOCK:
-        job = _JOBS.get(job_id)
+    job = _get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    return _serialize_job(job)
+    return job["_serialized"]
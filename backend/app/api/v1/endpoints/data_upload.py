@@ -1,24 +1,29 @@
 """
 Data Upload endpoints - CSV file ingestion
 """
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 import tempfile
 import os
 from typing import Optional
 
+from app.core.cache import delete_pattern
 from app.database.session import get_db
 from app.services.data_ingestion import DataIngestionService
 from app.services.data_ingestionV2 import DataIngestionServiceV2
-from app.database import models
+from app.database import crud, models
 from app.database.models import DataIngestionLog
 
 router = APIRouter()
 
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
 
 @router.post("/upload", summary="Upload CSV file for data ingestion")
 async def upload_csv(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="CSV file to import"),
     source_filename: Optional[str] = Form(None, description="Optional source filename for tracking"),
     ingestion_version: str = Form(
@@ -46,8 +51,9 @@ async def upload_csv(
     # Save uploaded file to temporary location
     try:
         with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
+            # Copy in 1 MiB chunks so large uploads never sit in memory whole.
+            while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+                tmp_file.write(chunk)
             tmp_path = tmp_file.name
     except Exception as e:
         raise HTTPException(
@@ -68,13 +74,18 @@ async def upload_csv(
                 detail="Invalid ingestion_version. Use 'v1' or 'v2'.",
             )
 
-        result = service.ingest_csv(
+        # Ingestion is synchronous and can take a while; run it off the event
+        # loop so this worker keeps serving other requests meanwhile.
+        result = await run_in_threadpool(
+            service.ingest_csv,
             csv_path=tmp_path,
             source_filename=source_filename or file.filename
         )
 
         # Clean up temp file
         os.unlink(tmp_path)
+        await delete_pattern()
+        background_tasks.add_task(crud.refresh_overview_stats)
 
         return result
 
@@ -94,7 +105,7 @@ async def upload_csv(
 
 
 @router.get("/ingestion/logs", summary="List data ingestion logs")
-async def get_ingestion_logs(
+def get_ingestion_logs(
     limit: int = 20,
     db: Session = Depends(get_db)
 ):
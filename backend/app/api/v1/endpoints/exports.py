@@ -1,13 +1,15 @@
 """
 Export endpoints - CSV downloads, field summaries
 """
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional, List
+from datetime import datetime, timezone
 import io
 import csv
 import json
+import zlib
 
 from app.database.session import get_db
 from app.database import crud
@@ -15,9 +17,69 @@ from app.database.schemas import ExportRequest
 
 router = APIRouter()
 
+_EXPORT_HEADERS = [
+    "field_season_id",
+    "field_number",
+    "acres",
+    "crop",
+    "variety",
+    "season",
+    "state",
+    "county",
+    "lat",
+    "long",
+    "yield_bu_ac",
+    "predicted_yield",
+    "confidence_lower",
+    "confidence_upper",
+    "regional_avg_yield",
+    "totalN_per_ac",
+    "totalP_per_ac",
+    "totalK_per_ac",
+    "management_event_count",
+]
+# DECIMAL columns, written as floats ("12.5" rather than "12.50").
+_EXPORT_FLOAT_INDEXES = tuple(
+    i for i, name in enumerate(_EXPORT_HEADERS)
+    if name in {
+        "acres", "lat", "long", "yield_bu_ac",
+        "predicted_yield", "confidence_lower", "confidence_upper", "regional_avg_yield",
+        "totalN_per_ac", "totalP_per_ac", "totalK_per_ac",
+    }
+)
+_EXPORT_FLUSH_ROWS = 1000
+
+
+def _export_csv_row(row) -> list:
+    """CSV cells for one crud.stream_export_rows row (already in header order).
+
+    csv.writer writes None as an empty cell, so only the Decimals need touching.
+    """
+    cells = list(row)
+    for i in _EXPORT_FLOAT_INDEXES:
+        value = cells[i]
+        if value is not None:
+            cells[i] = float(value)
+    return cells
+
+
+def _gzip_chunks(chunks):
+    """Gzip a stream of text chunks on the fly.
+
+    Level 1: CSV still shrinks several-fold and the CPU cost stays well
+    below the query time.
+    """
+    compressor = zlib.compressobj(1, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
 
 @router.get("/csv", summary="Export filtered data as CSV")
-async def export_csv(
+def export_csv(
+    request: Request,
     db: Session = Depends(get_db),
     crop: Optional[str] = Query(None),
     variety: Optional[str] = Query(None),
@@ -36,11 +98,10 @@ async def export_csv(
     Same filters as `/api/v1/fields/` endpoint.
     Returns a downloadable CSV file.
     """
-    # Get all matching records (no pagination for export)
-    field_seasons = crud.get_field_seasons(
+    # Stream matching records (no pagination for export)
+    export_rows = crud.stream_export_rows(
         db=db,
-        skip=0,
-        limit=100000,  # Large limit, but we'll handle big exports carefully
+        chunk_size=1000,
         crop=crop,
         variety=variety,
         season=season,
@@ -53,77 +114,47 @@ async def export_csv(
         max_yield=max_yield,
     )
 
-    # Build CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header
-    headers = [
-        "field_season_id",
-        "field_number",
-        "acres",
-        "crop",
-        "variety",
-        "season",
-        "state",
-        "county",
-        "lat",
-        "long",
-        "yield_bu_ac",
-        "predicted_yield",
-        "confidence_lower",
-        "confidence_upper",
-        "regional_avg_yield",
-        "totalN_per_ac",
-        "totalP_per_ac",
-        "totalK_per_ac",
-        "management_event_count",
-    ]
-    writer.writerow(headers)
-
-    # Rows
-    for fs in field_seasons:
-        # Get latest prediction if exists
-        latest_pred = None
-        if fs.predictions:
-            latest_pred = sorted(fs.predictions, key=lambda x: x.created_at, reverse=True)[0]
+    def iter_csv():
+        # Rows are encoded through a small reusable buffer and sent every
+        # _EXPORT_FLUSH_ROWS rows, so memory stays flat regardless of export size.
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
 
-        row = [
-            fs.field_season_id,
-            fs.field.field_number if fs.field else "",
-            float(fs.field.acres) if fs.field and fs.field.acres else "",
-            fs.crop.crop_name_en if fs.crop else "",
-            fs.variety.variety_name_en if fs.variety else "",
-            fs.season.season_year if fs.season else "",
-            fs.field.state if fs.field else "",
-            fs.field.county if fs.field else "",
-            float(fs.field.lat) if fs.field and fs.field.lat else "",
-            float(fs.field.long) if fs.field and fs.field.long else "",
-            float(fs.yield_bu_ac) if fs.yield_bu_ac else "",
-            float(latest_pred.predicted_yield) if latest_pred else "",
-            float(latest_pred.confidence_lower) if latest_pred else "",
-            float(latest_pred.confidence_upper) if latest_pred else "",
-            float(latest_pred.regional_avg_yield) if latest_pred and latest_pred.regional_avg_yield else "",
-            float(fs.totalN_per_ac) if fs.totalN_per_ac else "",
-            float(fs.totalP_per_ac) if fs.totalP_per_ac else "",
-            float(fs.totalK_per_ac) if fs.totalK_per_ac else "",
-            len(fs.management_events) if fs.management_events else 0,
-        ]
-        writer.writerow(row)
+        def drain() -> str:
+            value = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            return value
 
-    output.seek(0)
+        writer.writerow(_EXPORT_HEADERS)
+        pending = 0
+        for row in export_rows:
+            writer.writerow(_export_csv_row(row))
+            pending += 1
+            if pending >= _EXPORT_FLUSH_ROWS:
+                yield drain()
+                pending = 0
+        yield drain()
 
     # Create response
     filename = f"traitharvest_export_{crop or 'all'}_{state or 'all'}.csv"
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "Vary": "Accept-Encoding",
+    }
+    body = iter_csv()
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        body = _gzip_chunks(body)
     return StreamingResponse(
-        output,
+        body,
         media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
+        headers=headers
     )
 
 
 @router.get("/field/{field_season_id}/summary", summary="Export single field-season summary")
-async def export_field_summary(
+def export_field_summary(
     field_season_id: int,
     format: str = Query("json", description="Export format: json or csv", pattern="^(json|csv)$"),
     db: Session = Depends(get_db),
@@ -145,6 +176,10 @@ async def export_field_summary(
             detail=f"Field-season {field_season_id} not found"
         )
 
+    # Newest first; shared by the JSON listing and the CSV "latest" columns.
+    predictions = sorted(fs.predictions, key=lambda x: x.created_at, reverse=True)
+    latest_pred = predictions[0] if predictions else None
+
     # Build summary
     summary = {
         "field_season_id": fs.field_season_id,
@@ -189,7 +224,7 @@ async def export_field_summary(
                 "water_applied_mm": float(ev.water_applied_mm) if ev.water_applied_mm else None,
                 "irrigation_method": ev.irrigation_method,
             }
-            for ev in sorted(fs.management_events, key=lambda x: x.start_date or x.created_at)
+            for ev in fs.management_events
         ],
         "predictions": [
             {
@@ -199,14 +234,14 @@ async def export_field_summary(
                 "model_version": p.model_version.version_tag if p.model_version else None,
                 "created_at": p.created_at.isoformat(),
             }
-            for p in sorted(fs.predictions, key=lambda x: x.created_at, reverse=True)
+            for p in predictions
         ],
         "data_quality": {
             "data_quality_score": float(fs.data_quality_score) if fs.data_quality_score else None,
             "missing_data_flags": fs.missing_data_flags,
             "record_source": fs.record_source,
         },
-        "generated_at": "2025-02-11T00:00:00Z",  # TODO: use datetime.utcnow()
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
     }
 
     if format.lower() == "json":
@@ -238,10 +273,6 @@ async def export_field_summary(
         "regional_avg",
     ])
 
-    latest_pred = None
-    if fs.predictions:
-        latest_pred = sorted(fs.predictions, key=lambda x: x.created_at, reverse=True)[0]
-
     writer.writerow([
         fs.field_season_id,
         fs.field.field_number if fs.field else "",
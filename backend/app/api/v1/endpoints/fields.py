@@ -7,6 +7,8 @@ from sqlalchemy import text
 from typing import List, Optional
 import math
 
+from app.core.cache import cached
+from app.core.responses import PydanticResponse
 from app.database.session import get_db
 from app.database import crud
 from app.database.schemas import (
@@ -33,7 +35,8 @@ def _safe_float(value):
 
 
 @router.get("/overview", response_model=OverviewResponse, summary="Dashboard overview")
-async def get_overview(
+@cached(response_model=OverviewResponse)
+def get_overview(
     db: Session = Depends(get_db),
     # Case-insensitive substring filter on ModelVersion.model_type for
     # prediction stats only (counts/min/max/avg/coverage). Other top-level
@@ -67,7 +70,7 @@ async def get_overview(
 
 
 @router.get("", response_model=PaginatedResponse, summary="List field-season records")
-async def list_field_seasons(
+def list_field_seasons(
     db: Session = Depends(get_db),
     # Filters
     crop: Optional[str] = Query(None, description="Crop name (partial match)"),
@@ -86,6 +89,9 @@ async def list_field_seasons(
     # Pagination
     page: int = Query(1, ge=1),
     limit: int = Query(50, ge=1, le=500),
+    # Keyset alternative to `page` for scrolling deep into the list: pass the
+    # previous response's next_cursor. `page` is then only echoed back.
+    cursor: Optional[int] = Query(None, description="next_cursor from the previous page; overrides page"),
 ):
     """
     Get paginated list of field-season records with filtering.
@@ -114,21 +120,10 @@ async def list_field_seasons(
 
     skip = (page - 1) * limit
 
-    # Get total count for pagination
-    total = crud.count_field_seasons(
-        db=db,
-        crop=crop,
-        variety=variety,
-        season=season,
-        state=state,
-        county=county,
-        min_acres=min_acres,
-        max_acres=max_acres,
-        has_prediction=has_prediction,
-    )
-
-    # Get data
-    field_seasons = crud.get_field_seasons(
+    # The page, plus a (cached) count for the total. Items come back as
+    # plain dicts in response shape. When model_id is set, only predictions from that
+    # model count, so the UI's model toggle shows per-model predicted yields.
+    data, total = crud.list_and_count_field_seasons(
         db=db,
         skip=skip,
         limit=limit,
@@ -142,69 +137,23 @@ async def list_field_seasons(
         has_prediction=has_prediction,
         min_yield=min_yield,
         max_yield=max_yield,
+        model_version_id=model_id,
+        cursor=cursor,
     )
 
-    # Build response items with essential info
-    data = []
-    for fs in field_seasons:
-        item = {
-            "field_season_id": fs.field_season_id,
-            "field_number": fs.field.field_number if fs.field else None,
-            "acres": _safe_float(fs.field.acres) if fs.field else None,
-            "crop": fs.crop.crop_name_en if fs.crop else None,
-            "variety": fs.variety.variety_name_en if fs.variety else None,
-            "season": fs.season.season_year if fs.season else None,
-            "state": fs.field.state if fs.field else None,
-            "county": fs.field.county if fs.field else None,
-            "lat": _safe_float(fs.field.lat) if fs.field else None,
-            "long": _safe_float(fs.field.long) if fs.field else None,
-            "yield_bu_ac": _safe_float(fs.yield_bu_ac),
-            "totalN_per_ac": _safe_float(fs.totalN_per_ac),
-            "totalP_per_ac": _safe_float(fs.totalP_per_ac),
-            "totalK_per_ac": _safe_float(fs.totalK_per_ac),
-        }
-
-        # Add prediction if available. When model_id is set, only consider
-        # predictions from that model so the toggle in the UI returns
-        # per-model predicted yields. When omitted, fall back to the latest
-        # prediction across any model (existing behavior).
-        candidate_preds = fs.predictions or []
-        if model_id is not None:
-            candidate_preds = [p for p in candidate_preds if p.model_version_id == model_id]
-
-        if candidate_preds:
-            latest_pred = sorted(
-                candidate_preds, key=lambda x: x.created_at, reverse=True
-            )[0]
-            pred_yield = _safe_float(latest_pred.predicted_yield)
-            conf_low = _safe_float(latest_pred.confidence_lower)
-            conf_high = _safe_float(latest_pred.confidence_upper)
-            item["predicted_yield"] = pred_yield
-            item["confidence_interval"] = [conf_low, conf_high] if conf_low is not None and conf_high is not None else None
-            item["regional_avg_yield"] = _safe_float(latest_pred.regional_avg_yield)
-            item["prediction_model_version_id"] = latest_pred.model_version_id
-        else:
-            item["predicted_yield"] = None
-            item["confidence_interval"] = None
-            item["regional_avg_yield"] = None
-            item["prediction_model_version_id"] = None
-
-        # Management event count
-        item["management_event_count"] = len(fs.management_events) if fs.management_events else 0
-
-        data.append(item)
-
-    return {
-        "data": data,
-        "total": total,
-        "page": page,
-        "limit": limit,
-        "pages": math.ceil(total / limit) if total > 0 else 0,
-    }
+    # Items are already plain JSON values, so skip validating them again.
+    return PydanticResponse(PaginatedResponse.model_construct(
+        data=data,
+        total=total,
+        page=page,
+        limit=limit,
+        pages=math.ceil(total / limit) if total > 0 else 0,
+        next_cursor=data[-1]["field_season_id"] if len(data) == limit else None,
+    ))
 
 
 @router.get("/{field_season_id:int}", response_model=FieldSeasonDetailResponse, summary="Get field-season details")
-async def get_field_season_detail(
+def get_field_season_detail(
     field_season_id: int,
     db: Session = Depends(get_db),
 ):
@@ -228,7 +177,9 @@ async def get_field_season_detail(
             detail=f"Field-season with id {field_season_id} not found"
         )
 
-    # Helper that converts a Decimal/None to a float without choking on null.
+    # Decimal/None to float for the free-form nested dicts (events,
+    # predictions). Fields the response model types as float are passed
+    # through as-is: validation converts them in Pydantic's core.
     def _f(value):
         if value is None:
             return None
@@ -284,26 +235,26 @@ async def get_field_season_detail(
             ).mappings().first()
             if row:
                 for c in present_cols:
-                    optional_values[c] = _f(row.get(c))
+                    optional_values[c] = row.get(c)
     except Exception:
         # Probe failure should not break the endpoint — the response just
         # carries nulls for all optional fields and the drawer hides the
         # N-source panel.
         pass
 
-    # Build response (every numeric/datetime field passes through _f / _iso so
-    # NULL values in the DB don't blow up the response builder).
+    # Build response. Nested event/prediction dicts are untyped, so their
+    # numbers and datetimes go through _f / _iso.
     response = {
         "field_season_id": fs.field_season_id,
         "field_id": fs.field_id,
         "crop_id": fs.crop_id,
         "variety_id": fs.variety_id,
         "season_id": fs.season_id,
-        "yield_bu_ac": _f(fs.yield_bu_ac),
-        "yield_target": _f(fs.yield_target),
-        "totalN_per_ac": _f(fs.totalN_per_ac),
-        "totalP_per_ac": _f(fs.totalP_per_ac),
-        "totalK_per_ac": _f(fs.totalK_per_ac),
+        "yield_bu_ac": fs.yield_bu_ac,
+        "yield_target": fs.yield_target,
+        "totalN_per_ac": fs.totalN_per_ac,
+        "totalP_per_ac": fs.totalP_per_ac,
+        "totalK_per_ac": fs.totalK_per_ac,
         # Aggregated season-level irrigation total + N-source breakdown.
         # Values come from the information_schema probe above; columns
         # missing in this deployment are returned as null and the drawer
@@ -317,7 +268,7 @@ async def get_field_season_detail(
         "monoammonium_phosphate_lbN_per_ac": optional_values["monoammonium_phosphate_lbN_per_ac"],
         "diammonium_phosphate_lbN_per_ac": optional_values["diammonium_phosphate_lbN_per_ac"],
         "record_source": fs.record_source,
-        "data_quality_score": _f(fs.data_quality_score),
+        "data_quality_score": fs.data_quality_score,
         "missing_data_flags": fs.missing_data_flags,
         # Some FieldSeason rows don't carry a created_at column at all
         # (legacy schema). getattr keeps this resilient instead of throwing
@@ -327,9 +278,9 @@ async def get_field_season_detail(
         "field": {
             "field_id": fs.field.field_id,
             "field_number": fs.field.field_number,
-            "acres": _f(fs.field.acres),
-            "lat": _f(fs.field.lat),
-            "long": _f(fs.field.long),
+            "acres": fs.field.acres,
+            "lat": fs.field.lat,
+            "long": fs.field.long,
             "county": fs.field.county,
             "state": fs.field.state,
             "grower_id": fs.field.grower_id,
@@ -374,13 +325,8 @@ async def get_field_season_detail(
                 "machine_make1": ev.machine_make1,
                 "machine_model1": ev.machine_model1,
             }
-            # Some rows have neither start_date nor created_at — fall back to
-            # event_id so the sort key never returns None and the comparison
-            # doesn't blow up on mixed types.
-            for ev in sorted(
-                fs.management_events,
-                key=lambda x: x.start_date or x.created_at or 0
-            )
+            # Already in timeline order (see FieldSeason.management_events).
+            for ev in fs.management_events
         ],
         "predictions": [
             {
@@ -401,11 +347,14 @@ async def get_field_season_detail(
         ],
     }
 
-    return response
+    # Validated as before (it shapes the nested objects), but serialized by
+    # Pydantic directly instead of through jsonable_encoder.
+    return PydanticResponse(FieldSeasonDetailResponse.model_validate(response))
 
 
 @router.get("/crops/", summary="List all crops")
-async def list_crops(
+@cached()
+def list_crops(
     db: Session = Depends(get_db),
     active_only: bool = Query(True, description="Only return active crops"),
     # When True (the default), only crops that have at least one field_season
@@ -443,7 +392,8 @@ async def list_crops(
 
 
 @router.get("/varieties/", summary="List varieties")
-async def list_varieties(
+@cached()
+def list_varieties(
     db: Session = Depends(get_db),
     crop: Optional[str] = Query(None, description="Filter by crop name"),
     active_only: bool = Query(True, description="Only return active varieties"),
@@ -473,12 +423,15 @@ async def list_varieties(
     if active_only:
         query = query.filter(models.Variety.is_active == True)
     if crop:
-        crop_obj = crud.get_crop_by_name(db, crop)
-        if not crop_obj:
-            raise HTTPException(status_code=404, detail=f"Crop '{crop}' not found")
-        query = query.filter(models.Variety.crop_id == crop_obj.crop_id)
+        # Same case-insensitive match as crud.get_crop_by_name, in the same query.
+        query = query.join(
+            models.Crop, models.Variety.crop_id == models.Crop.crop_id
+        ).filter(models.Crop.crop_name_en.ilike(crop))
 
     varieties = query.all()
+    # An empty list is only a 404 when the crop itself doesn't exist.
+    if crop and not varieties and not crud.get_crop_by_name(db, crop):
+        raise HTTPException(status_code=404, detail=f"Crop '{crop}' not found")
     return [
         {
             "variety_id": v.variety_id,
@@ -491,7 +444,8 @@ async def list_varieties(
 
 
 @router.get("/seasons/", summary="List seasons")
-async def list_seasons(
+@cached()
+def list_seasons(
     db: Session = Depends(get_db),
 ):
     """
@@ -506,7 +460,7 @@ async def list_seasons(
 
 
 @router.get("/states/", summary="List states")
-async def list_states(
+def list_states(
     db: Session = Depends(get_db),
 ):
     """
@@ -526,7 +480,7 @@ async def list_states(
 
 
 @router.get("/yield-extremes/", summary="Records behind the min and max observed yield")
-async def yield_extremes(
+def yield_extremes(
     db: Session = Depends(get_db),
 ):
     """
@@ -570,7 +524,7 @@ async def yield_extremes(
 
 
 @router.get("/states/stats/", summary="Per-state aggregates (count, acres, avg yield, varieties)")
-async def state_stats(
+def state_stats(
     db: Session = Depends(get_db),
 ):
     """
@@ -654,7 +608,7 @@ async def state_stats(
 
 
 @router.get("/counties/", summary="List counties")
-async def list_counties(
+def list_counties(
     db: Session = Depends(get_db),
     state: Optional[str] = Query(None, description="Optional state filter"),
 ):
@@ -1,21 +1,22 @@
 """
 Health check endpoint
 """
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.database.session import get_db
+from datetime import datetime
+
+from fastapi import APIRouter
+from app.database.session import ping_database
 
 router = APIRouter()
 
 
 @router.get("", summary="Health check")
-async def health_check(db: Session = Depends(get_db)):
+def health_check():
     """
     Check API and database health.
     """
     try:
         # Test database connection
-        db.execute("SELECT 1")
+        ping_database()
         db_status = "healthy"
     except Exception as e:
         db_status = f"unhealthy: {str(e)}"
@@ -23,5 +24,5 @@ async def health_check(db: Session = Depends(get_db)):
     return {
         "status": "ok" if db_status == "healthy" else "degraded",
         "database": db_status,
-        "timestamp": "now",  # TODO: use datetime.utcnow()
+        "timestamp": datetime.utcnow().isoformat(),
     }
\ No newline at end of file
@@ -1,13 +1,17 @@
 """
 Manual Data Entry endpoints - Form-based data submission
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from typing import Optional, Dict, Any
 from datetime import datetime
 import json
 from uuid import uuid4
+from app.core.cache import delete_pattern_sync
+from app.database import crud
 from app.database.session import get_db
 from app.database import models
 from app.database.schemas import (
@@ -19,9 +23,30 @@ from app.services.ui_config import get_form_config
 router = APIRouter()
 
 
+def _get_or_create_id(db: Session, model, pk, conflict_columns, **values):
+    """
+    Primary key of the ``model`` row matching ``values`` on its unique
+    ``conflict_columns``, inserting it first if missing. The insert is an
+    ON CONFLICT DO NOTHING, so concurrent submissions can't race each other
+    into a duplicate-key error; the lookup only runs when the row existed.
+    """
+    inserted_id = db.execute(
+        pg_insert(model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=conflict_columns)
+        .returning(pk)
+    ).scalar()
+    if inserted_id is not None:
+        return inserted_id
+    return db.execute(
+        select(pk).where(*(getattr(model, column) == values[column] for column in conflict_columns))
+    ).scalar_one()
+
+
 @router.post("/manual-entry", response_model=ManualEntryResponse, summary="Submit manual field data")
-async def submit_manual_entry(
+def submit_manual_entry(
     data: ManualEntryCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
@@ -44,85 +69,71 @@ async def submit_manual_entry(
     records_updated = 0
 
     try:
-        # Field
-        field = db.query(models.Field).filter(models.Field.field_id == data.field_id).first()
-        if not field:
-            field = models.Field(
-                field_id=data.field_id,
-                field_number=data.field_id,
-                acres=data.acres,
-                lat=data.lat,
-                long=data.long,
-                county=data.county,
-                state=data.state,
-                grower_id=data.grower,
+        # Everything below, the ingestion log included, commits as one
+        # transaction.
+
+        # Field: insert, or keep its data fresh from manual updates.
+        field_insert = pg_insert(models.Field).values(
+            field_id=data.field_id,
+            field_number=data.field_id,
+            acres=data.acres,
+            lat=data.lat,
+            long=data.long,
+            county=data.county,
+            state=data.state,
+            grower_id=data.grower,
+        )
+        new_values = field_insert.excluded
+        db.execute(
+            field_insert.on_conflict_do_update(
+                index_elements=[models.Field.field_id],
+                set_={
+                    "acres": func.coalesce(new_values.acres, models.Field.acres),
+                    "lat": func.coalesce(new_values.lat, models.Field.lat),
+                    "long": func.coalesce(new_values.long, models.Field.long),
+                    "county": func.coalesce(func.nullif(new_values.county, ""), models.Field.county),
+                    "state": func.coalesce(func.nullif(new_values.state, ""), models.Field.state),
+                    "grower_id": func.coalesce(new_values.grower_id, models.Field.grower_id),
+                    "updated_at": func.now(),
+                },
             )
-            db.add(field)
-        else:
-            # Keep field data fresh from manual updates.
-            field.acres = data.acres or field.acres
-            field.lat = data.lat if data.lat is not None else field.lat
-            field.long = data.long if data.long is not None else field.long
-            field.county = data.county or field.county
-            field.state = data.state or field.state
-            field.grower_id = data.grower or field.grower_id
+        )
 
-        # Crop
-        crop = (
-            db.query(models.Crop)
-            .filter(models.Crop.crop_name_en == data.crop_name_en)
-            .first()
+        crop_id = _get_or_create_id(
+            db, models.Crop, models.Crop.crop_id, ["crop_name_en"],
+            crop_name_en=data.crop_name_en, is_active=True,
         )
-        if not crop:
-            crop = models.Crop(crop_name_en=data.crop_name_en, is_active=True)
-            db.add(crop)
-            db.flush()
 
         # Variety (optional)
         variety_id = None
         if data.variety_name_en:
-            variety = (
-                db.query(models.Variety)
-                .filter(
-                    models.Variety.variety_name_en == data.variety_name_en,
-                    models.Variety.crop_id == crop.crop_id,
-                )
-                .first()
+            variety_id = _get_or_create_id(
+                db, models.Variety, models.Variety.variety_id, ["variety_name_en", "crop_id"],
+                variety_name_en=data.variety_name_en, crop_id=crop_id, is_active=True,
             )
-            if not variety:
-                variety = models.Variety(
-                    variety_name_en=data.variety_name_en,
-                    crop_id=crop.crop_id,
-                    is_active=True,
-                )
-                db.add(variety)
-                db.flush()
-            variety_id = variety.variety_id
 
-        # Season
-        season = db.query(models.Season).filter(models.Season.season_year == data.season).first()
-        if not season:
-            season = models.Season(season_year=data.season, is_current=False)
-            db.add(season)
-            db.flush()
+        season_id = _get_or_create_id(
+            db, models.Season, models.Season.season_id, ["season_year"],
+            season_year=data.season, is_current=False,
+        )
 
-        # FieldSeason
-        field_season = (
-            db.query(models.FieldSeason)
-            .filter(
+        # FieldSeason. Looked up rather than upserted: variety_id may be NULL,
+        # which uq_field_season never treats as a conflict. Only the key is
+        # read; an existing row is updated in place without loading it.
+        field_season_id = db.execute(
+            select(models.FieldSeason.field_season_id).where(
                 models.FieldSeason.field_id == data.field_id,
-                models.FieldSeason.crop_id == crop.crop_id,
+                models.FieldSeason.crop_id == crop_id,
                 models.FieldSeason.variety_id == variety_id,
-                models.FieldSeason.season_id == season.season_id,
+                models.FieldSeason.season_id == season_id,
             )
-            .first()
-        )
-        if not field_season:
+        ).scalar()
+        if field_season_id is None:
             field_season = models.FieldSeason(
                 field_id=data.field_id,
-                crop_id=crop.crop_id,
+                crop_id=crop_id,
                 variety_id=variety_id,
-                season_id=season.season_id,
+                season_id=season_id,
                 yield_bu_ac=data.yield_bu_ac,
                 yield_target=data.yield_target,
                 totalN_per_ac=data.totalN_per_ac,
@@ -133,20 +144,26 @@ async def submit_manual_entry(
             )
             db.add(field_season)
             db.flush()
+            field_season_id = field_season.field_season_id
             records_inserted = 1
         else:
             # Update available fields without clearing existing values.
-            if data.yield_bu_ac is not None:
-                field_season.yield_bu_ac = data.yield_bu_ac
-            if data.yield_target is not None:
-                field_season.yield_target = data.yield_target
-            if data.totalN_per_ac is not None:
-                field_season.totalN_per_ac = data.totalN_per_ac
-            if data.totalP_per_ac is not None:
-                field_season.totalP_per_ac = data.totalP_per_ac
-            if data.totalK_per_ac is not None:
-                field_season.totalK_per_ac = data.totalK_per_ac
-            field_season.record_source = "manual_entry"
+            updates = {
+                name: value
+                for name, value in (
+                    ("yield_bu_ac", data.yield_bu_ac),
+                    ("yield_target", data.yield_target),
+                    ("totalN_per_ac", data.totalN_per_ac),
+                    ("totalP_per_ac", data.totalP_per_ac),
+                    ("totalK_per_ac", data.totalK_per_ac),
+                )
+                if value is not None
+            }
+            db.execute(
+                update(models.FieldSeason)
+                .where(models.FieldSeason.field_season_id == field_season_id)
+                .values(**updates, record_source="manual_entry")
+            )
             records_updated = 1
 
         # Optional management event for this manual submission.
@@ -159,7 +176,7 @@ async def submit_manual_entry(
                 except Exception:
                     actives_payload = data.actives
             event = models.ManagementEvent(
-                field_season_id=field_season.field_season_id,
+                field_season_id=field_season_id,
                 job_id=data.job_id,
                 event_type=event_type,
                 status=data.status,
@@ -204,8 +221,6 @@ async def submit_manual_entry(
             )
             db.add(event)
 
-        db.commit()
-
         ingestion_log = models.DataIngestionLog(
             source_filename=source_filename,
             file_hash=file_hash,
@@ -220,11 +235,13 @@ async def submit_manual_entry(
         )
         db.add(ingestion_log)
         db.commit()
+        delete_pattern_sync()
+        background_tasks.add_task(crud.refresh_overview_stats)
 
         return {
             "success": True,
             "message": "Field data submitted successfully",
-            "field_season_id": field_season.field_season_id,
+            "field_season_id": field_season_id,
             "field_id": data.field_id,
             "season": data.season,
             "crop": data.crop_name_en,
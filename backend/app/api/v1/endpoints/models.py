@@ -5,10 +5,12 @@ import json
 import os
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import logging
 
+from app.core.cache import MODELS_PREFIX, cached, delete_pattern_sync
 from app.database.session import get_db
 from app.database import crud
 from app.database.schemas import (
@@ -17,6 +19,7 @@ from app.database.schemas import (
     ModelVersionDetailResponse,
 )
 from app.ml.model_registry import ModelRegistry
+from app.ml.predictor import clear_production_model_cache
 from app.ml.trainer import ModelTrainer
 
 logger = logging.getLogger(__name__)
@@ -24,40 +27,12 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def _sanitize_metrics(metrics: Optional[dict]) -> dict:
-    """
-    Convert metrics payload to Dict[str, float] to satisfy response schema.
-    Non-numeric values are dropped.
-    """
-    if not isinstance(metrics, dict):
-        return {}
-
-    out = {}
-    for key, value in metrics.items():
-        if isinstance(value, (int, float)):
-            out[key] = float(value)
-    return out
-
-
-def _to_model_version_response(mv) -> ModelVersionResponse:
-    return ModelVersionResponse(
-        model_version_id=mv.model_version_id,
-        version_tag=mv.version_tag,
-        model_type=mv.model_type,
-        model_params=mv.model_params or {},
-        training_data_range=mv.training_data_range,
-        performance_metrics=_sanitize_metrics(mv.performance_metrics),
-        training_date=mv.training_date,
-        is_production=mv.is_production,
-        feature_list=mv.feature_list or [],
-        preprocessing_steps=mv.preprocessing_steps,
-        notes=mv.notes,
-        created_by=mv.created_by,
-    )
+_VERSION_LIST = TypeAdapter(List[ModelVersionResponse])
 
 
 @router.get("/versions", response_model=List[ModelVersionResponse], summary="List model versions")
-async def list_model_versions(
+@cached(prefix=MODELS_PREFIX, expire=300)
+def list_model_versions(
     db: Session = Depends(get_db),
     limit: int = 20,
     active_only: bool = False,
@@ -68,11 +43,11 @@ async def list_model_versions(
     **active_only**: If true, returns only the latest version for each model_type.
     """
     versions = crud.get_model_versions(db, limit=limit, active_only=active_only)
-    return [_to_model_version_response(v) for v in versions]
+    return _VERSION_LIST.validate_python(versions, from_attributes=True)
 
 
 @router.get("/versions/{version_id}", response_model=ModelVersionDetailResponse, summary="Get model version details")
-async def get_model_version(
+def get_model_version(
     version_id: int,
     db: Session = Depends(get_db),
 ):
@@ -93,7 +68,7 @@ async def get_model_version(
         model_type=mv.model_type,
         model_params=mv.model_params,
         training_data_range=mv.training_data_range,
-        performance_metrics=_sanitize_metrics(mv.performance_metrics),
+        performance_metrics=mv.performance_metrics,
         training_date=mv.training_date,
         is_production=mv.is_production,
         feature_list=mv.feature_list,
@@ -120,7 +95,7 @@ async def get_model_version(
 
 
 @router.post("/train", summary="Trigger model training")
-async def train_model(
+def train_model(
     background_tasks: BackgroundTasks,
     model_type: str = Query("lightgbm", description="Model type: lightgbm, xgboost, random_forest"),
     start_season: int = Query(2018, description="Start season year for training data"),
@@ -152,6 +127,8 @@ async def train_model(
             end_season=end_season,
             test_size=test_size,
         )
+        delete_pattern_sync()
+        delete_pattern_sync(MODELS_PREFIX + ":*")
 
         return {
             "status": "success",
@@ -172,7 +149,7 @@ async def train_model(
 
 
 @router.post("/versions/{version_id}/set-production", summary="Set model as production")
-async def set_production_model(
+def set_production_model(
     version_id: int,
     db: Session = Depends(get_db),
 ):
@@ -187,6 +164,9 @@ async def set_production_model(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Model version {version_id} not found"
         )
+    clear_production_model_cache()
+    delete_pattern_sync()
+    delete_pattern_sync(MODELS_PREFIX + ":*")
 
     return {
         "status": "success",
@@ -196,7 +176,8 @@ async def set_production_model(
 
 
 @router.get("/production", summary="Get current production model")
-async def get_production_model(
+@cached(prefix=MODELS_PREFIX, expire=300)
+def get_production_model(
     db: Session = Depends(get_db),
 ):
     """
@@ -209,11 +190,12 @@ async def get_production_model(
             detail="No production model is currently set"
         )
 
-    return _to_model_version_response(mv)
+    return ModelVersionResponse.model_validate(mv)
 
 
 @router.get("/performance", summary="Get model performance metrics")
-async def get_model_performance(
+@cached(prefix=MODELS_PREFIX, expire=300)
+def get_model_performance(
     db: Session = Depends(get_db),
     model_version: Optional[str] = None,
 ):
@@ -298,7 +280,7 @@ def _load_coverage_for_version(version_tag: str, db: Session) -> dict:
 
 
 @router.get("/coverage", summary="Get active model's input coverage")
-async def get_active_model_coverage(
+def get_active_model_coverage(
     db: Session = Depends(get_db),
 ):
     """
@@ -339,7 +321,7 @@ async def get_active_model_coverage(
 
 
 @router.get("/versions/{version_id}/coverage", summary="Get a model version's input coverage")
-async def get_model_version_coverage(
+def get_model_version_coverage(
     version_id: int,
     db: Session = Depends(get_db),
 ):
@@ -1,29 +1,35 @@
 """
 Prediction endpoints - ML model inference
 """
+import hashlib
 import json
 import math
 import os
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 import logging
+import orjson
 
+from app.core.responses import PydanticResponse
 from app.database.session import get_db
 from app.database import crud, models as db_models
 from app.database.schemas import (
     PredictionRequest,
     PredictionResponse,
-    FeatureContribution,
     MultiModelPredictionResponse,
     MultiModelPredictionItem,
     PredictionRunResponse,
 )
-from app.ml.predictor import PredictionService
+from app.ml.batcher import get_batcher
+from app.ml.predictor import PredictionService, get_predictor, get_production_model_version
 from app.ml.explainability import ExplainabilityEngine
+from app.services.prediction_log import enqueue_prediction_log
 from app.services.regional_stats import RegionalStatsService
 
 logger = logging.getLogger(__name__)
@@ -446,9 +452,9 @@ def _enrich_request_features(
     through this helper keeps live, multi-model, and batch results
     consistent with the enriched-backfill predictions in the DB.
     """
-    request_features = request.model_dump(exclude_none=True)
-    county = getattr(request, "county", None)
-    state = getattr(request, "state", None)
+    request_features = request.feature_dict()
+    county = request.county
+    state = request.state
 
     # Centroid fill — only when the user didn't supply lat/long.
     user_lat = request_features.get("lat")
@@ -507,10 +513,71 @@ def _serialize_prediction_run(run: db_models.PredictionRun) -> Dict[str, Any]:
     }
 
 
+# Explanations of recent feature vectors, keyed on (version_tag, digest of
+# the feature values). Repeat predictions for the same field and inputs get
+# identical SHAP values, so they are served from here.
+_EXPLANATION_CACHE: "OrderedDict[Tuple[str, bytes], Dict[str, Any]]" = OrderedDict()
+_EXPLANATION_CACHE_SIZE = 4096
+_EXPLANATION_LOCK = threading.Lock()
+
+
+def _explanation_key(model_version, features: Dict[str, Any]) -> Tuple[str, bytes]:
+    encoded = orjson.dumps(
+        features,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    )
+    return model_version.version_tag, hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def _explain_production_prediction(db: Session, prediction_result: Dict[str, Any], model_version) -> Dict[str, Any]:
+    """
+    SHAP explanation for predict_yield, cached per feature vector. Best-effort:
+    a failure is logged and yields no features rather than failing the
+    prediction (failures aren't cached).
+
+    We request top_n=30 instead of 5 so that after we drop auto-filled
+    features (live enrichment + centroid lat/long), we almost always still
+    have ≥5 user-provided features left to surface. 30 is a safe upper
+    bound — even with all ~17 live-enrichment features ranked in the top,
+    we'd still recover 13 user-provided.
+    """
+    try:
+        key = _explanation_key(model_version, prediction_result['features'])
+        with _EXPLANATION_LOCK:
+            explanations = _EXPLANATION_CACHE.get(key)
+            if explanations is not None:
+                _EXPLANATION_CACHE.move_to_end(key)
+                return explanations
+
+        # Request-scoped service: the explainer reads artifacts through
+        # its registry, which needs this request's session.
+        explainer = ExplainabilityEngine(db, PredictionService(db))
+        explanations = explainer.explain_prediction(
+            features=prediction_result['features'],
+            model_version=model_version,
+            base_value=prediction_result.get('base_value', 0.0),
+            top_n=30,
+        )
+        with _EXPLANATION_LOCK:
+            _EXPLANATION_CACHE[key] = explanations
+            while len(_EXPLANATION_CACHE) > _EXPLANATION_CACHE_SIZE:
+                _EXPLANATION_CACHE.popitem(last=False)
+        return explanations
+    except Exception as explain_err:
+        logger.warning(
+            f"Explainability unavailable for model {model_version.version_tag}: {explain_err}",
+            exc_info=True,
+        )
+        return {"top_features": []}
+
+
 @router.post("", response_model=PredictionResponse, summary="Predict yield")
-async def predict_yield(
+def predict_yield(
     request: PredictionRequest,
-    background_tasks: BackgroundTasks,
+    include_explainability: bool = Query(
+        True, description="Compute SHAP feature contributions (the most expensive step)"
+    ),
     db: Session = Depends(get_db),
 ):
     """
@@ -538,13 +605,12 @@ async def predict_yield(
     - model_version: Version of model used
     - regional_comparison: How prediction compares to regional average
     - explainability: Top 5 contributing features with SHAP values
+      (empty when include_explainability=false)
     """
     try:
-        # Initialize prediction service
-        predictor = PredictionService(db)
-
-        # Get production model
-        model_version = predictor.get_production_model()
+        # Get production model (the row is cached per process; the model
+        # itself is loaded once into the shared predictor).
+        model_version = get_production_model_version()
         if not model_version:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -552,8 +618,8 @@ async def predict_yield(
             )
 
         # Check if we have regional data for comparison
-        county = request.county if hasattr(request, 'county') and request.county else None
-        state = request.state if hasattr(request, 'state') and request.state else None
+        county = request.county or None
+        state = request.state or None
 
         # If county/state not provided, try to infer from lat/long
         if not county or not state or request.season is None:
@@ -577,29 +643,22 @@ async def predict_yield(
         # rows already in the predictions table.
         request_features, coordinates_source, live_enrichment_metadata = _enrich_request_features(request)
 
-        # Generate prediction
-        prediction_result = predictor.predict(request_features, model_version)
+        # End the read transaction so no pooled connection sits idle
+        # through the compute below.
+        db.commit()
 
-        # Get explainability (best-effort; do not fail prediction if explanation fails).
-        # We request top_n=30 instead of 5 so that after we drop auto-filled
-        # features (live enrichment + centroid lat/long), we almost always
-        # still have ≥5 user-provided features left to surface. 30 is a
-        # safe upper bound — even with all ~17 live-enrichment features
-        # ranked in the top, we'd still recover 13 user-provided.
-        explanations = {"top_features": []}
-        try:
-            explainer = ExplainabilityEngine(db, predictor)
-            explanations = explainer.explain_prediction(
-                features=prediction_result['features'],
-                model_version=model_version,
-                base_value=prediction_result.get('base_value', 0.0),
-                top_n=30,
-            )
-        except Exception as explain_err:
-            logger.warning(
-                f"Explainability unavailable for model {model_version.version_tag}: {explain_err}",
-                exc_info=True,
-            )
+        # Generate prediction, batched with concurrent requests when enabled
+        # (the batcher has its own worker thread).
+        batcher = get_batcher()
+        if batcher is not None:
+            prediction_result = batcher.predict(request_features, model_version)
+        else:
+            prediction_result = get_predictor(model_version).predict(request_features, model_version)
+
+        if include_explainability:
+            explanations = _explain_production_prediction(db, prediction_result, model_version)
+        else:
+            explanations = {"top_features": []}
 
         # Filter out features the backend auto-filled (centroid + live
         # enrichment). Users would otherwise see SHAP attributions for
@@ -618,17 +677,9 @@ async def predict_yield(
             confidence_level=prediction_result.get('confidence_level'),
             model_version=model_version.version_tag,
             regional_comparison=regional_comparison,
-            explainability={
-                "top_features": [
-                    FeatureContribution(
-                        feature=feat['feature'],
-                        value=feat['value'],
-                        direction=feat['direction'],
-                        importance=feat['importance']
-                    ).model_dump()
-                    for feat in top5_user
-                ]
-            },
+            # The explainer's dicts validate straight into FeatureContribution
+            # (its extra shap_value key is ignored).
+            explainability={"top_features": top5_user},
             recommendations=None,  # Future: fertilizer recommendations
             coordinates_source=coordinates_source,
             enrichment_source=live_enrichment_metadata.get("source"),
@@ -637,7 +688,7 @@ async def predict_yield(
             total_user_features=total_user,
         )
 
-        request_payload = request.model_dump(mode="json", exclude_none=True)
+        request_payload = request.feature_dict()
         response_payload = response.model_dump(mode="json")
         top_features = (response_payload.get("explainability") or {}).get("top_features", [])
 
@@ -651,15 +702,10 @@ async def predict_yield(
         )
         response.prediction_run_id = db_run.prediction_run_id
 
-        # Optionally log prediction for future analysis (background task)
-        background_tasks.add_task(
-            log_prediction_request,
-            request=request,
-            response=response,
-            model_version=model_version.version_tag
-        )
+        # Log prediction for future analysis (queued; written in batches)
+        log_prediction_request(request_payload, response, model_version.version_tag)
 
-        return response
+        return PydanticResponse(response)
 
     except ValueError as e:
         raise HTTPException(
@@ -675,10 +721,9 @@ async def predict_yield(
 
 
 @router.post("/model/{version_tag}", response_model=PredictionResponse, summary="Predict yield with a specific model version")
-async def predict_yield_specific_model(
+def predict_yield_specific_model(
     version_tag: str,
     request: PredictionRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """
@@ -698,8 +743,8 @@ async def predict_yield_specific_model(
 
         predictor = PredictionService(db)
 
-        county = request.county if hasattr(request, 'county') and request.county else None
-        state = request.state if hasattr(request, 'state') and request.state else None
+        county = request.county or None
+        state = request.state or None
         if not county or not state or request.season is None:
             regional_comparison = None
         else:
@@ -747,17 +792,7 @@ async def predict_yield_specific_model(
             confidence_level=prediction_result.get('confidence_level'),
             model_version=model_version.version_tag,
             regional_comparison=regional_comparison,
-            explainability={
-                "top_features": [
-                    FeatureContribution(
-                        feature=feat['feature'],
-                        value=feat['value'],
-                        direction=feat['direction'],
-                        importance=feat['importance']
-                    ).model_dump()
-                    for feat in top5_user
-                ]
-            },
+            explainability={"top_features": top5_user},
             recommendations=None,
             coordinates_source=coordinates_source,
             enrichment_source=live_enrichment_metadata.get("source"),
@@ -766,7 +801,7 @@ async def predict_yield_specific_model(
             total_user_features=total_user,
         )
 
-        request_payload = request.model_dump(mode="json", exclude_none=True)
+        request_payload = request.feature_dict()
         response_payload = response.model_dump(mode="json")
         top_features = (response_payload.get("explainability") or {}).get("top_features", [])
 
@@ -780,14 +815,9 @@ async def predict_yield_specific_model(
         )
         response.prediction_run_id = db_run.prediction_run_id
 
-        background_tasks.add_task(
-            log_prediction_request,
-            request=request,
-            response=response,
-            model_version=model_version.version_tag
-        )
+        log_prediction_request(request_payload, response, model_version.version_tag)
 
-        return response
+        return PydanticResponse(response)
 
     except HTTPException:
         raise
@@ -805,7 +835,7 @@ async def predict_yield_specific_model(
 
 
 @router.post("/all-models", response_model=MultiModelPredictionResponse, summary="Predict yield across all registered models")
-async def predict_yield_all_models(
+def predict_yield_all_models(
     request: PredictionRequest,
     db: Session = Depends(get_db),
 ):
@@ -858,17 +888,7 @@ async def predict_yield_all_models(
                             result["confidence_upper"],
                         ],
                         confidence_level=result.get("confidence_level"),
-                        explainability={
-                            "top_features": [
-                                FeatureContribution(
-                                    feature=feat["feature"],
-                                    value=feat["value"],
-                                    direction=feat["direction"],
-                                    importance=feat["importance"],
-                                ).model_dump()
-                                for feat in explanations.get("top_features", [])[:5]
-                            ]
-                        },
+                        explainability={"top_features": explanations.get("top_features", [])[:5]},
                         error=None,
                     )
                 )
@@ -889,7 +909,7 @@ async def predict_yield_all_models(
 
         # Production first, then version_tag for stable ordering.
         items.sort(key=lambda x: (not x.is_production, x.model_version))
-        return MultiModelPredictionResponse(request=payload, predictions=items)
+        return PydanticResponse(MultiModelPredictionResponse(request=payload, predictions=items))
 
     except HTTPException:
         raise
@@ -902,9 +922,8 @@ async def predict_yield_all_models(
 
 
 @router.post("/batch", summary="Batch predict yield")
-async def batch_predict_yield(
+def batch_predict_yield(
     requests: List[PredictionRequest],
-    db: Session = Depends(get_db),
 ):
     """
     Predict yield for multiple fields in batch.
@@ -913,42 +932,84 @@ async def batch_predict_yield(
     Returns a list of predictions in the same order.
     """
     try:
-        predictor = PredictionService(db)
-        model_version = predictor.get_production_model()
+        model_version = get_production_model_version()
 
         if not model_version:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="No production model available"
             )
+        predictor = get_predictor(model_version)
+        version_tag = model_version.version_tag
+
+        def failed(e: Exception) -> Dict[str, Any]:
+            logger.error(f"Batch prediction failed for item: {e}")
+            return {
+                "error": str(e),
+                "predicted_yield": None,
+                "confidence_interval": None,
+                "model_version": version_tag,
+            }
+
+        def response(predicted_yield, lower, upper, confidence_level) -> Dict[str, Any]:
+            # Same keys as PredictionResponse.model_dump(), built directly;
+            # every value here is already a plain float or None.
+            return {
+                "predicted_yield": float(predicted_yield),
+                "confidence_interval": [float(lower), float(upper)],
+                "confidence_level": None if confidence_level is None else float(confidence_level),
+                "model_version": version_tag,
+                "prediction_run_id": None,
+                "regional_comparison": None,
+                "explainability": None,
+                "recommendations": None,
+                "coordinates_source": None,
+                "enrichment_source": None,
+                "enrichment_rows": None,
+                "enrichment_filled_fields": None,
+                "total_user_features": None,
+            }
 
-        results = []
-        for req in requests:
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        payloads: List[Dict[str, Any]] = []
+        positions: List[int] = []
+        for i, req in enumerate(requests):
             try:
                 # Per-request enrichment so each row gets centroid + CSV
                 # fill keyed on its own state/county/crop/variety.
                 enriched_payload, _coords_src, _enrich_meta = _enrich_request_features(req)
-                result = predictor.predict(enriched_payload, model_version)
-                results.append(PredictionResponse(
-                    predicted_yield=result['predicted_yield'],
-                    confidence_interval=[
-                        result['confidence_lower'],
-                        result['confidence_upper']
-                    ],
-                    confidence_level=result.get('confidence_level'),
-                    model_version=model_version.version_tag,
-                    regional_comparison=None,
-                    explainability=None,
-                    recommendations=None,
-                ).model_dump())
             except Exception as e:
-                logger.error(f"Batch prediction failed for item: {e}")
-                results.append({
-                    "error": str(e),
-                    "predicted_yield": None,
-                    "confidence_interval": None,
-                    "model_version": model_version.version_tag if model_version else None,
-                })
+                results[i] = failed(e)
+                continue
+            payloads.append(enriched_payload)
+            positions.append(i)
+
+        if payloads:
+            try:
+                # One model call for every row that enriched cleanly.
+                outputs = predictor.predict_batch(payloads, model_version)
+                for i, y, lo, hi in zip(
+                    positions,
+                    outputs['predicted_yield'].tolist(),
+                    outputs['confidence_lower'].tolist(),
+                    outputs['confidence_upper'].tolist(),
+                ):
+                    results[i] = response(y, lo, hi, outputs['confidence_level'])
+            except Exception as e:
+                # A bad row fails the whole matrix; redo row by row so only
+                # the offending items report an error.
+                logger.warning(f"Batch prediction fell back to per-row calls: {e}")
+                for i, payload in zip(positions, payloads):
+                    try:
+                        result = predictor.predict(payload, model_version)
+                        results[i] = response(
+                            result['predicted_yield'],
+                            result['confidence_lower'],
+                            result['confidence_upper'],
+                            result.get('confidence_level'),
+                        )
+                    except Exception as row_error:
+                        results[i] = failed(row_error)
 
         return {"predictions": results, "total": len(requests)}
 
@@ -961,7 +1022,7 @@ async def batch_predict_yield(
 
 
 @router.get("/history", response_model=List[PredictionRunResponse], summary="List saved prediction runs")
-async def list_prediction_runs(
+def list_prediction_runs(
     db: Session = Depends(get_db),
     limit: int = 100,
     page: int = 1,
@@ -1060,7 +1121,7 @@ def _compute_scatter_metrics(points: List[Dict[str, float]]) -> Dict[str, Option
     "/scatter",
     summary="Predicted vs observed pairs + regression metrics for a model",
 )
-async def get_prediction_scatter(
+def get_prediction_scatter(
     db: Session = Depends(get_db),
     model_id: Optional[int] = Query(
         None,
@@ -1453,17 +1514,21 @@ async def get_prediction_scatter(
 
 # Helper function for logging
 def log_prediction_request(
-    request: PredictionRequest,
+    request_payload: Dict[str, Any],
     response: PredictionResponse,
     model_version: str,
 ):
     """
-    Log prediction requests for monitoring and future training.
-    This can be expanded to store in a predictions_log table.
+    Log prediction requests for monitoring and future training. The
+    prediction_logs row is queued and written in batches off the request.
     """
-    logger.info(
-        f"Prediction made: crop={request.crop}, variety={request.variety}, "
-        f"season={request.season}, model={model_version}, "
-        f"predicted_yield={response.predicted_yield}"
-    )
-    # Future: Store in database
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Prediction made: crop=%s, variety=%s, season=%s, model=%s, predicted_yield=%s",
+            request_payload.get('crop'),
+            request_payload.get('variety'),
+            request_payload.get('season'),
+            model_version,
+            response.predicted_yield,
+        )
+    enqueue_prediction_log(model_version, request_payload, response.predicted_yield)
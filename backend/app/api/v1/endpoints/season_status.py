@@ -100,7 +100,7 @@ def _serialize(snap: nass_client.ProgressSnapshot) -> Dict[str, Any]:
     "",
     summary="Live winter-wheat season status from USDA NASS",
 )
-async def get_season_status(
+def get_season_status(
     state: str = Query(
         ...,
         description=(
@@ -30,6 +30,17 @@ class Settings(BaseSettings):
     # Model
     model_path: str = "models/"
     model_version: str = "v1.0.0"
+    # Micro-batching for POST /predictions: concurrent requests are pooled
+    # for up to batch_timeout_ms (or until max_batch_size are waiting) and
+    # predicted in one model call. max_batch_size <= 1 disables it.
+    max_batch_size: int = 64
+    batch_timeout_ms: int = 20
+    # How long the production model-version row is cached per process.
+    model_cache_ttl_s: int = 60
+    # dtype of numeric model inputs: "float64" (default, as trained) or
+    # "float32". float32 only applies to model types that evaluate in
+    # float32 anyway, and only after a parity check against float64.
+    inference_dtype: str = "float64"
 
     # Environment
     environment: str = "development"
@@ -40,6 +51,19 @@ class Settings(BaseSettings):
 
     # Admin
     admin_api_key: Optional[str] = None
+    # Where admin training/backfill jobs run: "inline" uses FastAPI background
+    # tasks in the web process; "celery" queues them on redis_url for a
+    # separate worker (`celery -A app.worker worker`).
+    admin_job_backend: str = "inline"
+    # Where admin job state is kept: "memory" (per process) or "redis" (shared
+    # across API workers). The celery backend always uses redis.
+    admin_job_store: str = "memory"
+
+    # Reference-data response cache (crops, varieties, seasons, overview):
+    # "none" or "redis" (on redis_url). Entries are dropped on writes and
+    # expire after reference_cache_ttl seconds regardless.
+    reference_cache_store: str = "none"
+    reference_cache_ttl: int = 3600
 
     # UI configuration
     ui_config_path: str = "data/ui_config.json"
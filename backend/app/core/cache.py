@@ -0,0 +1,160 @@
+"""
+Redis cache-aside for slowly-changing reference responses
+"""
+import functools
+import inspect
+import logging
+from typing import Any, Callable, Dict, Optional, Type
+
+import orjson
+import redis
+import redis.asyncio as aioredis
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Key prefix shared by the reference-data endpoints (crops, varieties,
+# seasons, overview); writes that can change any of them drop the lot.
+REFERENCE_PREFIX = "ref"
+# Model-version metadata (list, production model, performance); dropped
+# when a model is trained or promoted.
+MODELS_PREFIX = "models"
+
+_ENABLED = settings.reference_cache_store == "redis"
+# Short timeouts: a slow or missing Redis should cost a cache miss, not a
+# stalled request.
+_POOL = (
+    aioredis.ConnectionPool.from_url(
+        settings.redis_url,
+        max_connections=20,
+        socket_timeout=0.5,
+        socket_connect_timeout=0.5,
+    )
+    if _ENABLED
+    else None
+)
+# Invalidation from worker threads and Celery tasks, which have no loop.
+_SYNC_CLIENT = (
+    redis.Redis.from_url(settings.redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+    if _ENABLED
+    else None
+)
+
+
+def _cache_key(prefix: str, name: str, params: Dict[str, Any]) -> str:
+    # Only plain query values identify a response; injected dependencies
+    # (the DB session and the like) are skipped.
+    plain = {
+        k: v for k, v in params.items()
+        if v is None or isinstance(v, (str, int, float, bool, list, tuple))
+    }
+    return f"{prefix}:{name}:{orjson.dumps(plain, option=orjson.OPT_SORT_KEYS).decode()}"
+
+
+def _encode(result: Any, response_model: Optional[Type[BaseModel]]) -> bytes:
+    # Same output as FastAPI's own path: response_model filtering, then
+    # jsonable_encoder for what orjson can't take (Decimals become floats).
+    if response_model is not None:
+        result = response_model.model_validate(result).model_dump()
+    return orjson.dumps(result, default=jsonable_encoder)
+
+
+def cached(
+    prefix: str = REFERENCE_PREFIX,
+    expire: Optional[int] = None,
+    response_model: Optional[Type[BaseModel]] = None,
+) -> Callable:
+    """
+    Cache an endpoint's JSON body in Redis, keyed on its query params.
+
+    Place it under the route decorator. Plain ``def`` endpoints are run in
+    the threadpool on a miss, as FastAPI itself would run them. Pass the route's response_model so
+    cached bodies are shaped exactly like uncached ones. Errors raised by the
+    endpoint are never cached, and a Redis failure falls back to calling it.
+    A no-op unless REFERENCE_CACHE_STORE=redis.
+    """
+    ttl = expire or settings.reference_cache_ttl
+
+    def decorator(fn: Callable) -> Callable:
+        if _POOL is None:
+            return fn
+        is_async = inspect.iscoroutinefunction(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Response:
+            key = _cache_key(prefix, fn.__name__, kwargs)
+            client = aioredis.Redis(connection_pool=_POOL)
+            try:
+                body = await client.get(key)
+            except redis.RedisError as e:
+                logger.warning("Reference cache read failed: %s", e)
+                body = None
+            if body is not None:
+                return Response(content=body, media_type="application/json")
+
+            if is_async:
+                result = await fn(*args, **kwargs)
+            else:
+                result = await run_in_threadpool(fn, *args, **kwargs)
+            body = _encode(result, response_model)
+            try:
+                await client.set(key, body, ex=ttl)
+            except redis.RedisError as e:
+                logger.warning("Reference cache write failed: %s", e)
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+
+    return decorator
+
+
+async def delete_pattern(pattern: str = REFERENCE_PREFIX + ":*") -> None:
+    """Drop every cached entry matching ``pattern``; call after a commit."""
+    if _POOL is None:
+        return
+    client = aioredis.Redis(connection_pool=_POOL)
+    try:
+        keys = [key async for key in client.scan_iter(match=pattern, count=500)]
+        if keys:
+            await client.unlink(*keys)
+    except redis.RedisError as e:
+        logger.warning("Reference cache invalidation failed: %s", e)
+
+
+def delete_pattern_sync(pattern: str = REFERENCE_PREFIX + ":*") -> None:
+    """delete_pattern for code running outside the event loop."""
+    if _SYNC_CLIENT is None:
+        return
+    try:
+        keys = list(_SYNC_CLIENT.scan_iter(match=pattern, count=500))
+        if keys:
+            _SYNC_CLIENT.unlink(*keys)
+    except redis.RedisError as e:
+        logger.warning("Reference cache invalidation failed: %s", e)
+
+
+def get_json_sync(key: str) -> Optional[Any]:
+    """Decoded value cached under ``key``, or None on a miss or when disabled."""
+    if _SYNC_CLIENT is None:
+        return None
+    try:
+        body = _SYNC_CLIENT.get(key)
+    except redis.RedisError as e:
+        logger.warning("Reference cache read failed: %s", e)
+        return None
+    return orjson.loads(body) if body is not None else None
+
+
+def set_json_sync(key: str, value: Any, expire: Optional[int] = None) -> None:
+    """Cache ``value`` as JSON for code outside the event loop."""
+    if _SYNC_CLIENT is None:
+        return
+    try:
+        _SYNC_CLIENT.set(key, _encode(value, None), ex=expire or settings.reference_cache_ttl)
+    except redis.RedisError as e:
+        logger.warning("Reference cache write failed: %s", e)
@@ -0,0 +1,21 @@
+"""
+Response classes
+"""
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class PydanticResponse(JSONResponse):
+    """
+    Render a Pydantic model with its own (Rust) JSON serializer.
+
+    Returning one of these skips FastAPI's response_model round trip and the
+    pure-Python jsonable_encoder walk, which dominate on large list payloads.
+    Keep response_model on the route for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        assert isinstance(content, BaseModel), "PydanticResponse expects a Pydantic model"
+        return content.model_dump_json(by_alias=True).encode("utf-8")
@@ -3,19 +3,24 @@ Security utilities (basic - can be expanded with real auth)
 """
 from datetime import datetime, timedelta
 from typing import Optional
-import secrets
+import base64
+import hmac
+import os
 
 from app.config import settings
 
+# Same entropy as secrets.token_urlsafe(32).
+_KEY_NBYTES = 32
+
 
 def generate_api_key() -> str:
     """Generate a random API key."""
-    return secrets.token_urlsafe(32)
+    return base64.urlsafe_b64encode(os.urandom(_KEY_NBYTES)).rstrip(b"=").decode("ascii")
 
 
 def verify_api_key(api_key: str, valid_key: str) -> bool:
-    """Verify an API key (simple implementation)."""
-    return api_key == valid_key
+    """Verify an API key in constant time."""
+    return hmac.compare_digest(api_key.encode("utf-8"), valid_key.encode("utf-8"))
 
 
 # Placeholder for future JWT implementation
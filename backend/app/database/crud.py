@@ -1,14 +1,22 @@
 """
 CRUD operations for database models
 """
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, asc, text
-from typing import List, Optional, Dict, Any
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import Float, Select, and_, bindparam, case, cast, func, desc, asc, exists, or_, select, text, true
+from functools import lru_cache
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 import hashlib
 import json
+import logging
 
+from app.config import settings
+from app.core.cache import REFERENCE_PREFIX, delete_pattern_sync, get_json_sync, set_json_sync
 from . import models, schemas
 
+logger = logging.getLogger(__name__)
+
 
 def _as_payload_dict(payload: Any) -> Dict[str, Any]:
     """
@@ -179,10 +187,22 @@ def get_field_season(db: Session, field_season_id: int) -> Optional[models.Field
     return db.query(models.FieldSeason).filter(models.FieldSeason.field_season_id == field_season_id).first()
 
 
-def get_field_seasons(
-    db: Session,
-    skip: int = 0,
-    limit: int = 50,
+def _strict_loading() -> tuple:
+    """
+    Loader options that make any relationship not eagerly loaded by the
+    query raise on access instead of lazy-loading, so a new attribute read
+    that would reintroduce per-row queries fails loudly in development.
+    Production keeps the lazy-load fallback.
+    """
+    return (raiseload('*'),) if settings.debug else ()
+
+
+# The field-season list, its count and the CSV export share one set of
+# filters. Statements are built once per filter shape (which filters are set)
+# with bind parameters for the values, and reused across requests; only the
+# values change per call.
+
+def _filter_params(
     crop: Optional[str] = None,
     variety: Optional[str] = None,
     season: Optional[List[int]] = None,
@@ -193,14 +213,78 @@ def get_field_seasons(
     has_prediction: Optional[bool] = None,
     min_yield: Optional[float] = None,
     max_yield: Optional[float] = None,
-) -> List[models.FieldSeason]:
-    query = db.query(models.FieldSeason).join(models.Field)
+) -> Dict[str, Any]:
+    """The filters that are set, keyed by their bind parameter names."""
+    params: Dict[str, Any] = {}
+    if crop:
+        params["crop"] = crop
+    if variety:
+        params["variety"] = variety
+    if season:
+        params["season"] = list(season)
+    if state:
+        params["state"] = state
+    if county:
+        params["county"] = county
+    if min_acres is not None:
+        params["min_acres"] = min_acres
+    if max_acres is not None:
+        params["max_acres"] = max_acres
+    if has_prediction is not None:
+        params["has_prediction"] = has_prediction
+        # The predicted-yield bounds only apply together with has_prediction.
+        if has_prediction and min_yield is not None:
+            params["min_yield"] = min_yield
+        if has_prediction and max_yield is not None:
+            params["max_yield"] = max_yield
+    return params
+
+
+def _filter_shape(params: Dict[str, Any]) -> frozenset:
+    # has_prediction is not bound: True and False give different statements.
+    return frozenset(
+        (name, value) if name == "has_prediction" else name
+        for name, value in params.items()
+    )
 
-    # Always join Season for ordering
-    query = query.join(models.Season)
 
-    # Apply filters.
-    #
+def _bind_values(params: Dict[str, Any], **extra: Any) -> Dict[str, Any]:
+    values = {name: value for name, value in params.items() if name != "has_prediction"}
+    values.update(extra)
+    return values
+
+
+def _prediction_filter(shape: frozenset):
+    """
+    has_prediction (and the predicted-yield bounds) as a correlated EXISTS,
+    so each candidate field-season costs one probe of
+    idx_model_predictions_field_created instead of a join that multiplies
+    rows by their predictions. None when there is nothing to filter on.
+    """
+    probe = exists().where(
+        models.ModelPrediction.field_season_id == models.FieldSeason.field_season_id
+    )
+    if ("has_prediction", False) in shape:
+        return ~probe
+    if ("has_prediction", True) not in shape:
+        return None
+    if "min_yield" in shape:
+        probe = probe.where(models.ModelPrediction.predicted_yield >= bindparam("min_yield"))
+    if "max_yield" in shape:
+        probe = probe.where(models.ModelPrediction.predicted_yield <= bindparam("max_yield"))
+    return probe
+
+
+def _filtered(stmt: Select, shape: frozenset) -> Select:
+    """
+    ``stmt`` (selecting from FieldSeason) joined to Field and Season and
+    narrowed by the filters in ``shape``.
+    """
+    stmt = (
+        stmt.join(models.Field, models.FieldSeason.field_id == models.Field.field_id)
+        .join(models.Season, models.FieldSeason.season_id == models.Season.season_id)
+    )
+
     # Join paths matter here: FieldSeason → Variety has TWO valid paths
     # (direct via FieldSeason.variety_id, OR transitive via Crop), and when
     # both Crop and Variety are joined SQLAlchemy will silently pick the
@@ -208,48 +292,201 @@ def get_field_seasons(
     # (the join condition becomes "any variety belonging to that crop").
     # We always pass the explicit ON clause so the variety filter always
     # narrows to the actually-planted variety.
-    if crop:
-        query = query.join(
+    if "crop" in shape:
+        stmt = stmt.join(
             models.Crop, models.FieldSeason.crop_id == models.Crop.crop_id
-        ).filter(models.Crop.crop_name_en.ilike(crop))
-    if variety:
-        query = query.join(
+        ).where(models.Crop.crop_name_en.ilike(bindparam("crop")))
+    if "variety" in shape:
+        stmt = stmt.join(
             models.Variety, models.FieldSeason.variety_id == models.Variety.variety_id
-        ).filter(models.Variety.variety_name_en.ilike(variety))
-    if season:
-        query = query.filter(models.Season.season_year.in_(season))
-    if state:
-        query = query.filter(models.Field.state == state)
-    if county:
-        query = query.filter(models.Field.county == county)
-    if min_acres is not None:
-        query = query.filter(models.Field.acres >= min_acres)
-    if max_acres is not None:
-        query = query.filter(models.Field.acres <= max_acres)
-    if has_prediction is True:
-        query = query.join(models.ModelPrediction, isouter=True).filter(models.ModelPrediction.prediction_id != None)
-    elif has_prediction is False:
-        query = query.outerjoin(models.ModelPrediction).filter(models.ModelPrediction.prediction_id == None)
-    if min_yield is not None and has_prediction:
-        query = query.join(models.ModelPrediction).filter(models.ModelPrediction.predicted_yield >= min_yield)
-    if max_yield is not None and has_prediction:
-        query = query.join(models.ModelPrediction).filter(models.ModelPrediction.predicted_yield <= max_yield)
-
-    # Add count of management events
-    query = query.outerjoin(models.ManagementEvent).group_by(
+        ).where(models.Variety.variety_name_en.ilike(bindparam("variety")))
+    if "season" in shape:
+        stmt = stmt.where(models.Season.season_year.in_(bindparam("season", expanding=True)))
+    if "state" in shape:
+        stmt = stmt.where(models.Field.state == bindparam("state"))
+    if "county" in shape:
+        stmt = stmt.where(models.Field.county == bindparam("county"))
+    if "min_acres" in shape:
+        stmt = stmt.where(models.Field.acres >= bindparam("min_acres"))
+    if "max_acres" in shape:
+        stmt = stmt.where(models.Field.acres <= bindparam("max_acres"))
+    prediction_filter = _prediction_filter(shape)
+    if prediction_filter is not None:
+        stmt = stmt.where(prediction_filter)
+    return stmt
+
+
+def _latest_prediction_lateral(by_model: bool = False):
+    """
+    Newest prediction per field-season, as a LATERAL subquery; with
+    ``by_model``, only predictions from the bound ``model_version_id``.
+    """
+    query = (
+        select(
+            models.ModelPrediction.predicted_yield,
+            models.ModelPrediction.confidence_lower,
+            models.ModelPrediction.confidence_upper,
+            models.ModelPrediction.regional_avg_yield,
+            models.ModelPrediction.model_version_id,
+        )
+        .where(models.ModelPrediction.field_season_id == models.FieldSeason.field_season_id)
+        .order_by(desc(models.ModelPrediction.created_at))
+        .limit(1)
+    )
+    if by_model:
+        query = query.where(models.ModelPrediction.model_version_id == bindparam("model_version_id"))
+    return query.lateral("latest_prediction")
+
+
+def _event_count_column():
+    return (
+        select(func.count(models.ManagementEvent.event_id))
+        .where(models.ManagementEvent.field_season_id == models.FieldSeason.field_season_id)
+        .scalar_subquery()
+    )
+
+
+def _field_season_rows(*columns: Any, latest_prediction: Any, matching: Any) -> Select:
+    """
+    Flat SELECT of ``columns`` over the field-seasons whose IDs are in the
+    ``matching`` subquery, with Field, Season, Crop, Variety and
+    ``latest_prediction`` joined in, in list order.
+    """
+    return (
+        select(*columns)
+        .select_from(matching)
+        .join(models.FieldSeason, models.FieldSeason.field_season_id == matching.c.field_season_id)
+        .join(models.Field, models.FieldSeason.field_id == models.Field.field_id)
+        .join(models.Season, models.FieldSeason.season_id == models.Season.season_id)
+        .join(models.Crop, models.FieldSeason.crop_id == models.Crop.crop_id)
+        .outerjoin(models.Variety, models.FieldSeason.variety_id == models.Variety.variety_id)
+        .outerjoin(latest_prediction, true())
+        .order_by(
+            desc(models.Season.season_year), models.Field.field_number, models.FieldSeason.field_season_id
+        )
+    )
+
+
+def _as_float(column: Any, label: str):
+    # NUMERIC comes back as Decimal; the list endpoint wants plain floats.
+    return cast(column, Float).label(label)
+
+
+@lru_cache(maxsize=64)
+def _page_statement(shape: frozenset, by_model: bool, after_cursor: bool) -> Select:
+    # The cursor seek, ORDER BY and LIMIT all sit in the filtered scan itself
+    # (no window function above them), so rows before the cursor are dropped
+    # as they are read and Postgres keeps only a top-``limit`` sort. The
+    # total comes from _count_statement, separately.
+    scan = _filtered(
+        select(models.FieldSeason.field_season_id).select_from(models.FieldSeason), shape
+    )
+    if after_cursor:
+        # Seek past the cursor row's sort key (season_year DESC,
+        # field_number, field_season_id).
+        cursor_key = (
+            select(models.Season.season_year, models.Field.field_number)
+            .select_from(models.FieldSeason)
+            .join(models.Field, models.FieldSeason.field_id == models.Field.field_id)
+            .join(models.Season, models.FieldSeason.season_id == models.Season.season_id)
+            .where(models.FieldSeason.field_season_id == bindparam("cursor"))
+            .subquery("cursor_key")
+        )
+        scan = scan.join(cursor_key, true()).where(
+            or_(
+                models.Season.season_year < cursor_key.c.season_year,
+                and_(
+                    models.Season.season_year == cursor_key.c.season_year,
+                    or_(
+                        models.Field.field_number > cursor_key.c.field_number,
+                        and_(
+                            models.Field.field_number == cursor_key.c.field_number,
+                            models.FieldSeason.field_season_id > bindparam("cursor"),
+                        ),
+                    ),
+                ),
+            )
+        )
+    page = (
+        scan.order_by(
+            desc(models.Season.season_year), models.Field.field_number, models.FieldSeason.field_season_id
+        )
+        .offset(bindparam("skip"))
+        .limit(bindparam("limit"))
+        .subquery("page")
+    )
+    latest = _latest_prediction_lateral(by_model)
+    has_interval = and_(latest.c.confidence_lower.isnot(None), latest.c.confidence_upper.isnot(None))
+    return _field_season_rows(
         models.FieldSeason.field_season_id,
+        models.Field.field_number,
+        _as_float(models.Field.acres, "acres"),
+        models.Crop.crop_name_en.label("crop"),
+        models.Variety.variety_name_en.label("variety"),
+        models.Season.season_year.label("season"),
+        models.Field.state,
+        models.Field.county,
+        _as_float(models.Field.lat, "lat"),
+        _as_float(models.Field.long, "long"),
+        _as_float(models.FieldSeason.yield_bu_ac, "yield_bu_ac"),
+        _as_float(models.FieldSeason.totalN_per_ac, "totalN_per_ac"),
+        _as_float(models.FieldSeason.totalP_per_ac, "totalP_per_ac"),
+        _as_float(models.FieldSeason.totalK_per_ac, "totalK_per_ac"),
+        _as_float(latest.c.predicted_yield, "predicted_yield"),
+        case(
+            (has_interval, array([cast(latest.c.confidence_lower, Float), cast(latest.c.confidence_upper, Float)])),
+        ).label("confidence_interval"),
+        _as_float(latest.c.regional_avg_yield, "regional_avg_yield"),
+        latest.c.model_version_id.label("prediction_model_version_id"),
+        _event_count_column().label("management_event_count"),
+        latest_prediction=latest,
+        matching=page,
+    )
+
+
+@lru_cache(maxsize=64)
+def _export_statement(shape: frozenset) -> Select:
+    matching = _filtered(
+        select(models.FieldSeason.field_season_id).select_from(models.FieldSeason), shape
+    ).subquery("matching")
+    latest = _latest_prediction_lateral()
+    return _field_season_rows(
+        models.FieldSeason.field_season_id,
+        models.Field.field_number,
+        models.Field.acres,
+        models.Crop.crop_name_en,
+        models.Variety.variety_name_en,
         models.Season.season_year,
-        models.Field.field_number
+        models.Field.state,
+        models.Field.county,
+        models.Field.lat,
+        models.Field.long,
+        models.FieldSeason.yield_bu_ac,
+        latest.c.predicted_yield,
+        latest.c.confidence_lower,
+        latest.c.confidence_upper,
+        latest.c.regional_avg_yield,
+        models.FieldSeason.totalN_per_ac,
+        models.FieldSeason.totalP_per_ac,
+        models.FieldSeason.totalK_per_ac,
+        _event_count_column().label("management_event_count"),
+        latest_prediction=latest,
+        matching=matching,
     )
 
-    # Order by most recent season first
-    query = query.order_by(desc(models.Season.season_year), models.Field.field_number)
 
-    return query.offset(skip).limit(limit).all()
+@lru_cache(maxsize=64)
+def _count_statement(shape: frozenset) -> Select:
+    return _filtered(
+        select(func.count(models.FieldSeason.field_season_id)).select_from(models.FieldSeason),
+        shape,
+    )
 
 
-def count_field_seasons(
+def list_and_count_field_seasons(
     db: Session,
+    skip: int = 0,
+    limit: int = 50,
     crop: Optional[str] = None,
     variety: Optional[str] = None,
     season: Optional[List[int]] = None,
@@ -258,44 +495,147 @@ def count_field_seasons(
     min_acres: Optional[float] = None,
     max_acres: Optional[float] = None,
     has_prediction: Optional[bool] = None,
-) -> int:
-    query = db.query(func.count(models.FieldSeason.field_season_id)).join(models.Field)
+    min_yield: Optional[float] = None,
+    max_yield: Optional[float] = None,
+    model_version_id: Optional[int] = None,
+    cursor: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    One page of list items, already shaped for the response, and the total
+    number of matches.
+
+    The filtered ID scan pages itself and only the page's rows are then
+    projected (no ORM objects), so the wide columns, the latest-prediction
+    lookup and the event count are computed for ``limit`` rows at most. The
+    prediction columns come from each row's newest prediction, restricted
+    to ``model_version_id`` when given.
+
+    With ``cursor`` (the field_season_id of the last row already seen) the
+    page starts right after that row in list order and ``skip`` is ignored:
+    the scan drops earlier rows as it reads them and sorts only what is left
+    for a top-``limit`` cut, and rows inserted meanwhile don't shift the
+    page. (The sort key spans seasons and fields, so no single index serves
+    it; each page still reads the matches after the cursor.)
+
+    The total is a separate COUNT, cached with the reference data so that
+    following pages of the same filters don't repeat it; the writes that
+    invalidate reference data drop it too.
+    """
+    params = _filter_params(
+        crop=crop,
+        variety=variety,
+        season=season,
+        state=state,
+        county=county,
+        min_acres=min_acres,
+        max_acres=max_acres,
+        has_prediction=has_prediction,
+        min_yield=min_yield,
+        max_yield=max_yield,
+    )
+    shape = _filter_shape(params)
+    if cursor is not None:
+        skip = 0
+    stmt = _page_statement(shape, model_version_id is not None, cursor is not None)
+    values = _bind_values(params, skip=skip, limit=limit)
+    if model_version_id is not None:
+        values["model_version_id"] = model_version_id
+    if cursor is not None:
+        values["cursor"] = cursor
+
+    items = [dict(row) for row in db.execute(stmt, values).mappings()]
+    if not skip and cursor is None and len(items) < limit:
+        # A short first page already holds every match.
+        return items, len(items)
+    return items, _count_field_seasons(db, shape, params)
+
+
+def _count_field_seasons(db: Session, shape: frozenset, params: Dict[str, Any]) -> int:
+    key = f"{REFERENCE_PREFIX}:field_season_count:{json.dumps(params, sort_keys=True, default=str)}"
+    total = get_json_sync(key)
+    if total is None:
+        total = db.execute(_count_statement(shape), _bind_values(params)).scalar() or 0
+        set_json_sync(key, total)
+    return total
+
+
+def stream_export_rows(
+    db: Session,
+    chunk_size: int = 1000,
+    crop: Optional[str] = None,
+    variety: Optional[str] = None,
+    season: Optional[List[int]] = None,
+    state: Optional[str] = None,
+    county: Optional[str] = None,
+    min_acres: Optional[float] = None,
+    max_acres: Optional[float] = None,
+    has_prediction: Optional[bool] = None,
+    min_yield: Optional[float] = None,
+    max_yield: Optional[float] = None,
+) -> Iterator[Any]:
+    """Stream flat CSV export rows for every matching field-season.
+
+    One SELECT of plain columns through a server-side cursor, ``chunk_size``
+    rows at a time: the latest prediction comes from a LATERAL subquery and
+    the event count from a correlated COUNT, so no ORM objects or per-row
+    relationship loads are involved. Same filters and order as
+    list_and_count_field_seasons.
+    """
+    params = _filter_params(
+        crop=crop,
+        variety=variety,
+        season=season,
+        state=state,
+        county=county,
+        min_acres=min_acres,
+        max_acres=max_acres,
+        has_prediction=has_prediction,
+        min_yield=min_yield,
+        max_yield=max_yield,
+    )
+    result = db.execute(
+        _export_statement(_filter_shape(params)),
+        _bind_values(params),
+        execution_options={"yield_per": chunk_size},
+    )
+    return iter(result)
 
-    # Same explicit-ON-clause fix as get_field_seasons (above): without it,
-    # joining both Crop and Variety lets SQLAlchemy resolve the variety join
-    # via Crop.crop_id = Variety.crop_id, which collapses the variety filter
-    # to a no-op. Always pin the variety join to FieldSeason.variety_id and
-    # the crop join to FieldSeason.crop_id.
-    if crop:
-        query = query.join(
-            models.Crop, models.FieldSeason.crop_id == models.Crop.crop_id
-        ).filter(models.Crop.crop_name_en.ilike(crop))
-    if variety:
-        query = query.join(
-            models.Variety, models.FieldSeason.variety_id == models.Variety.variety_id
-        ).filter(models.Variety.variety_name_en.ilike(variety))
-    if season:
-        query = query.join(models.Season).filter(models.Season.season_year.in_(season))
-    if state:
-        query = query.filter(models.Field.state == state)
-    if county:
-        query = query.filter(models.Field.county == county)
-    if min_acres is not None:
-        query = query.filter(models.Field.acres >= min_acres)
-    if max_acres is not None:
-        query = query.filter(models.Field.acres <= max_acres)
-    if has_prediction is True:
-        query = query.join(models.ModelPrediction, isouter=True).filter(models.ModelPrediction.prediction_id != None)
-    elif has_prediction is False:
-        query = query.outerjoin(models.ModelPrediction).filter(models.ModelPrediction.prediction_id == None)
 
-    return query.scalar()
+def count_field_seasons(
+    db: Session,
+    crop: Optional[str] = None,
+    variety: Optional[str] = None,
+    season: Optional[List[int]] = None,
+    state: Optional[str] = None,
+    county: Optional[str] = None,
+    min_acres: Optional[float] = None,
+    max_acres: Optional[float] = None,
+    has_prediction: Optional[bool] = None,
+    min_yield: Optional[float] = None,
+    max_yield: Optional[float] = None,
+) -> int:
+    params = _filter_params(
+        crop=crop,
+        variety=variety,
+        season=season,
+        state=state,
+        county=county,
+        min_acres=min_acres,
+        max_acres=max_acres,
+        has_prediction=has_prediction,
+        min_yield=min_yield,
+        max_yield=max_yield,
+    )
+    return db.execute(_count_statement(_filter_shape(params)), _bind_values(params)).scalar()
 
 
 def get_field_season_with_details(
     db: Session, field_season_id: int
 ) -> Optional[models.FieldSeason]:
-    from sqlalchemy.orm import joinedload
+    from sqlalchemy.orm import joinedload, selectinload
+    # Many-to-ones ride along on the main row; each collection gets its own
+    # IN query rather than being joined, which would multiply events by
+    # predictions in a single result set.
     return (
         db.query(models.FieldSeason)
         .options(
@@ -303,8 +643,9 @@ def get_field_season_with_details(
             joinedload(models.FieldSeason.crop),
             joinedload(models.FieldSeason.variety),
             joinedload(models.FieldSeason.season),
-            joinedload(models.FieldSeason.management_events),
-            joinedload(models.FieldSeason.predictions),
+            selectinload(models.FieldSeason.management_events),
+            selectinload(models.FieldSeason.predictions).joinedload(models.ModelPrediction.model_version),
+            *_strict_loading(),
         )
         .filter(models.FieldSeason.field_season_id == field_season_id)
         .first()
@@ -573,6 +914,45 @@ def get_latest_prediction_for_field_season(
     )
 
 
+def get_backfill_candidates(
+    db: Session,
+    model_version_id: int,
+    after_id: Optional[int] = None,
+    limit: int = 1000,
+    with_total: bool = False,
+) -> List[Any]:
+    """
+    Next page of field-season IDs with no prediction from ``model_version_id``.
+
+    Keyset-paginated on field_season_id (pass the last ID of the previous
+    page as ``after_id``), so every page costs the same however deep the
+    backfill is. With ``with_total`` each row also carries the number of
+    candidates remaining from ``after_id`` on, computed before the LIMIT;
+    that needs a pass over all of them, so only ask for it once.
+    """
+    already_predicted = exists().where(
+        models.ModelPrediction.field_season_id == models.FieldSeason.field_season_id,
+        models.ModelPrediction.model_version_id == model_version_id,
+    )
+    columns = [models.FieldSeason.field_season_id]
+    if with_total:
+        columns.append(func.count().over().label("remaining"))
+
+    # The same inner joins _hydrate_backfill_rows applies, so a row missing
+    # its field, crop or season isn't offered (and counted as failed) again
+    # on every run.
+    query = (
+        db.query(*columns)
+        .join(models.Field, models.FieldSeason.field_id == models.Field.field_id)
+        .join(models.Crop, models.FieldSeason.crop_id == models.Crop.crop_id)
+        .join(models.Season, models.FieldSeason.season_id == models.Season.season_id)
+        .filter(~already_predicted)
+    )
+    if after_id is not None:
+        query = query.filter(models.FieldSeason.field_season_id > after_id)
+    return query.order_by(models.FieldSeason.field_season_id.asc()).limit(limit).all()
+
+
 # ==================== Regional Stats ====================
 
 def get_regional_yield_stats(
@@ -656,26 +1036,11 @@ def get_variety_comparison(
 
 # ==================== Overview ====================
 
-def get_overview_stats(
-    db: Session,
-    model_type: Optional[str] = None,
-    require_observed: bool = False,
-) -> Dict[str, Any]:
-    """
-    Get overall statistics for the dashboard.
-
-    When `require_observed` is True, the prediction_stats block is scoped
-    to predictions whose joined FieldSeason has a non-null `yield_bu_ac`.
-    That keeps the headline numbers (Total Predictions, Max / Min / Avg
-    Predicted, coverage count) consistent with the Predicted-vs-Observed
-    scatter — which only plots field-seasons that have BOTH a stored
-    prediction AND an observed harvest. Default is False so the Overview
-    tab's aggregate "everything we've predicted" framing is preserved.
-    """
+def _overview_base_stats(db: Session) -> Dict[str, Any]:
+    """The overview's field/season totals and filter lists, computed live."""
     total_fields = db.query(func.count(models.Field.field_id)).scalar()
     total_field_seasons = db.query(func.count(models.FieldSeason.field_season_id)).scalar()
-    total_acres_raw = db.query(func.sum(models.Field.acres)).scalar()
-    total_acres = float(total_acres_raw) if total_acres_raw is not None else 0.0
+    total_acres = db.query(func.sum(models.Field.acres)).scalar()
 
     seasons = (
         db.query(models.Season.season_year)
@@ -713,6 +1078,96 @@ def get_overview_stats(
         func.avg(models.FieldSeason.yield_bu_ac),
     ).filter(models.FieldSeason.yield_bu_ac.isnot(None)).first()
 
+    return _overview_base_dict(
+        total_fields=total_fields,
+        total_field_seasons=total_field_seasons,
+        total_acres=total_acres,
+        seasons_available=seasons_available,
+        crops_available=crops_available,
+        states_available=states_available,
+        yield_min=yield_range[0],
+        yield_max=yield_range[1],
+        yield_avg=yield_range[2],
+    )
+
+
+def _overview_base_dict(
+    total_fields, total_field_seasons, total_acres, seasons_available,
+    crops_available, states_available, yield_min, yield_max, yield_avg,
+) -> Dict[str, Any]:
+    return {
+        "total_field_seasons": total_field_seasons or 0,
+        "total_fields": total_fields or 0,
+        "total_acres": float(total_acres) if total_acres is not None else 0.0,
+        "seasons_available": list(seasons_available or []),
+        "crops_available": list(crops_available or []),
+        "states_available": list(states_available or []),
+        "yield_range": {
+            "min": float(yield_min) if yield_min else 0.0,
+            "max": float(yield_max) if yield_max else 0.0,
+            "avg": float(yield_avg) if yield_avg else 0.0,
+        },
+    }
+
+
+def _overview_snapshot(db: Session) -> Optional[Dict[str, Any]]:
+    """
+    The same figures as _overview_base_stats, read from the
+    mv_overview_stats materialized view (migration 005) in one row lookup.
+    None when the view isn't there, e.g. on a database built without the
+    migrations; the savepoint keeps that failure out of the caller's
+    transaction.
+    """
+    try:
+        with db.begin_nested():
+            row = db.execute(
+                text(
+                    "SELECT total_fields, total_field_seasons, total_acres, seasons_available, "
+                    "crops_available, states_available, yield_min, yield_max, yield_avg "
+                    "FROM mv_overview_stats"
+                )
+            ).mappings().first()
+    except DBAPIError:
+        return None
+    return _overview_base_dict(**row) if row else None
+
+
+def refresh_overview_stats() -> None:
+    """
+    Recompute mv_overview_stats after field/season data changes, then drop
+    cached reference responses built from the old snapshot. CONCURRENTLY
+    keeps the old snapshot readable meanwhile. A missing view is logged, not
+    raised: the overview then computes its figures live. Meant to run as a
+    background task after the writing request has committed.
+    """
+    from .session import engine
+
+    try:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_overview_stats"))
+    except DBAPIError as e:
+        logger.warning("Could not refresh mv_overview_stats: %s", e)
+    delete_pattern_sync()
+
+
+def get_overview_stats(
+    db: Session,
+    model_type: Optional[str] = None,
+    require_observed: bool = False,
+) -> Dict[str, Any]:
+    """
+    Get overall statistics for the dashboard.
+
+    When `require_observed` is True, the prediction_stats block is scoped
+    to predictions whose joined FieldSeason has a non-null `yield_bu_ac`.
+    That keeps the headline numbers (Total Predictions, Max / Min / Avg
+    Predicted, coverage count) consistent with the Predicted-vs-Observed
+    scatter — which only plots field-seasons that have BOTH a stored
+    prediction AND an observed harvest. Default is False so the Overview
+    tab's aggregate "everything we've predicted" framing is preserved.
+    """
+    base = _overview_snapshot(db) or _overview_base_stats(db)
+
     # Prediction statistics:
     # - model_predictions: field-season level predictions (used for coverage)
     # - prediction_runs: ad-hoc saved prediction requests (wizard/history)
@@ -825,17 +1280,4 @@ def get_overview_stats(
         "prediction_runs_total": int(prediction_runs_total),
     }
 
-    return {
-        "total_field_seasons": total_field_seasons or 0,
-        "total_fields": total_fields or 0,
-        "total_acres": total_acres,
-        "seasons_available": seasons_available,
-        "crops_available": crops_available,
-        "states_available": states_available,
-        "yield_range": {
-            "min": float(yield_range[0]) if yield_range[0] else 0.0,
-            "max": float(yield_range[1]) if yield_range[1] else 0.0,
-            "avg": float(yield_range[2]) if yield_range[2] else 0.0,
-        },
-        "prediction_stats": prediction_stats,
-    }
+    return {**base, "prediction_stats": prediction_stats}
@@ -32,6 +32,12 @@ class Field(Base):
     # Relationships
     field_seasons = relationship("FieldSeason", back_populates="field")
 
+    __table_args__ = (
+        # Equality filters first, the acres range last, so the list filters
+        # can use one index range scan.
+        Index('idx_fields_state_county_acres', 'state', 'county', 'acres'),
+    )
+
 
 class Crop(Base):
     """
@@ -65,6 +71,7 @@ class Variety(Base):
 
     __table_args__ = (
         UniqueConstraint('variety_name_en', 'crop_id', name='uq_variety_crop'),
+        Index('idx_varieties_crop_active', 'crop_id', 'is_active'),
     )
 
 
@@ -127,12 +134,24 @@ class FieldSeason(Base):
     crop = relationship("Crop", back_populates="field_seasons")
     variety = relationship("Variety", back_populates="field_seasons")
     season = relationship("Season", back_populates="field_seasons")
-    management_events = relationship("ManagementEvent", back_populates="field_season", cascade="all, delete-orphan")
+    # Timeline order, sorted by the database wherever the collection loads.
+    # Events with neither date come first.
+    management_events = relationship(
+        "ManagementEvent",
+        back_populates="field_season",
+        cascade="all, delete-orphan",
+        order_by=lambda: (
+            func.coalesce(ManagementEvent.start_date, ManagementEvent.created_at).nulls_first(),
+            ManagementEvent.event_id,
+        ),
+    )
     predictions = relationship("ModelPrediction", back_populates="field_season")
 
     __table_args__ = (
         UniqueConstraint('field_id', 'crop_id', 'variety_id', 'season_id', name='uq_field_season'),
         Index('idx_field_seasons_yield', 'yield_bu_ac'),
+        Index('idx_field_seasons_season_crop', 'season_id', 'crop_id', 'field_season_id'),
+        Index('idx_field_seasons_season_crop_variety', 'season_id', 'crop_id', 'variety_id'),
     )
 
 
@@ -284,6 +303,14 @@ class ModelPrediction(Base):
         UniqueConstraint('field_season_id', 'model_version_id', name='uq_prediction_field_model'),
         Index('idx_model_predictions_field_season', 'field_season_id'),
         Index('idx_model_predictions_model', 'model_version_id'),
+        # Covering indexes: the backfill anti-join and the export's
+        # latest-prediction lookup are answered from the index alone.
+        Index('idx_model_predictions_model_field', 'model_version_id', 'field_season_id'),
+        Index(
+            'idx_model_predictions_field_created',
+            'field_season_id', 'created_at',
+            postgresql_include=['predicted_yield', 'confidence_lower', 'confidence_upper', 'regional_avg_yield'],
+        ),
     )
 
 
@@ -395,3 +422,20 @@ class ExportLog(Base):
     record_count = Column(Integer)
     file_size_bytes = Column(Integer)
     exported_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class PredictionLog(Base):
+    """
+    Append-only log of served predictions, for monitoring and future
+    training. Written in batches with COPY by app.services.prediction_log.
+    """
+    __tablename__ = "prediction_logs"
+
+    log_id = Column(BigInteger, primary_key=True)
+    model_version_tag = Column(String(100), nullable=False)
+    crop = Column(String(120))
+    variety = Column(String(200))
+    season = Column(Integer)
+    predicted_yield = Column(DECIMAL(8, 3))
+    request_payload = Column(JSON)
+    logged_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,8 +1,8 @@
 """
 Pydantic schemas for request/response validation
 """
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import Optional, List, Dict, Any, ClassVar, Tuple
 from datetime import datetime, date
 
 
@@ -233,6 +233,24 @@ class PredictionRequest(BaseSchema):
     diammonium_phosphate_lbN_per_ac: Optional[float] = None
     diammonium_phosphate_lbP_per_ac: Optional[float] = None
 
+    # Field names in declaration order; set below once the class exists.
+    FEATURE_FIELDS: ClassVar[Tuple[str, ...]] = ()
+
+    def feature_dict(self) -> Dict[str, Any]:
+        """
+        The provided (non-null) fields as a plain dict. Same result as
+        model_dump(exclude_none=True), and already JSON-ready since every
+        field is a str or number, without walking the schema per request.
+        """
+        return {
+            name: value
+            for name in self.FEATURE_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
+
+
+PredictionRequest.FEATURE_FIELDS = tuple(PredictionRequest.model_fields)
+
 
 class FeatureContribution(BaseSchema):
     feature: str
@@ -357,6 +375,24 @@ class ModelVersionResponse(ModelVersionBase):
 
     model_config = ConfigDict(from_attributes=True, protected_namespaces=())
 
+    @field_validator("performance_metrics", mode="before")
+    @classmethod
+    def _numeric_metrics(cls, value: Any) -> Dict[str, Any]:
+        # Stored metrics may hold strings or nested dicts; only numbers are reported.
+        if not isinstance(value, dict):
+            return {}
+        return {k: v for k, v in value.items() if isinstance(v, (int, float))}
+
+    @field_validator("model_params", mode="before")
+    @classmethod
+    def _default_params(cls, value: Any) -> Dict[str, Any]:
+        return value or {}
+
+    @field_validator("feature_list", mode="before")
+    @classmethod
+    def _default_features(cls, value: Any) -> List[str]:
+        return value or []
+
 
 class ModelVersionDetailResponse(ModelVersionResponse):
     training_runs: Optional[List[Dict[str, Any]]] = None
@@ -465,6 +501,7 @@ class PaginatedResponse(BaseSchema):
     page: int
     limit: int
     pages: int
+    next_cursor: Optional[int] = None  # pass back as `cursor` for the next page
 
 
 # Health check
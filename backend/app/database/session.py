@@ -1,7 +1,7 @@
 """
 Database session management
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 from typing import Generator
 import os
@@ -19,6 +19,23 @@ engine = create_engine(
 # SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Long-running admin jobs (training, backfills) get their own small pool so
+# they can't starve request handlers of connections.
+admin_engine = create_engine(
+    settings.database_url,
+    pool_size=2,
+    max_overflow=2,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+    echo=settings.debug,
+)
+AdminJobSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=admin_engine,
+)
+
 # Base for declarative models
 Base = declarative_base()
 
@@ -32,4 +49,14 @@ def get_db() -> Generator:
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def ping_database() -> None:
+    """
+    Round-trip a SELECT 1 on a pooled connection in autocommit mode, so a
+    health check opens no session or transaction. Raises if the database
+    is unreachable.
+    """
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("SELECT 1"))
\ No newline at end of file
@@ -3,10 +3,12 @@ TraitHarvest Backend - FastAPI Application
 """
 from fastapi import FastAPI, Depends, HTTPException, status, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from sqlalchemy import text
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+import threading
 import time
 import logging
+from contextlib import asynccontextmanager
 
 from app.config import settings
 from app.database.session import engine, Base
@@ -23,6 +25,9 @@ from app.api.v1.routers import (
 )
 from app.api.admin import router as admin_router
 from app.core.exceptions import NutritionAIError
+from app.ml.batcher import start_batcher, stop_batcher
+from app.ml.predictor import warm_production_predictor
+from app.services.prediction_log import start_prediction_log_writer, stop_prediction_log_writer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -31,12 +36,26 @@ logger = logging.getLogger(__name__)
 # Create tables (in production use Alembic migrations)
 # Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start_batcher()
+    start_prediction_log_writer()
+    # Off the loop, so a slow model load doesn't hold up startup.
+    threading.Thread(target=warm_production_predictor, name="model-warmup", daemon=True).start()
+    yield
+    stop_batcher()
+    stop_prediction_log_writer()
+
+
 app = FastAPI(
     title="TraitHarvest API",
     description="Agricultural yield prediction platform",
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 def _parse_cors_origins(raw: str) -> list[str]:
@@ -60,6 +79,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON/CSV bodies for clients that accept gzip; the field-season
+# list and exports shrink several-fold. Tiny bodies aren't worth it.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 
 # Exception handlers
 @app.exception_handler(NutritionAIError)
@@ -90,14 +113,12 @@ async def add_process_time_header(request: Request, call_next):
 
 # Health check
 @app.get("/health", tags=["health"])
-async def health_check():
+def health_check():
     """Basic health check endpoint."""
     try:
         # Test database connection
-        from app.database.session import SessionLocal
-        db = SessionLocal()
-        db.execute(text("SELECT 1"))
-        db.close()
+        from app.database.session import ping_database
+        ping_database()
         db_status = "healthy"
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
@@ -0,0 +1,140 @@
+"""
+Micro-batching for single-record predictions.
+
+Concurrent /predictions requests each hand their enriched payload to one
+worker thread, which waits up to batch_timeout_ms for more to arrive (or
+until max_batch_size are queued) and runs them through a single
+PredictionService.predict_batch call per model version on the shared
+predictor for that version.
+"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.ml.predictor import get_predictor
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionBatcher:
+    """Coalesce concurrent predict() calls into batched model calls."""
+
+    def __init__(self, max_batch_size: int, batch_timeout_ms: int):
+        self.max_batch_size = max_batch_size
+        self.batch_timeout = batch_timeout_ms / 1000.0
+        self._queue: "queue.Queue[Optional[Tuple[Dict[str, Any], Any, Future]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="prediction-batcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def predict(self, payload: Dict[str, Any], model_version) -> Dict[str, Any]:
+        """
+        Same result shape as PredictionService.predict; blocks the calling
+        (threadpool) thread until the batch holding this payload has run.
+        """
+        future: Future = Future()
+        self._queue.put((payload, model_version, future))
+        return future.result()
+
+    def _collect(self, first) -> List[Tuple[Dict[str, Any], Any, Future]]:
+        batch = [first]
+        deadline = time.monotonic() + self.batch_timeout
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                # Shut down after this batch.
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = self._collect(first)
+            by_version: Dict[str, List[Tuple[Dict[str, Any], Any, Future]]] = {}
+            for item in batch:
+                by_version.setdefault(item[1].version_tag, []).append(item)
+            for items in by_version.values():
+                self._run_group(items)
+
+    def _run_group(self, items) -> None:
+        model_version = items[0][1]
+        try:
+            predictor = get_predictor(model_version)
+        except Exception as e:
+            for _, _, future in items:
+                future.set_exception(e)
+            return
+        try:
+            outputs = predictor.predict_batch(
+                [payload for payload, _, _ in items],
+                model_version,
+                with_features=True,
+            )
+        except Exception as e:
+            if len(items) == 1:
+                items[0][2].set_exception(e)
+                return
+            # One bad row fails the stacked call; retry each on its own so
+            # only the offending requests see the error.
+            logger.warning(f"Batched prediction fell back to per-row calls: {e}")
+            for payload, mv, future in items:
+                try:
+                    future.set_result(predictor.predict(payload, mv))
+                except Exception as row_error:
+                    future.set_exception(row_error)
+            return
+
+        for i, (_, _, future) in enumerate(items):
+            future.set_result({
+                'predicted_yield': float(outputs['predicted_yield'][i]),
+                'confidence_lower': float(outputs['confidence_lower'][i]),
+                'confidence_upper': float(outputs['confidence_upper'][i]),
+                'confidence_level': outputs['confidence_level'],
+                'features': outputs['features'][i],
+                'base_value': outputs['base_value'],
+            })
+
+
+_BATCHER: Optional[PredictionBatcher] = None
+
+
+def start_batcher() -> None:
+    """Start the process-wide batcher; a no-op when max_batch_size <= 1."""
+    global _BATCHER
+    if settings.max_batch_size > 1 and _BATCHER is None:
+        _BATCHER = PredictionBatcher(settings.max_batch_size, settings.batch_timeout_ms)
+        _BATCHER.start()
+
+
+def stop_batcher() -> None:
+    global _BATCHER
+    if _BATCHER is not None:
+        _BATCHER.stop()
+        _BATCHER = None
+
+
+def get_batcher() -> Optional[PredictionBatcher]:
+    return _BATCHER
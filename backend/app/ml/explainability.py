@@ -1,14 +1,30 @@
 """
 Explainability engine - SHAP values and feature importance
 """
+import threading
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
 import shap
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Loaded model, feature list, TreeExplainer and median-output index per
+# model version, shared by every engine in the process. Building a
+# TreeExplainer walks the whole ensemble, and loading reads the artifacts
+# from disk; neither should happen per request. KernelExplainer fallbacks
+# depend on the request's data and are never cached.
+_EXPLAINER_CACHE: "OrderedDict[str, Tuple[Any, List[str], Any, Optional[int]]]" = OrderedDict()
+_EXPLAINER_CACHE_SIZE = 8
+_EXPLAINER_LOCK = threading.Lock()
+
+
+def clear_explainer_cache() -> None:
+    with _EXPLAINER_LOCK:
+        _EXPLAINER_CACHE.clear()
+
 
 class ExplainabilityEngine:
     """
@@ -116,10 +132,16 @@ class ExplainabilityEngine:
                 - top_features: List of dicts with feature name, value, shap value, direction, importance
                 - base_value: Expected value (mean prediction on background data)
         """
-        # Load the model
-        model, feature_list, metadata = self.predictor.registry.load_model(
-            model_version.version_tag
-        )
+        version_tag = model_version.version_tag
+        with _EXPLAINER_LOCK:
+            cached = _EXPLAINER_CACHE.get(version_tag)
+            if cached is not None:
+                _EXPLAINER_CACHE.move_to_end(version_tag)
+        if cached is not None:
+            model, feature_list, self._explainer, self._median_output_idx = cached
+            self._current_model_tag = version_tag
+        else:
+            model, feature_list, metadata = self.predictor.registry.load_model(version_tag)
 
         # Prepare features in correct format
         if isinstance(features, dict):
@@ -136,9 +158,16 @@ class ExplainabilityEngine:
         self._background_data = X.copy()
 
         # Create explainer (cache for performance)
-        if self._explainer is None or self._current_model_tag != model_version.version_tag:
+        if self._explainer is None or self._current_model_tag != version_tag:
             self._explainer = self._get_explainer(model)
-            self._current_model_tag = model_version.version_tag
+            self._current_model_tag = version_tag
+            if isinstance(self._explainer, shap.TreeExplainer):
+                with _EXPLAINER_LOCK:
+                    _EXPLAINER_CACHE[version_tag] = (
+                        model, feature_list, self._explainer, self._median_output_idx
+                    )
+                    while len(_EXPLAINER_CACHE) > _EXPLAINER_CACHE_SIZE:
+                        _EXPLAINER_CACHE.popitem(last=False)
 
         # CatBoost requires categorical features to be int or string when
         # building a Pool. The values reaching us here have been round-tripped
@@ -38,7 +38,9 @@ class FeatureEngineer:
         self.county_avgs = None
 
     def safe_divide(self, a: float, b: float, default: float = 0.0) -> float:
-        """Safely divide, returning default if divisor is 0."""
+        """Safely divide, returning default if divisor is 0 (elementwise for Series)."""
+        if isinstance(b, pd.Series):
+            return (a / b).where(b != 0, default)
         return a / b if b != 0 else default
 
     def calculate_nutrient_ratios(self, df: pd.DataFrame) -> pd.DataFrame:
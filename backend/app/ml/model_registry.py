@@ -730,6 +730,11 @@ class ModelRegistry:
                 import shutil
                 shutil.rmtree(version_dir)
 
+            # A later model saved under the same tag must not reuse the old
+            # cached explainer.
+            from app.ml.explainability import clear_explainer_cache
+            clear_explainer_cache()
+
             logger.info(f"Model version {version_tag} deleted.")
             return True
         except Exception as e:
@@ -2,17 +2,39 @@
 Prediction service - loads model and makes predictions
 """
 import os
+import threading
+import time
+from functools import lru_cache
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Union
 from sqlalchemy.orm import Session
 import logging
 
+from app.config import settings
+from app.database import crud
+from app.database.session import SessionLocal
 from app.ml.model_registry import ModelRegistry
 from app.ml.features import FeatureEngineer, prepare_single_record_for_prediction
 
 logger = logging.getLogger(__name__)
 
+# Model classes that evaluate in float32 regardless of input dtype: CatBoost
+# and XGBoost quantize/convert features to float32, sklearn trees compare
+# against float32 thresholds. LightGBM bins in float64 and the torch wrapper
+# scales its inputs itself, so neither is listed.
+_FLOAT32_MODEL_CLASSES = frozenset({
+    "CatBoost",
+    "CatBoostRegressor",
+    "CatBoostMultiQuantileWrapper",
+    "XGBRegressor",
+    "DecisionTreeRegressor",
+    "RandomForestRegressor",
+    "ExtraTreesRegressor",
+})
+# Largest |float32 - float64| prediction difference (bu/ac) still treated as parity.
+_FLOAT32_PARITY_TOLERANCE = 1e-3
+
 
 class PredictionService:
     """
@@ -33,6 +55,9 @@ class PredictionService:
         self._feature_list = None
         self._metadata = None
         self._model_version = None
+        # Whether numeric inputs go to the model as float32; decided by a
+        # parity check on the first frame after each model load.
+        self._float32_inputs: Optional[bool] = None
 
     def load_production_model(self):
         """
@@ -48,6 +73,7 @@ class PredictionService:
             self._feature_list = feature_list
             self._metadata = metadata
             self._model_version = mv
+            self._float32_inputs = None
 
             logger.info(f"Loaded production model: {mv.version_tag}")
         return self._model
@@ -60,26 +86,9 @@ class PredictionService:
             self.load_production_model()
         return self._model_version
 
-    def predict(
-        self,
-        input_data: Dict[str, Any],
-        model_version=None
-    ) -> Dict[str, Any]:
+    def _ensure_model(self, model_version=None) -> None:
         """
-        Make a prediction for a single field-season.
-
-        Args:
-            input_data: Dictionary with input features
-                Required keys: crop, acres, lat, long, season, totalN_per_ac, totalP_per_ac, totalK_per_ac
-                Optional: variety, state, county, water_applied_mm, event_count
-            model_version: ModelVersion object (optional, will use production if None)
-
-        Returns:
-            Dict with:
-                - predicted_yield: float
-                - confidence_lower: float
-                - confidence_upper: float
-                - features: Feature vector used (for explainability)
+        Make sure the requested model version (or production) is loaded.
         """
         # Load model if not cached
         if self._model is None:
@@ -90,6 +99,7 @@ class PredictionService:
                 self._feature_list = feature_list
                 self._metadata = metadata
                 self._model_version = model_version
+                self._float32_inputs = None
             else:
                 self.load_production_model()
         else:
@@ -100,31 +110,53 @@ class PredictionService:
                 self._feature_list = feature_list
                 self._metadata = metadata
                 self._model_version = model_version
+                self._float32_inputs = None
 
-        # 1. Prepare input DataFrame (single row)
-        df_input = pd.DataFrame([input_data])
+    def _input_aliases(self) -> Dict[str, str]:
         preprocessing = self._metadata.get('preprocessing', {}) if self._metadata else {}
-
         # Add common aliases for externally provided model features.
         aliases = {
             "crop": "crop_name_en",
             "variety": "variety_name_en",
         }
         aliases.update(preprocessing.get("input_aliases", {}))
-        for src, dst in aliases.items():
+        return aliases
+
+    def _records_frame(self, records: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Stack per-request payloads whose keys differ into one input frame.
+
+        Aliases are applied per record, since one payload may send the
+        alias and another the canonical name. A key a payload omits is left
+        as NaN: engineering treats it as absent (a 0.0 ``_freq``) and
+        _build_feature_frame fills the 0.0 / "Missing" defaults afterwards,
+        exactly as it does for a lone record.
+        """
+        aliases = self._input_aliases()
+        rows = []
+        for record in records:
+            row = dict(record)
+            for src, dst in aliases.items():
+                if src in row and dst not in row:
+                    row[dst] = row[src]
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+    def _build_feature_frame(self, df_input: pd.DataFrame) -> pd.DataFrame:
+        """
+        Turn raw input rows into the model's feature matrix (one row per input).
+        """
+        df_input = df_input.copy()
+        preprocessing = self._metadata.get('preprocessing', {}) if self._metadata else {}
+
+        for src, dst in self._input_aliases().items():
             if src in df_input.columns and dst not in df_input.columns:
                 df_input[dst] = df_input[src]
 
         # 2. Basic feature engineering (skip for external models with pre-defined feature schema)
         skip_engineering = preprocessing.get("skip_feature_engineering", False) or preprocessing.get("external_model", False)
         if not skip_engineering:
-            df_input = self.feature_engineer.calculate_nutrient_ratios(df_input)
-            df_input = self.feature_engineer.calculate_intensity_features(df_input)
-            df_input = self.feature_engineer.create_interactions(df_input)
-
-            # 3. Encode categoricals - for inference, we need to apply the same encoding as training
-            # For now, use frequency encoding (simple). In production, we'd store target encodings.
-            df_input = self.feature_engineer.encode_categoricals(df_input, method='frequency')
+            df_input = self._engineer_features(df_input)
 
         # 4. Ensure we have all required features and in the correct order
         # Align columns to feature_list
@@ -206,17 +238,80 @@ class PredictionService:
                             "values (predictions will likely collapse): %s", e
                         )
 
+        # Numerics stay float64 (the training dtype) unless float32 was asked
+        # for and this model is shown to give the same predictions with it.
+        # Categoricals keep their str/int64 encoding.
+        if settings.inference_dtype == "float32":
+            numeric_cols = [c for c in self._feature_list if c not in categorical_features]
+            if numeric_cols and self._float32_parity(X, numeric_cols):
+                X[numeric_cols] = X[numeric_cols].astype(np.float32)
+
+        return X
+
+    def _float32_parity(self, X: pd.DataFrame, numeric_cols: list) -> bool:
+        """
+        Whether this model may take float32 numerics. Checked once per loaded
+        model: the first frame is predicted with both dtypes and float32 is
+        kept only if every prediction agrees within _FLOAT32_PARITY_TOLERANCE.
+        """
+        if self._float32_inputs is None:
+            model_class = self._model.__class__.__name__
+            if model_class not in _FLOAT32_MODEL_CLASSES:
+                self._float32_inputs = False
+            else:
+                X32 = X.copy()
+                X32[numeric_cols] = X32[numeric_cols].astype(np.float32)
+                try:
+                    p64 = np.asarray(self._model.predict(X), dtype=float).reshape(-1)
+                    p32 = np.asarray(self._model.predict(X32), dtype=float).reshape(-1)
+                    max_diff = float(np.max(np.abs(p64 - p32))) if len(p64) else 0.0
+                except Exception as e:
+                    logger.warning("float32 parity check failed for %s; using float64: %s", model_class, e)
+                    max_diff = float("inf")
+                self._float32_inputs = max_diff <= _FLOAT32_PARITY_TOLERANCE
+                if not self._float32_inputs:
+                    logger.warning(
+                        "%s predictions differ by %.6f between float32 and float64 inputs; using float64",
+                        model_class,
+                        max_diff,
+                    )
+        return self._float32_inputs
+
+    def _engineer_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = self.feature_engineer.calculate_nutrient_ratios(df)
+        df = self.feature_engineer.calculate_intensity_features(df)
+        df = self.feature_engineer.create_interactions(df)
+
+        # 3. Encode categoricals - for inference, we need to apply the same encoding as training
+        # For now, use frequency encoding (simple). In production, we'd store target encodings.
+        # Frequencies over the request frame would make a row's features
+        # depend on the rest of its batch, so use the value a lone record
+        # gets: 1.0 for any present category, 0.0 for a missing one.
+        df = df.copy()
+        for col in self.feature_engineer.categorical_columns:
+            if col in df.columns:
+                df[f'{col}_freq'] = df[col].notna().astype(float)
+        return df
+
+    def _predict_frame(self, df_input: pd.DataFrame, X: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Run the loaded model over a feature matrix and post-process the outputs.
+
+        Returns a dict of aligned 1-D arrays (predicted_yield, confidence_lower,
+        confidence_upper) plus the scalar confidence_level.
+        """
+        preprocessing = self._metadata.get('preprocessing', {}) if self._metadata else {}
+
         # 5. Predict (point estimate + optional input-dependent uncertainty)
-        predicted_yield = float(self._model.predict(X)[0])
+        predicted_yield = np.asarray(self._model.predict(X), dtype=float).reshape(-1)
 
         # Try to obtain input-dependent prediction bounds from the model itself.
         # Two supported sources:
         #   - CatBoost quantile ensembles expose .predict_quantiles(X) -> {q: array}
         #   - Deep-learning uncertainty heads expose .predict_with_uncertainty(X) -> (mean, log_var)
-        raw_lower: Optional[float] = None
-        raw_upper: Optional[float] = None
-        raw_median: Optional[float] = None
-        raw_sigma: Optional[float] = None  # standardized space sigma (DL only)
+        raw_lower: Optional[np.ndarray] = None
+        raw_upper: Optional[np.ndarray] = None
+        raw_median: Optional[np.ndarray] = None
         # Fraction of the predictive distribution covered by [lower, upper].
         # Carried through so the frontend can label intervals honestly (a
         # CatBoost ensemble trained on q=0.05/q=0.95 gives a 90% interval,
@@ -230,12 +325,12 @@ class PredictionService:
                 if qpreds:
                     qkeys = sorted(qpreds.keys())
                     # Lower = smallest quantile, upper = largest, median = closest to 0.5.
-                    low_pred = float(qpreds[qkeys[0]][0])
-                    high_pred = float(qpreds[qkeys[-1]][0])
+                    low_pred = np.asarray(qpreds[qkeys[0]], dtype=float).reshape(-1)
+                    high_pred = np.asarray(qpreds[qkeys[-1]], dtype=float).reshape(-1)
                     # Tree-based quantile models don't guarantee monotonicity across
                     # quantiles per input, so enforce it here.
-                    raw_lower = min(low_pred, high_pred)
-                    raw_upper = max(low_pred, high_pred)
+                    raw_lower = np.minimum(low_pred, high_pred)
+                    raw_upper = np.maximum(low_pred, high_pred)
                     # Pick the point estimate. Most quantile models use the median
                     # (p50). Model v6 onward asked us to use the midpoint between
                     # the outer quantiles (avg of p10/p90) — the engineer found
@@ -252,18 +347,19 @@ class PredictionService:
                         raw_median = (raw_lower + raw_upper) / 2.0
                     else:
                         median_q = min(qkeys, key=lambda q: abs(q - 0.5))
-                        raw_median = float(qpreds[median_q][0])
+                        raw_median = np.asarray(qpreds[median_q], dtype=float).reshape(-1)
                     # e.g. q ∈ {0.05, 0.5, 0.95} → coverage = 0.90.
                     confidence_level = float(qkeys[-1] - qkeys[0])
             except Exception as e:
+                raw_lower = raw_upper = raw_median = None
                 logger.warning(f"predict_quantiles failed; falling back to RMSE bounds: {e}")
         elif hasattr(self._model, "predict_with_uncertainty"):
             try:
                 uq = self._model.predict_with_uncertainty(X)
                 if uq is not None:
                     mean_arr, var_arr = uq
-                    mean_val = float(mean_arr[0])
-                    raw_second = float(var_arr[0])
+                    mean_val = np.asarray(mean_arr, dtype=float).reshape(-1)
+                    raw_second = np.asarray(var_arr, dtype=float).reshape(-1)
                     # The interpretation of the network's second output depends on how the
                     # model was trained. Configurable via params.json or features.preprocessing:
                     #   "uncertainty_output": "log_variance" | "variance" | "std"
@@ -279,26 +375,24 @@ class PredictionService:
                     )
                     if uncertainty_kind == "log_variance":
                         # Clamp to avoid overflow on extreme log-variance values.
-                        clamped = max(min(raw_second, 20.0), -20.0)
-                        sigma = float(np.sqrt(np.exp(clamped)))
+                        sigma = np.sqrt(np.exp(np.clip(raw_second, -20.0, 20.0)))
                     elif uncertainty_kind == "variance":
-                        sigma = float(np.sqrt(max(raw_second, 0.0)))
+                        sigma = np.sqrt(np.maximum(raw_second, 0.0))
                     elif uncertainty_kind == "std":
-                        sigma = float(abs(raw_second))
+                        sigma = np.abs(raw_second)
                     else:
                         logger.warning(
                             f"Unknown uncertainty_output '{uncertainty_kind}'; falling back to log_variance."
                         )
-                        clamped = max(min(raw_second, 20.0), -20.0)
-                        sigma = float(np.sqrt(np.exp(clamped)))
+                        sigma = np.sqrt(np.exp(np.clip(raw_second, -20.0, 20.0)))
 
                     raw_median = mean_val
-                    raw_sigma = sigma
                     raw_lower = mean_val - 1.96 * sigma
                     raw_upper = mean_val + 1.96 * sigma
                     # mean ± 1.96·σ covers ~95% of a Gaussian.
                     confidence_level = 0.95
             except Exception as e:
+                raw_lower = raw_upper = raw_median = None
                 logger.warning(f"predict_with_uncertainty failed; falling back to RMSE bounds: {e}")
 
         if raw_median is not None:
@@ -317,26 +411,21 @@ class PredictionService:
                     raw_lower = raw_lower * ts_std + ts_mean
                 if raw_upper is not None:
                     raw_upper = raw_upper * ts_std + ts_mean
-                if raw_sigma is not None:
-                    raw_sigma = raw_sigma * ts_std
             except Exception as e:
                 logger.warning(f"Failed to apply target_scaler back-transform: {e}")
 
         # Optional back-transform for externally standardized targets.
-        # Apply the same affine transform to bounds (linearity preserves ordering),
-        # and scale sigma by std_crop for DL uncertainty.
-        std_crop_applied = 1.0
-        mean_crop_applied = 0.0
+        # Apply the same affine transform to bounds (linearity preserves ordering).
         if preprocessing.get("target_standardization") == "crop_zscore":
             crop_col = preprocessing.get("crop_column", "crop_name_en")
             crop_stats_file = preprocessing.get("crop_statistics_file")
-            crop_value = None
+            crop_values = None
             if crop_col in X.columns:
-                crop_value = str(X[crop_col].iloc[0])
-            elif "crop" in input_data:
-                crop_value = str(input_data["crop"])
+                crop_values = X[crop_col].astype(str)
+            elif "crop" in df_input.columns:
+                crop_values = df_input["crop"].astype(str)
 
-            if crop_stats_file and crop_value and self._model_version is not None:
+            if crop_stats_file and crop_values is not None and self._model_version is not None:
                 stats_path = os.path.join(
                     self.registry.models_dir,
                     self._model_version.version_tag,
@@ -344,21 +433,20 @@ class PredictionService:
                 )
                 if os.path.exists(stats_path):
                     try:
-                        crop_stats = pd.read_csv(stats_path)
-                        match = crop_stats[crop_stats["crop_name_en"] == crop_value]
-                        if not match.empty:
-                            mean_crop = float(match.iloc[0]["yield_mean_crop"])
-                            std_crop = float(match.iloc[0]["yield_std_crop"])
-                            std_crop = std_crop if std_crop != 0 else 1.0
-                            std_crop_applied = std_crop
-                            mean_crop_applied = mean_crop
-                            predicted_yield = predicted_yield * std_crop + mean_crop
-                            if raw_lower is not None:
-                                raw_lower = raw_lower * std_crop + mean_crop
-                            if raw_upper is not None:
-                                raw_upper = raw_upper * std_crop + mean_crop
-                            if raw_sigma is not None:
-                                raw_sigma = raw_sigma * std_crop
+                        crop_stats = pd.read_csv(stats_path).drop_duplicates("crop_name_en")
+                        crop_stats = crop_stats.set_index("crop_name_en")
+                        mean_crop = crop_values.map(crop_stats["yield_mean_crop"]).to_numpy(dtype=float)
+                        std_crop = crop_values.map(crop_stats["yield_std_crop"]).to_numpy(dtype=float)
+                        std_crop = np.where(std_crop == 0, 1.0, std_crop)
+                        # Rows whose crop has no stats entry are left untouched.
+                        matched = ~np.isnan(mean_crop)
+                        mean_crop = np.where(matched, mean_crop, 0.0)
+                        std_crop = np.where(matched, std_crop, 1.0)
+                        predicted_yield = predicted_yield * std_crop + mean_crop
+                        if raw_lower is not None:
+                            raw_lower = raw_lower * std_crop + mean_crop
+                        if raw_upper is not None:
+                            raw_upper = raw_upper * std_crop + mean_crop
                     except Exception as e:
                         logger.warning(f"Failed to apply crop z-score back-transform: {e}")
 
@@ -378,32 +466,70 @@ class PredictionService:
         # produce values that abort the entire batch commit. We log loudly so the
         # condition is visible rather than silently masking a real model issue.
         bound_limit = 9999.99
-        if (
-            abs(confidence_lower) > bound_limit
-            or abs(confidence_upper) > bound_limit
-            or abs(predicted_yield) > bound_limit
-        ):
+        out_of_range = (
+            (np.abs(confidence_lower) > bound_limit)
+            | (np.abs(confidence_upper) > bound_limit)
+            | (np.abs(predicted_yield) > bound_limit)
+        )
+        for i in np.flatnonzero(out_of_range):
             logger.warning(
                 "Clamping out-of-range prediction for model %s: "
                 "yield=%.3f, lower=%.3f, upper=%.3f (limit=±%.2f). "
                 "Likely a miscalibrated uncertainty head — check 'uncertainty_output' "
                 "interpretation in params.json/features.preprocessing.",
                 getattr(self._model_version, "version_tag", "?"),
-                predicted_yield,
-                confidence_lower,
-                confidence_upper,
+                predicted_yield[i],
+                confidence_lower[i],
+                confidence_upper[i],
                 bound_limit,
             )
-            predicted_yield = max(min(predicted_yield, bound_limit), -bound_limit)
-            confidence_lower = max(min(confidence_lower, bound_limit), -bound_limit)
-            confidence_upper = max(min(confidence_upper, bound_limit), -bound_limit)
+        if out_of_range.any():
+            predicted_yield = np.clip(predicted_yield, -bound_limit, bound_limit)
+            confidence_lower = np.clip(confidence_lower, -bound_limit, bound_limit)
+            confidence_upper = np.clip(confidence_upper, -bound_limit, bound_limit)
 
-        # 7. Prepare result
-        result = {
+        return {
             'predicted_yield': predicted_yield,
             'confidence_lower': confidence_lower,
             'confidence_upper': confidence_upper,
             'confidence_level': confidence_level,
+        }
+
+    def predict(
+        self,
+        input_data: Dict[str, Any],
+        model_version=None
+    ) -> Dict[str, Any]:
+        """
+        Make a prediction for a single field-season.
+
+        Args:
+            input_data: Dictionary with input features
+                Required keys: crop, acres, lat, long, season, totalN_per_ac, totalP_per_ac, totalK_per_ac
+                Optional: variety, state, county, water_applied_mm, event_count
+            model_version: ModelVersion object (optional, will use production if None)
+
+        Returns:
+            Dict with:
+                - predicted_yield: float
+                - confidence_lower: float
+                - confidence_upper: float
+                - features: Feature vector used (for explainability)
+        """
+        self._ensure_model(model_version)
+
+        # 1. Prepare input DataFrame (single row)
+        df_input = pd.DataFrame([input_data])
+        X = self._build_feature_frame(df_input)
+        outputs = self._predict_frame(df_input, X)
+        predicted_yield = float(outputs['predicted_yield'][0])
+
+        # 7. Prepare result
+        result = {
+            'predicted_yield': predicted_yield,
+            'confidence_lower': float(outputs['confidence_lower'][0]),
+            'confidence_upper': float(outputs['confidence_upper'][0]),
+            'confidence_level': outputs['confidence_level'],
             'features': X.iloc[0].to_dict(),
             'base_value': self._model.get('base_score', 0) if hasattr(self._model, 'get') else 0,
         }
@@ -415,6 +541,40 @@ class PredictionService:
 
         return result
 
+    def predict_batch(
+        self,
+        inputs: Union[pd.DataFrame, List[Dict[str, Any]]],
+        model_version=None,
+        with_features: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Make predictions for many field-seasons with a single model call.
+
+        Args:
+            inputs: DataFrame with one row per record and the same columns
+                predict() accepts as dict keys, or a list of predict()-style
+                dicts (which may each carry different keys).
+            model_version: ModelVersion object (optional, will use production if None)
+
+        Returns:
+            Dict with aligned arrays predicted_yield, confidence_lower and
+            confidence_upper (one entry per input row) plus confidence_level.
+            With with_features, also 'features' (one feature dict per row,
+            as predict() returns) and 'base_value'.
+        """
+        self._ensure_model(model_version)
+
+        if isinstance(inputs, pd.DataFrame):
+            df_input = inputs.reset_index(drop=True)
+        else:
+            df_input = self._records_frame(inputs)
+        X = self._build_feature_frame(df_input)
+        outputs = self._predict_frame(df_input, X)
+        if with_features:
+            outputs['features'] = X.to_dict('records')
+            outputs['base_value'] = self._model.get('base_score', 0) if hasattr(self._model, 'get') else 0
+        return outputs
+
     def batch_predict(
         self,
         inputs: list[Dict[str, Any]],
@@ -442,3 +602,70 @@ class PredictionService:
                 })
 
         return results
+
+
+# Process-wide predictors, one per loaded model version. Each is loaded once
+# and never switched to another version afterwards, so request threads can
+# share it without locking.
+_PREDICTORS: Dict[str, PredictionService] = {}
+_PREDICTORS_LOCK = threading.Lock()
+
+
+def get_predictor(model_version) -> PredictionService:
+    """
+    Shared PredictionService with ``model_version`` loaded. Only the most
+    recently requested version is kept, so a production switch frees the
+    old model.
+    """
+    tag = model_version.version_tag
+    predictor = _PREDICTORS.get(tag)
+    if predictor is not None:
+        return predictor
+    with _PREDICTORS_LOCK:
+        predictor = _PREDICTORS.get(tag)
+        if predictor is None:
+            db = SessionLocal()
+            try:
+                predictor = PredictionService(db)
+                predictor._ensure_model(model_version)
+            finally:
+                db.close()
+            _PREDICTORS.clear()
+            _PREDICTORS[tag] = predictor
+    return predictor
+
+
+@lru_cache(maxsize=1)
+def _production_model_version(_ttl_bucket: int):
+    db = SessionLocal()
+    try:
+        return crud.get_production_model_version(db)
+    finally:
+        db.close()
+
+
+def get_production_model_version():
+    """
+    The production ModelVersion row (detached), re-read at most every
+    model_cache_ttl_s seconds. Call clear_production_model_cache() after
+    switching production in this process.
+    """
+    return _production_model_version(int(time.monotonic() // settings.model_cache_ttl_s))
+
+
+def clear_production_model_cache() -> None:
+    _production_model_version.cache_clear()
+
+
+def warm_production_predictor() -> None:
+    """
+    Load the production model into this process's shared predictor so the
+    first request doesn't pay for it. Failures are logged; requests will
+    retry the load.
+    """
+    try:
+        model_version = get_production_model_version()
+        if model_version is not None:
+            get_predictor(model_version)
+    except Exception as e:
+        logger.warning(f"Could not preload the production model: {e}")
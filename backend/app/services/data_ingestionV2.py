@@ -64,6 +64,14 @@ class DataIngestionServiceV2:
         self._field_cache: Dict[int, models.Field] = {}
         self._field_season_cache: Dict[tuple[int, int, Optional[int], int], Optional[models.FieldSeason]] = {}
 
+    def _reset_caches(self) -> None:
+        # After a savepoint rollback the cached objects may no longer exist.
+        self._crop_cache.clear()
+        self._season_cache.clear()
+        self._variety_cache.clear()
+        self._field_cache.clear()
+        self._field_season_cache.clear()
+
     def compute_file_hash(self, filepath: str) -> str:
         sha256_hash = hashlib.sha256()
         with open(filepath, "rb") as file_obj:
@@ -132,7 +140,7 @@ class DataIngestionServiceV2:
 
         return resolved
 
-    def _value(self, row: pd.Series, resolved: Dict[str, Optional[str]], key: str) -> Any:
+    def _value(self, row: Dict[str, Any], resolved: Dict[str, Optional[str]], key: str) -> Any:
         column = resolved.get(key)
         if not column:
             return None
@@ -235,19 +243,13 @@ class DataIngestionServiceV2:
                 self.db.flush()
             self._field_cache[field_number] = field
 
-        updated = False
+        # Backfilled attributes go out with the chunk's flush.
         if acres is not None and field.acres is None:
             field.acres = acres
-            updated = True
         if state and not field.state:
             field.state = state
-            updated = True
         if county and not field.county:
             field.county = county
-            updated = True
-
-        if updated:
-            self.db.flush()
 
         return field
 
@@ -321,7 +323,7 @@ class DataIngestionServiceV2:
 
     def _process_row(
         self,
-        row: pd.Series,
+        row: Dict[str, Any],
         resolved: Dict[str, Optional[str]],
         source_filename: str,
     ) -> str:
@@ -366,8 +368,9 @@ class DataIngestionServiceV2:
                 data_quality_score=1.0,
                 missing_data_flags=missing_flags or None,
             )
+            # Left pending: new field-seasons are inserted together when the
+            # chunk is flushed.
             self.db.add(fs)
-            self.db.flush()
             self._field_season_cache[self._field_season_key(field.field_id, crop.crop_id, variety_id, season.season_id)] = fs
             return "inserted"
 
@@ -392,11 +395,32 @@ class DataIngestionServiceV2:
             updated = True
 
         if updated:
-            self.db.flush()
             return "updated"
 
         return "skipped"
 
+    def _process_chunk(
+        self,
+        rows: list[Dict[str, Any]],
+        resolved: Dict[str, Optional[str]],
+        source_filename: str,
+        first_row_number: int,
+        isolate_rows: bool,
+    ) -> Dict[str, int]:
+        counts = {"inserted": 0, "updated": 0, "skipped": 0}
+        for offset, row in enumerate(rows):
+            if not isolate_rows:
+                result = self._process_row(row=row, resolved=resolved, source_filename=source_filename)
+            else:
+                try:
+                    with self.db.begin_nested():
+                        result = self._process_row(row=row, resolved=resolved, source_filename=source_filename)
+                except Exception as row_error:  # pragma: no cover - defensive logging path
+                    logger.error("V2 ingestion failed on row %s: %s", first_row_number + offset, row_error)
+                    result = "skipped"
+            counts[result] += 1
+        return counts
+
     def ingest_csv(
         self,
         csv_path: str,
@@ -460,22 +484,33 @@ class DataIngestionServiceV2:
                 low_memory=False,
             ):
                 chunk.columns = chunk.columns.str.strip()
-
-                for _, row in chunk.iterrows():
-                    records_parsed += 1
-                    try:
-                        with self.db.begin_nested():
-                            result = self._process_row(row=row, resolved=resolved, source_filename=source_filename)
-                        if result == "inserted":
-                            records_inserted += 1
-                        elif result == "updated":
-                            records_updated += 1
-                        else:
-                            records_skipped += 1
-                    except Exception as row_error:  # pragma: no cover - defensive logging path
-                        logger.error("V2 ingestion failed on row %s: %s", records_parsed, row_error)
-                        records_skipped += 1
-
+                rows = chunk.to_dict("records")
+                first_row_number = records_parsed + 1
+                records_parsed += len(rows)
+
+                # Fast path: the whole chunk in one savepoint, so its inserts and
+                # updates go out in a single batched flush. If anything in it
+                # fails, redo the chunk with a savepoint per row so only the bad
+                # rows are skipped.
+                try:
+                    with self.db.begin_nested():
+                        counts = self._process_chunk(
+                            rows, resolved, source_filename, first_row_number, isolate_rows=False
+                        )
+                except Exception as chunk_error:
+                    logger.warning(
+                        "V2 ingestion chunk starting at row %s failed (%s); retrying row by row",
+                        first_row_number,
+                        chunk_error,
+                    )
+                    self._reset_caches()
+                    counts = self._process_chunk(
+                        rows, resolved, source_filename, first_row_number, isolate_rows=True
+                    )
+
+                records_inserted += counts["inserted"]
+                records_updated += counts["updated"]
+                records_skipped += counts["skipped"]
                 self.db.commit()
 
             update_ingestion_log(
@@ -0,0 +1,117 @@
+"""
+Batched writer for the prediction_logs table.
+
+Predict handlers enqueue one row each; a background thread flushes the
+queue with a single COPY every FLUSH_ROWS rows or FLUSH_SECONDS, so logging
+costs a request nothing beyond a queue put.
+"""
+import csv
+import io
+import json
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.database.session import engine
+
+logger = logging.getLogger(__name__)
+
+FLUSH_ROWS = 500
+FLUSH_SECONDS = 2.0
+QUEUE_SIZE = 10_000
+
+_COLUMNS = ("model_version_tag", "crop", "variety", "season", "predicted_yield", "request_payload")
+_COPY_SQL = f"COPY prediction_logs ({', '.join(_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+
+Row = Tuple[Any, ...]
+
+
+class PredictionLogWriter:
+    def __init__(self):
+        self._queue: "queue.Queue[Optional[Row]]" = queue.Queue(maxsize=QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="prediction-log-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def enqueue(self, row: Row) -> None:
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            # Logging is best-effort; never hold up a prediction for it.
+            logger.warning("Prediction log queue full; dropping a record")
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            rows: List[Row] = []
+            deadline = time.monotonic() + FLUSH_SECONDS
+            while len(rows) < FLUSH_ROWS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    row = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                rows.append(row)
+            if rows:
+                self._flush(rows)
+
+    def _flush(self, rows: List[Row]) -> None:
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for row in rows:
+            # Empty CSV fields load as NULL.
+            writer.writerow("" if value is None else value for value in row)
+        buf.seek(0)
+        raw = engine.raw_connection()
+        try:
+            with raw.cursor() as cursor:
+                cursor.copy_expert(_COPY_SQL, buf)
+            raw.commit()
+        except Exception as e:
+            raw.rollback()
+            logger.warning(f"Failed to write {len(rows)} prediction log rows: {e}")
+        finally:
+            raw.close()
+
+
+_WRITER = PredictionLogWriter()
+
+
+def start_prediction_log_writer() -> None:
+    _WRITER.start()
+
+
+def stop_prediction_log_writer() -> None:
+    """Flush what's queued and stop the writer thread."""
+    _WRITER.stop()
+
+
+def enqueue_prediction_log(
+    model_version_tag: str,
+    request_payload: Dict[str, Any],
+    predicted_yield: Optional[float],
+) -> None:
+    _WRITER.enqueue((
+        model_version_tag,
+        request_payload.get("crop"),
+        request_payload.get("variety"),
+        request_payload.get("season"),
+        predicted_yield,
+        json.dumps(request_payload),
+    ))
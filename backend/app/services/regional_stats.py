@@ -7,8 +7,12 @@ from __future__ import annotations
 from typing import Any, Dict, Optional
 from sqlalchemy.orm import Session
 
+from app.core.cache import REFERENCE_PREFIX, get_json_sync, set_json_sync
 from app.database import crud
 
+# Sentinel cached for "no stats", so misses don't requery either.
+_NO_STATS = {}
+
 
 class RegionalStatsService:
     """
@@ -30,7 +34,26 @@ class RegionalStatsService:
 
         When `county` is provided, returns that county's stats if available.
         Otherwise returns the top county by average observed yield in the state.
+
+        Cached with the reference data (REFERENCE_CACHE_STORE=redis), so the
+        entry is dropped whenever an ingestion clears that cache.
         """
+        key = f"{REFERENCE_PREFIX}:county_avg:{crop}:{season}:{state}:{county or ''}"
+        cached = get_json_sync(key)
+        if cached is not None:
+            return cached or None
+
+        result = self._county_avg(crop, season, state, county)
+        set_json_sync(key, result if result is not None else _NO_STATS)
+        return result
+
+    def _county_avg(
+        self,
+        crop: str,
+        season: int,
+        state: str,
+        county: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
         rows = crud.get_regional_yield_stats(
             db=self.db,
             crop=crop,
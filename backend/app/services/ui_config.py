@@ -13,6 +13,10 @@ from app.config import settings
 
 _UI_LOCK = Lock()
 
+# Parsed config shared by all readers, keyed on the file's mtime and size so
+# an edit from another worker (or by hand) is still picked up on next read.
+_UI_CACHE: Dict[str, Any] = {"stamp": None, "config": None, "forms": {}}
+
 
 def _default_ui_config() -> Dict[str, Any]:
     return {
@@ -87,27 +91,62 @@ def _normalize_custom_field(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     return normalized
 
 
-def load_ui_config() -> Dict[str, Any]:
-    path = settings.ui_config_path
+def _file_stamp(path: str) -> Optional[tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_ui_config(path: str) -> Dict[str, Any]:
     defaults = _default_ui_config()
 
+    _ensure_path(path)
+    if not os.path.exists(path):
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(defaults, fh, indent=2)
+        return defaults
+
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            saved = json.load(fh)
+        merged = _deep_merge(defaults, saved)
+        return merged
+    except Exception:
+        # Recover gracefully with defaults if file is corrupted.
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(defaults, fh, indent=2)
+        return defaults
+
+
+def _set_cache(path: str, config: Dict[str, Any]) -> None:
+    forms = {}
+    for form_key, form in config.items():
+        if isinstance(form, dict):
+            forms[form_key] = {
+                "dropdowns": form.get("dropdowns", {}),
+                "custom_fields": form.get("custom_fields", []),
+            }
+    _UI_CACHE.update(stamp=_file_stamp(path), config=config, forms=forms)
+
+
+def _cached_ui_config() -> Dict[str, Any]:
+    path = settings.ui_config_path
     with _UI_LOCK:
-        _ensure_path(path)
-        if not os.path.exists(path):
-            with open(path, "w", encoding="utf-8") as fh:
-                json.dump(defaults, fh, indent=2)
-            return defaults
-
-        try:
-            with open(path, "r", encoding="utf-8") as fh:
-                saved = json.load(fh)
-            merged = _deep_merge(defaults, saved)
-            return merged
-        except Exception:
-            # Recover gracefully with defaults if file is corrupted.
-            with open(path, "w", encoding="utf-8") as fh:
-                json.dump(defaults, fh, indent=2)
-            return defaults
+        stamp = _file_stamp(path)
+        if stamp is None or stamp != _UI_CACHE["stamp"]:
+            _set_cache(path, _read_ui_config(path))
+        return _UI_CACHE
+
+
+def get_ui_config() -> Dict[str, Any]:
+    """Shared, read-only view of the UI config. Use load_ui_config() to edit."""
+    return _cached_ui_config()["config"]
+
+
+def load_ui_config() -> Dict[str, Any]:
+    return copy.deepcopy(get_ui_config())
 
 
 def save_ui_config(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -116,16 +155,16 @@ def save_ui_config(config: Dict[str, Any]) -> Dict[str, Any]:
         _ensure_path(path)
         with open(path, "w", encoding="utf-8") as fh:
             json.dump(config, fh, indent=2)
+        _set_cache(path, copy.deepcopy(config))
     return config
 
 
 def get_form_config(form_key: str) -> Dict[str, Any]:
-    config = load_ui_config()
-    form = config.get(form_key) or {}
-    return {
-        "dropdowns": form.get("dropdowns", {}),
-        "custom_fields": form.get("custom_fields", []),
-    }
+    """Shared, read-only dropdowns/custom_fields for one form."""
+    form = _cached_ui_config()["forms"].get(form_key)
+    if form is None:
+        return {"dropdowns": {}, "custom_fields": []}
+    return form
 
 
 def add_dropdown_option(form_key: str, field_key: str, option: str) -> Dict[str, Any]:
@@ -0,0 +1,32 @@
+"""
+Celery worker for long-running admin jobs (model training, prediction backfill).
+
+Enabled with ADMIN_JOB_BACKEND=celery; start it from the backend directory with:
+
+    celery -A app.worker worker --loglevel=info
+"""
+from typing import Any, Dict
+
+from celery import Celery
+
+from app.config import settings
+
+celery_app = Celery("traitharvest", broker=settings.redis_url)
+celery_app.conf.update(
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+)
+
+
+@celery_app.task(name="admin.train_model")
+def train_model_task(job_id: str, payload: Dict[str, Any]) -> None:
+    from app.api.admin import _run_training_job
+
+    _run_training_job(job_id, payload)
+
+
+@celery_app.task(name="admin.backfill_predictions")
+def backfill_predictions_task(job_id: str, payload: Dict[str, Any]) -> None:
+    from app.api.admin import _run_backfill_job
+
+    _run_backfill_job(job_id, payload)
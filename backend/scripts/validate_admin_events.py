@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+Validate that admin dashboard events make it through the app's middleware.
+
+Why this exists
+---------------
+The admin dashboard refreshes itself off the /admin/api/events SSE stream.
+The app also runs GZipMiddleware, which buffers streamed bodies without
+flushing; an event stream that gets compressed never delivers a frame to
+the browser, so the dashboard silently falls back to its slow poll. This
+script opens the stream through the full ASGI app with a browser-style
+Accept-Encoding: gzip, publishes an event, and checks the frame arrives.
+
+Usage
+-----
+    docker compose -f docker-compose.local.yml exec backend \
+        python -m scripts.validate_admin_events
+
+No server, database or model is needed. With a Redis job store the event
+goes through Redis pub/sub, so Redis must be reachable.
+
+Exit codes
+----------
+0 = the event frame arrived, uncompressed, within --timeout seconds.
+1 = it didn't (compressed, buffered, or never published).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from typing import Any, Dict, List
+
+from app.api.admin import _publish_event
+from app.config import settings
+from app.main import app
+
+
+async def _check(timeout: float) -> int:
+    messages: asyncio.Queue = asyncio.Queue()
+    disconnected = asyncio.Event()
+
+    async def receive() -> Dict[str, Any]:
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        await messages.put(message)
+
+    headers: List[tuple] = [(b"accept-encoding", b"gzip, deflate, br")]
+    if settings.admin_api_key:
+        headers.append((b"x-admin-key", settings.admin_api_key.encode("utf-8")))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/admin/api/events",
+        "raw_path": b"/admin/api/events",
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 50000),
+    }
+    task = asyncio.create_task(app(scope, receive, send))
+
+    body = b""
+    published = False
+    content_encoding = None
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        while b"data: " not in body:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                message = await asyncio.wait_for(messages.get(), timeout=min(remaining, 0.5))
+            except asyncio.TimeoutError:
+                message = None
+            if message is not None:
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    if status != 200:
+                        print(f"FAIL: /admin/api/events answered {status}")
+                        return 1
+                    for key, value in message["headers"]:
+                        if key.lower() == b"content-encoding":
+                            content_encoding = value.decode("latin-1")
+                else:
+                    body += message.get("body", b"")
+            # Publish once the stream is open (its first frame has arrived).
+            if not published and body:
+                _publish_event("jobs")
+                published = True
+    finally:
+        disconnected.set()
+        task.cancel()
+        try:
+            await task
+        except BaseException:
+            pass
+
+    print(f"content-encoding: {content_encoding}")
+    print(f"body received: {body!r}")
+    if b'data: {"type":"jobs"}' in body:
+        print("OK: event frame delivered through the middleware stack")
+        return 0
+    print(f"FAIL: no event frame within {timeout:g}s")
+    return 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--timeout", type=float, default=5.0)
+    args = parser.parse_args()
+    return asyncio.run(_check(args.timeout))
+
+
+if __name__ == "__main__":
+    sys.exit(main())